@@ -1,10 +1,15 @@
 from pathlib import Path
 import tkinter as tk
-from tkinter import Canvas, Button, PhotoImage, messagebox, ttk, Frame, Label
+from tkinter import Canvas, Button, messagebox, ttk, Frame, Label
 import mysql.connector
 from datetime import datetime, date, timedelta
 from decimal import Decimal, ROUND_HALF_UP
-from utils import get_db_connection, round_rectangle
+from utils import db_connection, round_rectangle
+from image_cache import load_image
+from task_runner import run_in_background
+from change_feed import after_baseline, subscribe_changes
+from rollups import ensure_rollups
+from db_migrate import STATUS_PRIORITY, ensure_schema
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / "assets" / "frame4"
@@ -35,7 +40,7 @@ class AdminDashboardFrame(tk.Frame):
         self.canvas.create_rectangle(263, 20.0, 264.0, 518.0, fill="#000000", outline="")
 
         try:
-            self.logo_image = PhotoImage(file=relative_to_assets("image_1.png"))
+            self.logo_image = load_image(relative_to_assets("image_1.png"))
             self.canvas.create_image(150.0, 92.0, image=self.logo_image)
         except tk.TclError as e:
             print(f"ERROR loading logo in admin_dashboard: {e}")
@@ -185,12 +190,19 @@ class AdminDashboardFrame(tk.Frame):
         self.apply_button.place(x=774.0, y=48.0, width=86.0, height=25.0)
 
         self.load_dashboard_data()
+        subscribe_changes(controller, self, self.on_feed_change)
 
     # ---Loads Dashboard Data---
     def load_dashboard_data(self):
         self.date_filter_var.set("Today")
         self.apply_date_filter()
 
+    # ---Handles Change Feed---
+    # The stat boxes are aggregates, so a moved mark re-runs the dashboard queries for the current period.
+    def on_feed_change(self, topics, since):
+        if topics & {"print_jobs", "payments"}:
+            self.apply_date_filter()
+
     # ---Applies Date Filter---
     def apply_date_filter(self):
         filter_period = self.date_filter_var.get()
@@ -213,211 +225,216 @@ class AdminDashboardFrame(tk.Frame):
             start_date = today.replace(month=1, day=1)
             end_date = today.replace(month=12, day=31)
 
-        self.update_stat_boxes(start_date, end_date)
-        self.fetch_and_display_requests(start_date, end_date)
-        self.fetch_and_display_alerts()
-
-    # ---Updates Statistics---
-    def update_stat_boxes(self, start_date, end_date):
-        conn = None
-        cursor = None
-        try:
-            conn = get_db_connection()
-            if not conn:
-                messagebox.showerror("Database Error", "Could not connect to database for stats.", parent=self)
-                return
+        run_in_background(self.controller, self, "dashboard",
+                          after_baseline(self.controller, self.fetch_dashboard_data), start_date, end_date,
+                          on_done=self.display_dashboard_data, on_error=self.on_dashboard_error)
 
+    # ---Database: Fetches Dashboard Data (runs on a worker thread)---
+    def fetch_dashboard_data(self, start_date, end_date):
+        ensure_schema()
+        ensure_rollups()
+        data = {}
+        with db_connection() as conn:
             cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) FROM users")
-            total_users_result = cursor.fetchone()
-            total_users = total_users_result[0] if total_users_result else 0
-
-            query_jobs_static = """
-                SELECT
-                    SUM(CASE WHEN status = 'Pending' THEN 1 ELSE 0 END) as pending_total,
-                    SUM(CASE WHEN status IN ('Paid', 'Cash') THEN 1 ELSE 0 END) as paid_total
-                FROM print_jobs
-            """
-            cursor.execute(query_jobs_static)
-            job_stats_static = cursor.fetchone()
-            pending_count = int(job_stats_static[0] or 0)
-            in_progress_count = int(job_stats_static[1] or 0)
-
-            jobs_where_clause = ""
-            revenue_where_clause = ""
-            params_jobs = []
-            params_revenue = []
-
-            if start_date and end_date:
-                jobs_where_clause = " AND DATE(updated_at) BETWEEN %s AND %s"
-                revenue_where_clause = " WHERE DATE(payment_timestamp) BETWEEN %s AND %s"
-                params_jobs = [start_date, end_date, start_date, end_date]
-                params_revenue = [start_date, end_date]
-
-            query_jobs_date = f"""
-                SELECT
-                    SUM(CASE WHEN status = 'Completed' {jobs_where_clause} THEN 1 ELSE 0 END) as completed_filtered,
-                    SUM(CASE WHEN status = 'Declined' {jobs_where_clause} THEN 1 ELSE 0 END) as declined_filtered
-                FROM print_jobs
-            """
-            cursor.execute(query_jobs_date, tuple(params_jobs))
-            job_stats_date = cursor.fetchone()
-            completed_filtered = int(job_stats_date[0] or 0)
-            declined_filtered = int(job_stats_date[1] or 0)
-
-            query_revenue = f"""
-                SELECT COALESCE(SUM(payment_amount), 0)
-                FROM payments
-                {revenue_where_clause}
-            """
-            cursor.execute(query_revenue, tuple(params_revenue))
-            revenue_result = cursor.fetchone()
-            revenue_filtered = Decimal(revenue_result[0] or 0).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-            self.canvas.delete("pending_count")
-            self.canvas.delete("in_progress_count")
-            self.canvas.delete("completed_today_count")
-            self.canvas.delete("declined_today_count")
-            self.canvas.delete("revenue_today_count")
-            self.canvas.delete("users_count")
-
-            val_x1, val_y1 = 358, 122.5
-            val_x2, val_y2 = 521, 122.5
-            val_y3 = 176.5
-            val_y4 = 235.5
-
-            self.canvas.create_text(val_x1, val_y1, text=str(pending_count), fill="#000000",
-                                    font=("Inter Bold", 20), tags="pending_count", anchor="center")
-            self.canvas.create_text(val_x2, val_y1, text=str(in_progress_count), fill="#000000",
-                                    font=("Inter Bold", 20), tags="in_progress_count", anchor="center")
-            self.canvas.create_text(val_x1, val_y3, text=str(completed_filtered), fill="#000000",
-                                    font=("Inter Bold", 20), tags="completed_today_count", anchor="center")
-            self.canvas.create_text(val_x2, val_y3, text=str(declined_filtered), fill="#000000",
-                                    font=("Inter Bold", 20), tags="declined_today_count", anchor="center")
-            revenue_text = f"₱{revenue_filtered:,.2f}"
-            self.canvas.create_text(val_x1, val_y4, text=revenue_text, fill="#000000",
-                                    font=("Inter Bold", 18), tags="revenue_today_count", anchor="center")
-            self.canvas.create_text(val_x2, val_y4, text=str(total_users), fill="#000000",
-                                    font=("Inter Bold", 20), tags="users_count", anchor="center")
-
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Failed to fetch dashboard stats: {err}", parent=self)
-        except Exception as e:
-            print(f"Error in update_stat_boxes: {e}")
-            messagebox.showerror("Error", f"An unexpected error occurred fetching stats:\n{e}", parent=self)
-        finally:
-            if cursor:
+            try:
+                data["stats"] = self.fetch_stats(cursor, start_date, end_date)
+            finally:
                 cursor.close()
-            if conn and conn.is_connected():
-                conn.close()
 
-    # ---Fetches Print Requests---
-    def fetch_and_display_requests(self, start_date, end_date):
-        for widget in self.request_content_frame.winfo_children():
-            widget.destroy()
-
-        conn = None
-        cursor = None
-        try:
-            conn = get_db_connection()
-            if not conn:
-                return
             cursor = conn.cursor(dictionary=True)
+            try:
+                data["requests"] = self.fetch_requests(cursor, start_date, end_date)
+                try:
+                    data["alerts"] = self.fetch_alerts(cursor)
+                    data["alerts_error"] = None
+                except mysql.connector.Error as err:
+                    data["alerts"] = []
+                    data["alerts_error"] = err
+            finally:
+                cursor.close()
+        return data
 
-            params = []
-            where_clause = ""
-            if start_date and end_date:
-                where_clause = """
-                    WHERE (pj.status NOT IN ('Completed', 'Declined'))
-                    OR (pj.status IN ('Completed', 'Declined') AND DATE(pj.updated_at) BETWEEN %s AND %s)
-                """
-                params = [start_date, end_date]
+    # ---Displays Dashboard Data---
+    def display_dashboard_data(self, data):
+        self.update_stat_boxes(data["stats"])
+        self.display_requests(data["requests"])
+        self.display_alerts(data["alerts"], data["alerts_error"])
 
+    # ---Handles Fetch Error---
+    def on_dashboard_error(self, err):
+        if isinstance(err, mysql.connector.Error):
+            messagebox.showerror("Database Error", f"Failed to fetch dashboard stats: {err}", parent=self)
+        else:
+            print(f"Error loading dashboard: {err}")
+            messagebox.showerror("Error", f"An unexpected error occurred fetching stats:\n{err}", parent=self)
+        self.display_requests([])
+        self.display_alerts([], err)
+
+    # ---Database: Fetches Statistics---
+    def fetch_stats(self, cursor, start_date, end_date):
+        cursor.execute("SELECT COUNT(*) FROM users")
+        total_users_result = cursor.fetchone()
+        total_users = total_users_result[0] if total_users_result else 0
+
+        pending, paid, cash = STATUS_PRIORITY["Pending"], STATUS_PRIORITY["Paid"], STATUS_PRIORITY["Cash"]
+        query_jobs_static = """
+            SELECT
+                COALESCE(SUM(status_priority = %s), 0) as pending_total,
+                COALESCE(SUM(status_priority IN (%s, %s)), 0) as paid_total
+            FROM print_jobs
+            WHERE status_priority IN (%s, %s, %s)
+        """
+        cursor.execute(query_jobs_static, (pending, paid, cash, pending, paid, cash))
+        job_stats_static = cursor.fetchone()
+        pending_count = int(job_stats_static[0] or 0)
+        in_progress_count = int(job_stats_static[1] or 0)
+
+        where_clause = ""
+        params = ()
+        if start_date and end_date:
+            where_clause = "WHERE report_date BETWEEN %s AND %s"
+            params = (start_date, end_date)
+
+        query_rollup = f"""
+            SELECT COALESCE(SUM(completed_jobs), 0), COALESCE(SUM(declined_jobs), 0),
+                   COALESCE(SUM(total_revenue), 0)
+            FROM reports
+            {where_clause}
+        """
+        cursor.execute(query_rollup, params)
+        rollup = cursor.fetchone()
+        completed_filtered = int(rollup[0] or 0)
+        declined_filtered = int(rollup[1] or 0)
+        revenue_filtered = Decimal(rollup[2] or 0).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+        return {
+            "pending": pending_count,
+            "in_progress": in_progress_count,
+            "completed": completed_filtered,
+            "declined": declined_filtered,
+            "revenue": revenue_filtered,
+            "users": total_users,
+        }
+
+    # ---Updates Statistics---
+    def update_stat_boxes(self, stats):
+        self.canvas.delete("pending_count")
+        self.canvas.delete("in_progress_count")
+        self.canvas.delete("completed_today_count")
+        self.canvas.delete("declined_today_count")
+        self.canvas.delete("revenue_today_count")
+        self.canvas.delete("users_count")
+
+        val_x1, val_y1 = 358, 122.5
+        val_x2, val_y2 = 521, 122.5
+        val_y3 = 176.5
+        val_y4 = 235.5
+
+        self.canvas.create_text(val_x1, val_y1, text=str(stats["pending"]), fill="#000000",
+                                font=("Inter Bold", 20), tags="pending_count", anchor="center")
+        self.canvas.create_text(val_x2, val_y1, text=str(stats["in_progress"]), fill="#000000",
+                                font=("Inter Bold", 20), tags="in_progress_count", anchor="center")
+        self.canvas.create_text(val_x1, val_y3, text=str(stats["completed"]), fill="#000000",
+                                font=("Inter Bold", 20), tags="completed_today_count", anchor="center")
+        self.canvas.create_text(val_x2, val_y3, text=str(stats["declined"]), fill="#000000",
+                                font=("Inter Bold", 20), tags="declined_today_count", anchor="center")
+        revenue_text = f"₱{stats['revenue']:,.2f}"
+        self.canvas.create_text(val_x1, val_y4, text=revenue_text, fill="#000000",
+                                font=("Inter Bold", 18), tags="revenue_today_count", anchor="center")
+        self.canvas.create_text(val_x2, val_y4, text=str(stats["users"]), fill="#000000",
+                                font=("Inter Bold", 20), tags="users_count", anchor="center")
+
+    # ---Database: Fetches Print Requests---
+    # Open jobs and jobs finished in the range are two range scans of idx_jobs_queue joined by UNION ALL;
+    # updated_at holds 'YYYY-MM-DD HH:MM:SS' text, so a day range is a plain string range.
+    def fetch_requests(self, cursor, start_date, end_date):
+        columns = """
+            SELECT pj.job_id, u.username, f.file_name, pj.status, pj.payment_method,
+                   pj.status_priority, pj.updated_at, pj.created_at
+            FROM print_jobs pj LEFT JOIN users u ON pj.user_id = u.user_id
+                            LEFT JOIN files f ON pj.file_id = f.file_id
+        """
+        finished = (STATUS_PRIORITY["Completed"], STATUS_PRIORITY["Declined"])
+        params = []
+        if start_date and end_date:
             sql_query = f"""
-                SELECT pj.job_id, u.username, f.file_name, pj.status, pj.payment_method
-                FROM print_jobs pj LEFT JOIN users u ON pj.user_id = u.user_id
-                                LEFT JOIN files f ON pj.file_id = f.file_id
-                {where_clause}
-                ORDER BY
-                    CASE
-                        WHEN pj.status = 'Paid' THEN 1
-                        WHEN pj.status = 'Cash' THEN 2
-                        WHEN pj.status = 'Pending' THEN 3
-                        WHEN pj.status = 'Approved' THEN 4
-                        WHEN pj.status = 'In Progress' THEN 5
-                        WHEN pj.status = 'Declined' THEN 6
-                        WHEN pj.status = 'Completed' THEN 7
-                        ELSE 8
-                    END,
-                    pj.updated_at DESC, pj.created_at DESC
+                ({columns} WHERE pj.status_priority NOT IN (%s, %s))
+                UNION ALL
+                ({columns} WHERE pj.status_priority IN (%s, %s)
+                               AND pj.updated_at >= %s AND pj.updated_at < %s)
             """
-            cursor.execute(sql_query, tuple(params))
-            requests = cursor.fetchall()
-
-            self.request_content_frame.columnconfigure(0, minsize=74)
-            self.request_content_frame.columnconfigure(1, minsize=124)
-            self.request_content_frame.columnconfigure(2, minsize=85)
-            self.request_content_frame.columnconfigure(3, minsize=115)
-
-            color_map = {
-                "Approved": "#2E7D32", "Paid": "#388E3C", "Declined": "#D32F2F",
-                "Pending": "#F9A825", "Completed": "#1976D2", "In Progress": "#7B1FA2",
-                "Cash": "#388E3C"
-            }
-
-            if not requests:
-                no_req_label = Label(self.request_content_frame, text="No print requests found.",
-                                     font=("Inter Italic", 11), bg="white", fg="#888888")
-                no_req_label.grid(row=0, column=0, columnspan=4, pady=20, padx=10, sticky="ew")
-
-            for i, request in enumerate(requests):
-                job_id = request.get('job_id', 'N/A')
-                username = request.get('username', 'N/A')
-                # Retrieve file_name from the dictionary
-                file_name_full = request.get('file_name', 'N/A')
-                # Truncate file name for display if necessary
-                files_display = file_name_full[:15] + "..." if len(file_name_full) > 15 else file_name_full
-
-                status = str(request.get('status', 'N/A'))
-                status_color = color_map.get(status, "#333333")
-                bg_color = "#FFFFFF" if i % 2 == 0 else "#F8F9FA"
-
-                lbl_id = Label(self.request_content_frame, text=job_id, anchor="w", bg=bg_color, fg="#333333",
-                               font=("Inter", 11))
-                lbl_user = Label(self.request_content_frame, text=username, anchor="w", bg=bg_color, fg="#333333",
-                                 font=("Inter", 11))
-                # Use the truncated file name for display
-                lbl_files = Label(self.request_content_frame, text=files_display, anchor="w", bg=bg_color, fg="#333333",
-                                  font=("Inter", 11))
-                lbl_status = Label(self.request_content_frame, text=status, anchor="w", bg=bg_color, fg=status_color,
-                                   font=("Inter Bold", 11))
-
-                lbl_id.grid(row=i, column=0, sticky="ew", padx=(10, 0))
-                lbl_user.grid(row=i, column=1, sticky="ew")
-                lbl_files.grid(row=i, column=2, sticky="ew")
-                lbl_status.grid(row=i, column=3, sticky="ew")
-
-                for widget in (lbl_id, lbl_user, lbl_files, lbl_status):
-                    widget.bind("<Enter>", lambda e: self._bind_mousewheel(e, self.request_list_canvas))
-                    widget.bind("<Leave>", lambda e: self._unbind_mousewheel(e))
-
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Failed to fetch requests: {err}", parent=self)
-        except Exception as e:
-            print(f"Error in fetch_and_display_requests: {e}")
-            messagebox.showerror("Error", f"An unexpected error occurred fetching requests:\n{e}", parent=self)
-        finally:
-            if cursor:
-                cursor.close()
-            if conn and conn.is_connected():
-                conn.close()
+            params = [*finished, *finished, str(start_date), str(end_date + timedelta(days=1))]
+        else:
+            sql_query = columns
+
+        sql_query += " ORDER BY status_priority DESC, updated_at DESC, created_at DESC"
+        cursor.execute(sql_query, tuple(params))
+        return cursor.fetchall()
+
+    # ---Displays Print Requests---
+    def display_requests(self, requests):
+        for widget in self.request_content_frame.winfo_children():
+            widget.destroy()
+
+        self.request_content_frame.columnconfigure(0, minsize=74)
+        self.request_content_frame.columnconfigure(1, minsize=124)
+        self.request_content_frame.columnconfigure(2, minsize=85)
+        self.request_content_frame.columnconfigure(3, minsize=115)
+
+        color_map = {
+            "Approved": "#2E7D32", "Paid": "#388E3C", "Declined": "#D32F2F",
+            "Pending": "#F9A825", "Completed": "#1976D2", "In Progress": "#7B1FA2",
+            "Cash": "#388E3C"
+        }
+
+        if not requests:
+            no_req_label = Label(self.request_content_frame, text="No print requests found.",
+                                 font=("Inter Italic", 11), bg="white", fg="#888888")
+            no_req_label.grid(row=0, column=0, columnspan=4, pady=20, padx=10, sticky="ew")
+
+        for i, request in enumerate(requests):
+            job_id = request.get('job_id', 'N/A')
+            username = request.get('username', 'N/A')
+            # Retrieve file_name from the dictionary
+            file_name_full = request.get('file_name', 'N/A')
+            # Truncate file name for display if necessary
+            files_display = file_name_full[:15] + "..." if len(file_name_full) > 15 else file_name_full
+
+            status = str(request.get('status', 'N/A'))
+            status_color = color_map.get(status, "#333333")
+            bg_color = "#FFFFFF" if i % 2 == 0 else "#F8F9FA"
+
+            lbl_id = Label(self.request_content_frame, text=job_id, anchor="w", bg=bg_color, fg="#333333",
+                           font=("Inter", 11))
+            lbl_user = Label(self.request_content_frame, text=username, anchor="w", bg=bg_color, fg="#333333",
+                             font=("Inter", 11))
+            # Use the truncated file name for display
+            lbl_files = Label(self.request_content_frame, text=files_display, anchor="w", bg=bg_color, fg="#333333",
+                              font=("Inter", 11))
+            lbl_status = Label(self.request_content_frame, text=status, anchor="w", bg=bg_color, fg=status_color,
+                               font=("Inter Bold", 11))
+
+            lbl_id.grid(row=i, column=0, sticky="ew", padx=(10, 0))
+            lbl_user.grid(row=i, column=1, sticky="ew")
+            lbl_files.grid(row=i, column=2, sticky="ew")
+            lbl_status.grid(row=i, column=3, sticky="ew")
+
+            for widget in (lbl_id, lbl_user, lbl_files, lbl_status):
+                widget.bind("<Enter>", lambda e: self._bind_mousewheel(e, self.request_list_canvas))
+                widget.bind("<Leave>", lambda e: self._unbind_mousewheel(e))
 
         self.request_content_frame.update_idletasks()
         self.on_frame_configure(self.request_list_canvas)
 
-    # ---Fetches Inventory Alerts---
-    def fetch_and_display_alerts(self):
+    # ---Database: Fetches Inventory Alerts---
+    def fetch_alerts(self, cursor):
+        cursor.execute(
+            "SELECT product_name, quantity FROM products WHERE product_name LIKE %s ORDER BY product_name ASC",
+            ('%Bond Paper%',))
+        return cursor.fetchall()
+
+    # ---Displays Inventory Alerts---
+    def display_alerts(self, bond_paper_items, error=None):
         for widget in self.alert_content_frame.winfo_children():
             widget.destroy()
 
@@ -430,63 +447,35 @@ class AdminDashboardFrame(tk.Frame):
         lbl_printer.grid(row=row_index, column=0, sticky="ew", padx=10, pady=(5, 5))
         row_index += 1
 
-        conn = None
-        cursor = None
-        try:
-            conn = get_db_connection()
-            if not conn:
-                lbl_error = Label(self.alert_content_frame, text="DB Connection Failed.",
-                                  font=("Inter", 10), bg="white", fg="red", anchor="w")
-                lbl_error.grid(row=row_index, column=0, sticky="ew", padx=10, pady=5)
-                return
-
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(
-                "SELECT product_name, quantity FROM products WHERE product_name LIKE %s ORDER BY product_name ASC",
-                ('%Bond Paper%',))
-            bond_paper_items = cursor.fetchall()
-
-            if not bond_paper_items:
-                lbl_no_alerts = Label(self.alert_content_frame, text="No bond paper products found.",
-                                      font=("Inter", 10), bg="white", fg="#555555", anchor="w")
-                lbl_no_alerts.grid(row=row_index, column=0, sticky="ew", padx=10, pady=5)
-
-            if 'lbl_no_alerts' in locals():
-                lbl_no_alerts.bind("<Button-1>", lambda e: self.open_admin_inventory())
-                lbl_no_alerts.bind("<Enter>", lambda e: self.config(cursor="hand2"))
-                lbl_no_alerts.bind("<Leave>", lambda e: self.config(cursor=""))
-
-            for item in bond_paper_items:
-                name = item.get('product_name')
-                qty = item.get('quantity')
-
-                display_name = name[:18] + "..." if len(name) > 18 else name
-                alert_text = f"{display_name}: {qty}"
-                alert_color = "#000000"
-
-                lbl_alert = Label(self.alert_content_frame, text=alert_text,
-                                  font=("Inter Bold", 10), bg="white", fg=alert_color, anchor="w")
-                lbl_alert.grid(row=row_index, column=0, sticky="ew", padx=10, pady=2)
-                row_index += 1
-
-            all_labels_in_alert_frame = self.alert_content_frame.winfo_children()
-            for widget in all_labels_in_alert_frame:
-                widget.bind("<Enter>", lambda e, w=widget: (self._bind_mousewheel(e, self.alert_list_canvas),
-                                                            w.config(cursor="hand2")))
-                widget.bind("<Leave>", lambda e, w=widget: (self._unbind_mousewheel(e), w.config(cursor="")))
-                widget.bind("<Button-1>", lambda e: self.open_admin_inventory())
-
-        except mysql.connector.Error as err:
-            lbl_db_error = Label(self.alert_content_frame, text=f"DB Error: {err.errno}",
+        if error is not None:
+            error_text = f"DB Error: {error.errno}" if isinstance(error, mysql.connector.Error) else "DB Connection Failed."
+            lbl_db_error = Label(self.alert_content_frame, text=error_text,
                                  font=("Inter", 9), bg="white", fg="red", anchor="w")
             lbl_db_error.grid(row=row_index, column=0, sticky="ew", padx=10, pady=5)
-        except Exception as e:
-            print(f"Error fetching alerts: {e}")
-        finally:
-            if cursor:
-                cursor.close()
-            if conn and conn.is_connected():
-                conn.close()
+        elif not bond_paper_items:
+            lbl_no_alerts = Label(self.alert_content_frame, text="No bond paper products found.",
+                                  font=("Inter", 10), bg="white", fg="#555555", anchor="w")
+            lbl_no_alerts.grid(row=row_index, column=0, sticky="ew", padx=10, pady=5)
+
+        for item in bond_paper_items:
+            name = item.get('product_name')
+            qty = item.get('quantity')
+
+            display_name = name[:18] + "..." if len(name) > 18 else name
+            alert_text = f"{display_name}: {qty}"
+            alert_color = "#000000"
+
+            lbl_alert = Label(self.alert_content_frame, text=alert_text,
+                              font=("Inter Bold", 10), bg="white", fg=alert_color, anchor="w")
+            lbl_alert.grid(row=row_index, column=0, sticky="ew", padx=10, pady=2)
+            row_index += 1
+
+        all_labels_in_alert_frame = self.alert_content_frame.winfo_children()
+        for widget in all_labels_in_alert_frame:
+            widget.bind("<Enter>", lambda e, w=widget: (self._bind_mousewheel(e, self.alert_list_canvas),
+                                                        w.config(cursor="hand2")))
+            widget.bind("<Leave>", lambda e, w=widget: (self._unbind_mousewheel(e), w.config(cursor="")))
+            widget.bind("<Button-1>", lambda e: self.open_admin_inventory())
 
         self.alert_content_frame.update_idletasks()
         self.on_frame_configure(self.alert_list_canvas)
@@ -1,9 +1,11 @@
 from pathlib import Path
 import tkinter as tk
-from tkinter import Canvas, Entry, Text, Button, PhotoImage, ttk, messagebox, Frame, font
+from tkinter import Canvas, Entry, Text, Button, ttk, messagebox, Frame, font
 import mysql.connector
 from decimal import Decimal, InvalidOperation
-from utils import get_db_connection, round_rectangle
+from utils import get_db_connection, db_connection, round_rectangle
+from image_cache import load_image
+from task_runner import run_in_background
 
 
 OUTPUT_PATH = Path(__file__).parent
@@ -71,7 +73,7 @@ class AdminInventoryFrame(tk.Frame):
         self.canvas.create_rectangle(260.0, 174.0, 617.0, 470.0, fill="#FFFFFF", outline="#000000")
 
         try:
-            self.logo_image = PhotoImage(file=relative_to_assets("image_1.png"))
+            self.logo_image = load_image(relative_to_assets("image_1.png"))
             self.canvas.create_image(131.0, 69.0, image=self.logo_image)
         except tk.TclError:
             self.canvas.create_text(131.0, 89.0, text="Logo Missing", fill="#000000")
@@ -229,29 +231,37 @@ class AdminInventoryFrame(tk.Frame):
 
     #---Loads Products to Table---
     def load_products(self):
+        run_in_background(self.controller, self, "products", self.fetch_products,
+                          on_done=self.display_products, on_error=self.on_products_error)
+
+    #---Database: Fetches Products (runs on a worker thread)---
+    def fetch_products(self):
+        with db_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute("SELECT product_id, product_name, quantity, price FROM products ORDER BY product_id ASC")
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    #---Displays Products in Table---
+    def display_products(self, products):
         for item in self.tree.get_children():
             self.tree.delete(item)
-        conn = None
-        cursor = None
-        try:
-            conn = get_db_connection()
-            if not conn: return
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT product_id, product_name, quantity, price FROM products ORDER BY product_id ASC")
-            products = cursor.fetchall()
-            for product in products:
-                price_str = f"{product.get('price', 0.00):.2f}"
-                self.tree.insert('', 'end', values=(
-                    product.get('product_id'), product.get('product_name'),
-                    product.get('quantity'), price_str
-                ))
-        except mysql.connector.Error as err:
+        for product in products:
+            price_str = f"{product.get('price', 0.00):.2f}"
+            self.tree.insert('', 'end', values=(
+                product.get('product_id'), product.get('product_name'),
+                product.get('quantity'), price_str
+            ))
+
+    #---Handles Fetch Error---
+    def on_products_error(self, err):
+        self.display_products([])
+        if isinstance(err, mysql.connector.Error):
             messagebox.showerror("Database Error", f"Failed to load products:\n{err}", parent=self)
-        except Exception as e:
-            messagebox.showerror("Error", f"An unexpected error occurred:\n{e}", parent=self)
-        finally:
-            if cursor: cursor.close()
-            if conn and conn.is_connected(): conn.close()
+        else:
+            messagebox.showerror("Error", f"An unexpected error occurred:\n{err}", parent=self)
 
     #---Handles Table Row Selection---
     def on_row_select(self, event):
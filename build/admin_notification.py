@@ -1,9 +1,13 @@
 from pathlib import Path
 import tkinter as tk
-from tkinter import Canvas, Entry, Text, Button, PhotoImage, messagebox, ttk, Listbox
+from tkinter import Canvas, Entry, Text, Button, messagebox, ttk, Listbox
 import mysql.connector
 from datetime import datetime
-from utils import get_db_connection, round_rectangle
+from utils import get_db_connection, db_connection, round_rectangle
+from image_cache import load_image
+from task_runner import run_in_background
+import mail_queue
+from db_migrate import ensure_schema
 
 
 OUTPUT_PATH = Path(__file__).parent
@@ -49,7 +53,7 @@ class AdminNotificationFrame(tk.Frame):
         self.canvas.create_rectangle(50.0, 41.0, 253.0, window_height - 40, fill="#FFFFFF", outline="#000000")
 
         try:
-            self.logo_image = PhotoImage(file=relative_to_assets("image_1.png"))
+            self.logo_image = load_image(relative_to_assets("image_1.png"))
             self.canvas.create_image(151.0, 79.0, image=self.logo_image)
         except tk.TclError as e:
             print(f"ERROR loading logo in admin_notification: {e}")
@@ -82,6 +86,12 @@ class AdminNotificationFrame(tk.Frame):
         all_user_rb = ttk.Radiobutton(self, text="All Users", variable=self.send_to_var, value="all",
                                       command=self.toggle_user_entry, style="TRadiobutton")
         all_user_rb.place(x=489.0, y=117.0)
+        # Also queues an email copy for each recipient that has an address on file
+        self.email_copy_var = tk.BooleanVar(value=False)
+        style.configure("Notify.TCheckbutton", background="white", font=("Inter", 11))
+        email_copy_cb = ttk.Checkbutton(self, text="Email", variable=self.email_copy_var,
+                                        style="Notify.TCheckbutton")
+        email_copy_cb.place(x=578.0, y=117.0)
 
         self.canvas.create_text(300.0, 161.0, anchor="nw", text="User:", fill="#000000", font=("Inter Bold", 14))
         self.user_entry = Entry(self, bd=0, bg="#F0F0F0", highlightthickness=1, highlightcolor="#000000",
@@ -149,44 +159,38 @@ class AdminNotificationFrame(tk.Frame):
 
     #---Loads Notification Data---
     def load_notifications_admin(self):
-        self.fetch_users_for_autocomplete()
         self.toggle_user_entry()
         self.refresh_activity_feed()
 
     #---Clears Input Form---
     def clear_form(self):
         self.send_to_var.set(None)
+        self.email_copy_var.set(False)
         self.user_entry.delete(0, tk.END)
         self.subject_entry.delete("1.0", tk.END)
         self.message_text.delete("1.0", tk.END)
         self.toggle_user_entry()
 
-    #---Fetches User List---
-    def fetch_users_for_autocomplete(self):
-        conn = get_db_connection()
-        if not conn: return
-        cursor = None
-        try:
+    #---Fetches Users and History (runs on a worker thread)---
+    def fetch_notifications_data(self):
+        with db_connection() as conn:
             cursor = conn.cursor(dictionary=True)
-            query = "SELECT user_id, username FROM users WHERE status = 'active' ORDER BY username ASC"
-            cursor.execute(query)
-            self.all_users = cursor.fetchall()
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Error fetching users: {err}")
-            self.all_users = []
-        finally:
-            if cursor: cursor.close()
-            if conn and conn.is_connected(): conn.close()
+            try:
+                users = self.fetch_users_for_autocomplete(cursor)
+                history = self.fetch_notification_history(cursor, users)
+            finally:
+                cursor.close()
+        return users, history
+
+    #---Fetches User List---
+    def fetch_users_for_autocomplete(self, cursor):
+        query = "SELECT user_id, username FROM users WHERE status = 'active' ORDER BY username ASC"
+        cursor.execute(query)
+        return cursor.fetchall()
 
     #---Fetches Sent History---
-    def fetch_notification_history(self):
-        if not self.all_users:
-            self.fetch_users_for_autocomplete()
-        conn = get_db_connection()
-        if not conn: return []
-        cursor = None
+    def fetch_notification_history(self, cursor, users):
         try:
-            cursor = conn.cursor(dictionary=True)
             query = """
                 SELECT
                     notif_id, user_id, subject, message, created_at
@@ -201,7 +205,7 @@ class AdminNotificationFrame(tk.Frame):
                 enriched_notif = notification.copy()
                 user_id = notification.get('user_id')
                 if user_id:
-                    user = next((u for u in self.all_users if u['user_id'] == user_id), None)
+                    user = next((u for u in users if u['user_id'] == user_id), None)
                     enriched_notif['recipient'] = user['username'] if user else f"User ID:{user_id}"
                 else:
                     enriched_notif['recipient'] = "All Users"
@@ -210,9 +214,17 @@ class AdminNotificationFrame(tk.Frame):
         except mysql.connector.Error as err:
             print(f"Error fetching notification history: {err}")
             return []
-        finally:
-            if cursor: cursor.close()
-            if conn and conn.is_connected(): conn.close()
+
+    #---Stores Loaded Data---
+    def on_notifications_data_loaded(self, data):
+        self.all_users, notifications = data
+        self.update_activity_feed(notifications)
+
+    #---Handles Fetch Error---
+    def on_notifications_data_error(self, err):
+        messagebox.showerror("Database Error", f"Error fetching users: {err}")
+        self.all_users = []
+        self.update_activity_feed([])
 
     #---Database: Creates Table---
     def create_notifications_table(self):
@@ -307,10 +319,9 @@ class AdminNotificationFrame(tk.Frame):
             self.after(150, self.user_listbox.place_forget)
 
     #---Updates Activity Feed UI---
-    def update_activity_feed(self):
+    def update_activity_feed(self, notifications):
         for widget in self.feed_inner_frame.winfo_children():
             widget.destroy()
-        notifications = self.fetch_notification_history()
         if not notifications:
             tk.Label(self.feed_inner_frame, text="No notifications sent yet", font=("Inter", 10), bg="#FFFFFF",
                      fg="#666666", justify="center").pack(pady=20, padx=5)
@@ -363,7 +374,8 @@ class AdminNotificationFrame(tk.Frame):
 
     #---Refreshes Activity Feed---
     def refresh_activity_feed(self):
-        self.update_activity_feed()
+        run_in_background(self.controller, self, "activity_feed", self.fetch_notifications_data,
+                          on_done=self.on_notifications_data_loaded, on_error=self.on_notifications_data_error)
 
     #---Handles Sending Notification---
     def send_notification(self):
@@ -392,28 +404,45 @@ class AdminNotificationFrame(tk.Frame):
         if len(subject) > 255: messagebox.showerror("Input Error", "Subject is too long (max 255 characters)."); return
         if not message: messagebox.showerror("Input Error", "Please enter a message."); return
 
+        send_email = self.email_copy_var.get()
         conn = None
         cursor = None
         try:
+            if send_email:
+                # Before borrowing: email_queue is queued on the notification transaction's cursor
+                ensure_schema()
             conn = get_db_connection()
             if not conn: return
             cursor = conn.cursor()
             if send_to == "single":
                 sql = "INSERT INTO notifications (user_id, subject, message, status) VALUES (%s, %s, %s, 'Unread')"
                 cursor.execute(sql, (recipient_user_id, subject, message))
+                emailed = 0
+                if send_email:
+                    cursor.execute("SELECT email FROM users WHERE user_id = %s", (recipient_user_id,))
+                    emailed = self.queue_notification_emails(cursor, [row[0] for row in cursor.fetchall()],
+                                                             subject, message)
                 conn.commit()
-                messagebox.showinfo("Success", f"Notification sent to {recipient_name}!")
+                mail_queue.wake_worker()
+                note = " An email copy was queued." if emailed else ""
+                messagebox.showinfo("Success", f"Notification sent to {recipient_name}!{note}")
             elif send_to == "all":
-                cursor.execute("SELECT user_id FROM users WHERE status = 'active'")
-                user_ids = [row[0] for row in cursor.fetchall()]
-                if not user_ids:
+                cursor.execute("SELECT user_id, email FROM users WHERE status = 'active'")
+                recipients = cursor.fetchall()
+                if not recipients:
                     messagebox.showwarning("No Users", "There are no active users to send notifications to.");
                     return
                 sql = "INSERT INTO notifications (user_id, subject, message, status) VALUES (%s, %s, %s, 'Unread')"
-                data_to_insert = [(user_id, subject, message) for user_id in user_ids]
+                data_to_insert = [(user_id, subject, message) for user_id, _ in recipients]
                 cursor.executemany(sql, data_to_insert)
+                emailed = 0
+                if send_email:
+                    emailed = self.queue_notification_emails(cursor, [email for _, email in recipients],
+                                                             subject, message)
                 conn.commit()
-                messagebox.showinfo("Success", f"Notification sent to all {len(user_ids)} active users!")
+                mail_queue.wake_worker()
+                note = f" {emailed} email(s) queued." if send_email else ""
+                messagebox.showinfo("Success", f"Notification sent to all {len(recipients)} active users!{note}")
 
             self.clear_form()
             self.refresh_activity_feed()
@@ -425,6 +454,14 @@ class AdminNotificationFrame(tk.Frame):
             if cursor: cursor.close()
             if conn and conn.is_connected(): conn.close()
 
+    #---Queues Email Copies---
+    # Same transaction as the notifications rows; the mail worker sends them after OTP mail.
+    def queue_notification_emails(self, cursor, emails, subject, message):
+        html_body = mail_queue.render_notification_email(subject, message)
+        recipients = sorted({email.strip() for email in emails if email and email.strip()})
+        return mail_queue.enqueue_many([(email, subject, html_body) for email in recipients],
+                                       priority=mail_queue.PRIORITY_BULK, cursor=cursor)
+
     #---Handles Mouse Wheel---
     def _on_mousewheel(self, event, canvas):
         scroll_info = canvas.yview()
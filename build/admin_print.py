@@ -1,18 +1,45 @@
 from pathlib import Path
 import tkinter as tk
-from tkinter import Canvas, Entry, Text, Button, PhotoImage, messagebox, ttk, Frame, Label
+from tkinter import Canvas, Entry, Text, Button, messagebox, ttk
 import mysql.connector
 import os
-import shutil
 from tkinter import filedialog
 from decimal import Decimal, InvalidOperation
-from utils import get_db_connection, round_rectangle
-from datetime import datetime
+from utils import get_db_connection, db_connection, round_rectangle
+from image_cache import load_image
+from task_runner import run_in_background, run_write_in_background, cancel_background
+from virtual_list import VirtualList
+from change_feed import after_baseline, subscribe_changes
+from rollups import ensure_rollups, record_status_change
+from db_migrate import STATUS_PRIORITY, ensure_schema
+from file_store import export_file, resolve_stored_path
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / "assets" / "frame4"
 
 
+JOBS_PAGE_SIZE = 100
+
+STATUS_SHORT = {
+    "Pending": "P", "Approved": "A", "Completed": "C",
+    "Declined": "D", "In Progress": "IP", "Paid": "Paid",
+    "Cash": "Cash"
+}
+
+# Column widths match the header positions drawn on the canvas
+JOB_LIST_COLUMNS = [
+    {"minsize": 50, "padx": (13, 0)},  # ID
+    {"minsize": 100},  # Username
+    {"minsize": 120},  # File
+    {"minsize": 50},  # Pages
+    {"minsize": 50},  # Copies
+    {"minsize": 50},  # Size
+    {"minsize": 60},  # Color
+    {"minsize": 70},  # Status
+    {"minsize": 95},  # Submitted
+]
+
+
 # ---Asset Path Constructor---
 def relative_to_assets(path: str) -> Path:
     asset_file = ASSETS_PATH / Path(path)
@@ -28,9 +55,9 @@ class AdminPrintFrame(tk.Frame):
         self.controller = controller
         self.selected_job_ref = [None]
 
-        self.job_row_widgets = []
-        self.selected_job_row = None
-        self.selected_row_index = -1
+        self.job_filters = ("", "All")
+        self.jobs_has_more = False
+        self.jobs_loading_more = False
 
         self.canvas = Canvas(
             self, bg="#FFFFFF", height=570, width=1294,
@@ -41,7 +68,7 @@ class AdminPrintFrame(tk.Frame):
         self.canvas.create_rectangle(33.0, 31.0, 1063.0, 535.0, fill="#FFFFFF", outline="#000000")
         self.canvas.create_rectangle(41.0, 39.0, 244.0, 527.0, fill="#FFFFFF", outline="#000000")
         try:
-            self.image_image_1 = PhotoImage(file=relative_to_assets("image_1.png"))
+            self.image_image_1 = load_image(relative_to_assets("image_1.png"))
             self.canvas.create_image(143.0, 79.0, image=self.image_image_1)
         except tk.TclError:
             self.canvas.create_text(143.0, 79.0, text="Logo Missing", fill="#000000")
@@ -114,324 +141,208 @@ class AdminPrintFrame(tk.Frame):
         list_w = 863 - list_x
         list_h = 527 - list_y
 
-        scroll_container = tk.Frame(self, bg="white", bd=0)
-        scroll_container.place(x=list_x, y=list_y, width=list_w, height=list_h)
-
-        self.job_list_canvas = Canvas(scroll_container, bg="white", bd=0, highlightthickness=0, takefocus=1)
-        job_scrollbar = ttk.Scrollbar(scroll_container, orient="vertical", command=self.job_list_canvas.yview)
-        self.job_list_canvas.configure(yscrollcommand=job_scrollbar.set)
-
-        job_scrollbar.pack(side="right", fill="y")
-        self.job_list_canvas.pack(side="left", fill="both", expand=True)
-
-        self.job_content_frame = tk.Frame(self.job_list_canvas, bg="white")
-        self.job_content_frame_window = self.job_list_canvas.create_window(
-            (0, 0), window=self.job_content_frame, anchor="nw"
+        self.job_list = VirtualList(
+            self, columns=JOB_LIST_COLUMNS, render=self.render_job_row, key=lambda job: job.get("job_id"),
+            row_height=22, on_select=self.on_job_selected, on_load_more=self.load_more_print_jobs,
+            empty_text="No print jobs found."
         )
-
-        self.job_content_frame.bind("<Configure>", lambda event: self.on_frame_configure(self.job_list_canvas))
-        self.job_list_canvas.bind("<Configure>",
-                                  lambda e: self.job_list_canvas.itemconfig(self.job_content_frame_window,
-                                                                            width=e.width))
-        self.job_list_canvas.bind("<Enter>", lambda e: self._bind_mousewheel(e, self.job_list_canvas))
-        self.job_list_canvas.bind("<Leave>", lambda e: self._unbind_mousewheel(e))
-        self.job_content_frame.bind("<Enter>", lambda e: self._bind_mousewheel(e, self.job_list_canvas))
-        self.job_content_frame.bind("<Leave>", lambda e: self._unbind_mousewheel(e))
-
-        self.job_list_canvas.bind("<Up>", lambda e: self.navigate_jobs("up"))
-        self.job_list_canvas.bind("<Down>", lambda e: self.navigate_jobs("down"))
+        self.job_list.place(x=list_x, y=list_y, width=list_w, height=list_h)
 
         self.add_print_job_buttons()
         self.load_print_jobs()
+        subscribe_changes(controller, self, self.on_feed_change)
 
     # ---Loads Print Jobs---
     def load_print_jobs(self):
-        self.job_row_widgets.clear()
-        self.selected_job_row = None
-        self.selected_row_index = -1
-
-        self.display_print_jobs()
+        self.job_list.clear_selection()
         self.update_job_details(None)
         self.notes_text.delete("1.0", tk.END)
         self.selected_job_ref[0] = None
-
-    # ---Database: Fetches Jobs---
-    def fetch_print_jobs(self):
-        conn = None
-        cursor = None
-        try:
-            conn = get_db_connection()
-            if not conn:
-                return []
+        self.filter_print_jobs("", "All")
+
+    # ---Database: Fetches Jobs (runs on a worker thread)---
+    # Keyset pagination: `after` is the sort position of the last loaded job, so each page is a backward range
+    # scan of idx_jobs_queue instead of an OFFSET that re-reads every earlier row.
+    # `changed_since` takes change-feed marks and returns only jobs created, updated or paid after them.
+    # The username search is a prefix match so it can use the users.username index.
+    def fetch_print_jobs(self, username_filter="", status_filter="All", after=None, limit=JOBS_PAGE_SIZE,
+                         changed_since=None):
+        ensure_schema()
+        with db_connection() as conn:
             cursor = conn.cursor(dictionary=True)
-            query = """ SELECT pj.job_id, u.username, u.user_id, f.file_id, f.file_name, f.file_type,
-                                   pj.pages, pj.paper_size, pj.color_option, pj.copies, pj.payment_method,
-                                   pj.total_amount, pj.status, pj.notes, pj.created_at, pj.updated_at
-                                FROM print_jobs pj LEFT JOIN users u ON pj.user_id = u.user_id
-                                LEFT JOIN files f ON pj.file_id = f.file_id
-                                ORDER BY
-                                    CASE
-                                        WHEN pj.status = 'Paid' THEN 1
-                                        WHEN pj.status = 'Cash' THEN 2
-                                        WHEN pj.status = 'Pending' THEN 3
-                                        WHEN pj.status = 'Approved' THEN 4
-                                        WHEN pj.status = 'In Progress' THEN 5
-                                        WHEN pj.status = 'Declined' THEN 6
-                                        WHEN pj.status = 'Completed' THEN 7
-                                        ELSE 8
-                                    END,
-                                    pj.updated_at DESC, pj.created_at DESC """
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            return rows if rows else []
-        except mysql.connector.Error as err:
-            print(f"DB Error: {err}")
-            return []
-        except Exception as e:
-            print(f"Error: {e}")
-            return []
-        finally:
-            if cursor:
+            try:
+                query = """ SELECT pj.job_id, u.username, u.user_id, f.file_id, f.file_name, f.file_type,
+                               pj.pages, pj.paper_size, pj.color_option, pj.copies, pj.payment_method,
+                               pj.total_amount, pj.status, pj.notes, pj.created_at, pj.updated_at,
+                               pj.status_priority
+                            FROM print_jobs pj
+                            LEFT JOIN users u ON pj.user_id = u.user_id
+                            LEFT JOIN files f ON pj.file_id = f.file_id
+                            WHERE 1=1 """
+                params = []
+                if username_filter:
+                    query += " AND pj.user_id IN (SELECT user_id FROM users WHERE username LIKE %s)"
+                    escaped = username_filter.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                    params.append(f"{escaped}%")
+                if status_filter and status_filter != "All":
+                    query += " AND pj.status_priority = %s"
+                    params.append(STATUS_PRIORITY.get(status_filter, 0))
+                if after:
+                    priority, updated_at, created_at, job_id = after
+                    query += """ AND pj.status_priority <= %s
+                                 AND (pj.status_priority < %s
+                                     OR (pj.status_priority = %s AND (pj.updated_at < %s
+                                         OR (pj.updated_at = %s AND (pj.created_at < %s
+                                             OR (pj.created_at = %s AND pj.job_id < %s)))))) """
+                    params.extend([priority, priority, priority, updated_at, updated_at, created_at, created_at,
+                                   job_id])
+                if changed_since:
+                    query += """ AND (pj.job_id > %s OR pj.updated_at > %s
+                                     OR pj.job_id IN (SELECT job_id FROM payments WHERE payment_id > %s)) """
+                    params.extend([changed_since["job_id"], changed_since["job_updated_at"],
+                                   changed_since["payment_id"]])
+                query += """ ORDER BY pj.status_priority DESC, pj.updated_at DESC, pj.created_at DESC,
+                                      pj.job_id DESC """
+                if limit:
+                    query += " LIMIT %s "
+                    params.append(limit)
+                cursor.execute(query, tuple(params))
+                return cursor.fetchall() or []
+            finally:
                 cursor.close()
-            if conn and conn.is_connected():
-                conn.close()
-
-    # ---Displays Jobs in List---
-    def display_print_jobs(self, jobs_to_display=None):
-        for widget in self.job_content_frame.winfo_children():
-            widget.destroy()
-
-        self.job_row_widgets.clear()
-        self.selected_job_row = None
-        self.selected_row_index = -1
-
-        jobs = jobs_to_display if jobs_to_display is not None else self.fetch_print_jobs()
-
-        status_map = {
-            "Pending": "P", "Approved": "A", "Completed": "C",
-            "Declined": "D", "In Progress": "IP", "Paid": "Paid",
-            "Cash": "Cash"
-        }
-
-        # --- UPDATED COLUMN CONFIGURATION ---
-        self.job_content_frame.columnconfigure(0, minsize=50)  # ID
-        self.job_content_frame.columnconfigure(1, minsize=100)  # Username
-        self.job_content_frame.columnconfigure(2, minsize=120)  # File
-        self.job_content_frame.columnconfigure(3, minsize=50)  # Pages
-        self.job_content_frame.columnconfigure(4, minsize=50)  # Copies <--- NEW
-        self.job_content_frame.columnconfigure(5, minsize=50)  # Size
-        self.job_content_frame.columnconfigure(6, minsize=60)  # Color
-        self.job_content_frame.columnconfigure(7, minsize=70)  # Status
-        self.job_content_frame.columnconfigure(8, minsize=95)  # Submitted
-
-        if not jobs:
-            no_req_label = Label(self.job_content_frame, text="No print jobs found.",
-                                 font=("Inter Italic", 11), bg="white", fg="#888888")
-            no_req_label.grid(row=0, column=0, columnspan=9, pady=20, padx=10, sticky="ew")  # Changed columnspan to 9
-
-        for index, job in enumerate(jobs):
-            job_id_val = job.get("job_id", "N/A")
-            username_full = job.get("username", "-")
-            username_val = username_full[:12] + "..." if len(username_full) > 12 else username_full
-            file_id_val = job.get("file_id", "-")
-            pages_val = job.get("pages", "-")
-            copies_val = job.get("copies", "-")  # <--- FETCH COPIES
-            size_val = job.get("paper_size", "-")
-            color_option_val = job.get("color_option", "-")
-
-            if color_option_val == "Black & White":
-                color_val = "B&W"
-            elif color_option_val == "Color":
-                color_val = "C"
-            elif color_option_val == "Partially Colored":
-                color_val = "PC"
-            else:
-                color_val = color_option_val
-
-            status_text_val = job.get("status", "-")
-            status_val = status_map.get(status_text_val, status_text_val)
-            file_name_full = job.get("file_name", f"File {file_id_val}")
-            file_name_val = file_name_full[:15] + "..." if len(file_name_full) > 15 else file_name_full
-            submitted_dt = job.get("created_at")
-            submitted_val = submitted_dt.strftime("%m/%d %H:%M") if submitted_dt else "-"
-
-            bg_color = "#FFFFFF" if index % 2 == 0 else "#F8F9FA"
-
-            row_frame = Frame(self.job_content_frame, bg=bg_color)
-            row_frame.grid(row=index, column=0, columnspan=9, sticky="ew", pady=(1, 0))  # Changed columnspan to 9
-
-            row_frame.columnconfigure(0, minsize=50)
-            row_frame.columnconfigure(1, minsize=100)
-            row_frame.columnconfigure(2, minsize=120)
-            row_frame.columnconfigure(3, minsize=50)
-            row_frame.columnconfigure(4, minsize=50)
-            row_frame.columnconfigure(5, minsize=50)
-            row_frame.columnconfigure(6, minsize=60)
-            row_frame.columnconfigure(7, minsize=70)
-            row_frame.columnconfigure(8, minsize=95)
-
-            # --- UPDATED LABELS DATA ---
-            labels_data = [
-                (f"#{job_id_val}", "w", 13), (username_val, "w", 0), (file_name_val, "w", 0),
-                (pages_val, "w", 0), (copies_val, "w", 0), (size_val, "w", 0),  # <--- ADDED COPIES
-                (color_val, "w", 0), (status_val, "w", 0), (submitted_val, "w", 0)
-            ]
-
-            widget_list_for_binding = [row_frame]
-
-            for col, (text, anchor, padx_left) in enumerate(labels_data):
-                lbl = Label(row_frame, text=text, font=("Inter", 10), bg=bg_color, fg="#333333", anchor=anchor)
-                lbl.grid(row=0, column=col, sticky="nsew", padx=(padx_left, 0))
-                widget_list_for_binding.append(lbl)
-
-            for widget in widget_list_for_binding:
-                widget.bind("<Enter>", lambda e, rf=row_frame, idx=index: self.on_row_enter(e, rf, idx))
-                widget.bind("<Leave>", lambda e, rf=row_frame, idx=index: self.on_row_leave(e, rf, idx))
-                widget.bind("<Button-1>", lambda e, rf=row_frame, idx=index, j=job: self.on_row_click(e, rf, idx, j))
-                widget.bind("<Enter>", lambda e: self._bind_mousewheel(e, self.job_list_canvas), add="+")
-                widget.bind("<Leave>", lambda e: self._unbind_mousewheel(e), add="+")
-                widget.bind("<Button-1>", lambda e: self.job_list_canvas.focus_set(), add="+")
-
-            self.job_row_widgets.append(row_frame)
-
-        self.job_content_frame.update_idletasks()
-        self.on_frame_configure(self.job_list_canvas)
-        self.job_list_canvas.yview_moveto(0)
-
-    # ---Sets Row Color---
-    def set_row_color(self, row_frame, index, state):
-        if not row_frame or not row_frame.winfo_exists():
-            return
 
-        if state == "selected":
-            color = "#CCE5FF"
-        elif state == "hover":
-            color = "#E0F0FF"
+    # ---Sort Position of a Job---
+    # The list is ordered by this tuple, descending.
+    @staticmethod
+    def job_sort_position(job):
+        return (job.get("status_priority") or 0, job.get("updated_at") or "", job.get("created_at"),
+                job.get("job_id"))
+
+    # ---Checks Job Ordering---
+    def job_sorts_before(self, job, other):
+        return self.job_sort_position(job) > self.job_sort_position(other)
+
+    # ---Formats Row Cells---
+    def render_job_row(self, job):
+        username_full = job.get("username") or "-"
+        username_val = username_full[:12] + "..." if len(username_full) > 12 else username_full
+        file_id_val = job.get("file_id", "-")
+        color_option_val = job.get("color_option", "-")
+
+        if color_option_val == "Black & White":
+            color_val = "B&W"
+        elif color_option_val == "Color":
+            color_val = "C"
+        elif color_option_val == "Partially Colored":
+            color_val = "PC"
         else:
-            color = "#FFFFFF" if index % 2 == 0 else "#F8F9FA"
-
-        row_frame.config(bg=color)
-        for widget in row_frame.winfo_children():
-            widget.config(bg=color)
-
-    # ---Handles Row Click---
-    def on_row_click(self, event, row_frame, index, job_data):
-        if self.selected_job_row and self.selected_job_row.winfo_exists():
-            self.set_row_color(self.selected_job_row, self.selected_row_index, "default")
-
-        self.set_row_color(row_frame, index, "selected")
-        self.selected_job_row = row_frame
-        self.selected_row_index = index
-
-        self.selected_job_ref[0] = job_data
-        self.update_job_details(job_data)
+            color_val = color_option_val
+
+        status_text_val = job.get("status", "-")
+        file_name_full = job.get("file_name") or f"File {file_id_val}"
+        file_name_val = file_name_full[:15] + "..." if len(file_name_full) > 15 else file_name_full
+        submitted_dt = job.get("created_at")
+
+        return [
+            f"#{job.get('job_id', 'N/A')}", username_val, file_name_val,
+            job.get("pages", "-"), job.get("copies", "-"), job.get("paper_size", "-"),
+            color_val, STATUS_SHORT.get(status_text_val, status_text_val),
+            submitted_dt.strftime("%m/%d %H:%M") if submitted_dt else "-"
+        ]
 
-        self.job_list_canvas.yview_moveto(row_frame.winfo_y() / self.job_content_frame.winfo_height())
+    # ---Handles Row Selection---
+    def on_job_selected(self, job, index):
+        self.selected_job_ref[0] = job
+        self.update_job_details(job)
 
-    # ---Handles Row Hover---
-    def on_row_enter(self, event, row_frame, index):
-        if row_frame != self.selected_job_row:
-            self.set_row_color(row_frame, index, "hover")
-        self.config(cursor="hand2")
-
-    # ---Handles Row Leave---
-    def on_row_leave(self, event, row_frame, index):
-        if row_frame != self.selected_job_row:
-            self.set_row_color(row_frame, index, "default")
-        self.config(cursor="")
+    # ---Database: Filters Jobs---
+    def filter_print_jobs(self, username_filter, status_filter):
+        self.job_filters = (username_filter, status_filter)
+        self.jobs_loading_more = False
+        cancel_background(self.controller, self, "print_jobs_page")
+        run_in_background(self.controller, self, "print_jobs", after_baseline(self.controller, self.fetch_print_jobs),
+                          username_filter, status_filter,
+                          on_done=self.on_print_jobs_loaded, on_error=self.on_print_jobs_error)
+
+    # ---Applies Fetched Jobs---
+    def on_print_jobs_loaded(self, rows):
+        self.jobs_has_more = len(rows) >= JOBS_PAGE_SIZE
+        self.job_list.clear_selection()
+        self.job_list.set_items(rows, reset_scroll=True)
+        self.update_job_details(None)
+        self.selected_job_ref[0] = None
 
-    # ---Handles Key Navigation---
-    def navigate_jobs(self, direction):
-        if not self.job_row_widgets:
+    # ---Loads Next Page---
+    def load_more_print_jobs(self):
+        if not self.jobs_has_more or self.jobs_loading_more or not self.job_list.items:
             return
-
-        if self.selected_row_index == -1:
-            new_index = 0
-        elif direction == "down":
-            new_index = min(self.selected_row_index + 1, len(self.job_row_widgets) - 1)
-        elif direction == "up":
-            new_index = max(self.selected_row_index - 1, 0)
+        self.jobs_loading_more = True
+        username_filter, status_filter = self.job_filters
+        after = self.job_sort_position(self.job_list.items[-1])
+        run_in_background(self.controller, self, "print_jobs_page", self.fetch_print_jobs, username_filter,
+                          status_filter, after=after,
+                          on_done=self.on_more_print_jobs_loaded, on_error=self.on_print_jobs_error)
+
+    # ---Appends Fetched Page---
+    def on_more_print_jobs_loaded(self, rows):
+        self.jobs_loading_more = False
+        self.jobs_has_more = len(rows) >= JOBS_PAGE_SIZE
+        self.job_list.append_items(rows)
+
+    # ---Handles Fetch Error---
+    def on_print_jobs_error(self, err):
+        print(f"DB Error: {err}")
+        self.jobs_loading_more = False
+        self.jobs_has_more = False
+        if isinstance(err, mysql.connector.Error):
+            messagebox.showerror("DB Error", f"Error filtering: {err}", parent=self)
         else:
-            return
+            messagebox.showerror("Error", f"Error filtering: {err}", parent=self)
 
-        if new_index == self.selected_row_index and self.selected_row_index != -1:
+    # ---Handles Change Feed---
+    def on_feed_change(self, topics, since):
+        if not topics & {"print_jobs", "payments"}:
             return
-
-        row_to_select = self.job_row_widgets[new_index]
-
-        jobs = []
-        username_filter = self.search_entry.get().strip()
-        status_filter = self.status_var.get().strip()
-
-        if not username_filter and status_filter == "All":
-            jobs = self.fetch_print_jobs()
-        else:
-            jobs = self.filter_print_jobs(username_filter, status_filter, return_jobs=True)
-
-        if not jobs or new_index >= len(jobs):
+        run_in_background(self.controller, self, "print_jobs_delta", self.fetch_print_jobs,
+                          changed_since=since, limit=None,
+                          on_done=self.on_print_jobs_changed,
+                          on_error=lambda err: print(f"Error fetching changed print jobs: {err}"))
+
+    # ---Applies Changed Jobs---
+    def on_print_jobs_changed(self, rows):
+        selected = self.selected_job_ref[0]
+        for job in rows:
+            if selected and selected.get("job_id") == job.get("job_id"):
+                self.selected_job_ref[0] = job
+                if selected.get("status") != job.get("status"):
+                    self.update_job_details(job)
+            self.apply_job_change(job)
+
+    # ---Applies a Changed Job to the List---
+    # Moves the one row to its new sorted position instead of reloading the whole list.
+    def apply_job_change(self, job):
+        username_filter, status_filter = self.job_filters
+        job["status_priority"] = STATUS_PRIORITY.get(job.get("status"), 0)
+        job_id = job.get("job_id")
+
+        matches = ((status_filter == "All" or job.get("status") == status_filter) and
+                   (not username_filter or (job.get("username") or "").lower().startswith(username_filter.lower())))
+        if not matches:
+            self.job_list.remove(job_id)
+            if self.selected_job_ref[0] is not None and self.selected_job_ref[0].get("job_id") == job_id:
+                self.selected_job_ref[0] = None
+                self.update_job_details(None)
             return
 
-        job_data = jobs[new_index]
-
-        self.on_row_click(None, row_to_select, new_index, job_data)
-
-    # ---Database: Filters Jobs---
-    def filter_print_jobs(self, username_filter, status_filter, return_jobs=False):
-        conn = None
-        cursor = None
-        try:
-            conn = get_db_connection()
-            if not conn:
-                return [] if return_jobs else None
-            cursor = conn.cursor(dictionary=True)
-            query = """ SELECT pj.job_id, u.username, u.user_id, f.file_id, f.file_name, f.file_type, 
-                           pj.pages, pj.paper_size, pj.color_option, pj.copies, pj.payment_method, 
-                           pj.total_amount, pj.status, pj.notes, pj.created_at, pj.updated_at 
-                        FROM print_jobs pj 
-                        LEFT JOIN users u ON pj.user_id = u.user_id 
-                        LEFT JOIN files f ON pj.file_id = f.file_id 
-                        WHERE 1=1 """
-            params = []
-            if username_filter:
-                query += " AND u.username LIKE %s"
-                params.append(f"%{username_filter}%")
-            if status_filter and status_filter != "All":
-                query += " AND pj.status = %s"
-                params.append(status_filter)
-            query += """ ORDER BY
-                            CASE
-                                WHEN pj.status = 'Paid' THEN 1
-                                WHEN pj.status = 'Cash' THEN 2
-                                WHEN pj.status = 'Pending' THEN 3
-                                WHEN pj.status = 'Approved' THEN 4
-                                WHEN pj.status = 'In Progress' THEN 5
-                                WHEN pj.status = 'Declined' THEN 6
-                                WHEN pj.status = 'Completed' THEN 7
-                                ELSE 8
-                            END,
-                            pj.updated_at DESC, pj.created_at DESC """
-
-            cursor.execute(query, tuple(params))
-            rows = cursor.fetchall()
-
-            if return_jobs:
-                return rows if rows else []
-
-            self.display_print_jobs(jobs_to_display=rows)
-            self.update_job_details(None)
-            self.selected_job_ref[0] = None
-
-        except mysql.connector.Error as err:
-            messagebox.showerror("DB Error", f"Error filtering: {err}", parent=self)
-        except Exception as e:
-            messagebox.showerror("Error", f"Error filtering: {e}", parent=self)
-        finally:
-            if cursor:
-                cursor.close()
-            if conn and conn.is_connected():
-                conn.close()
-
-        return [] if return_jobs else None
+        others = [item for item in self.job_list.items if item.get("job_id") != job_id]
+        index = next((i for i, item in enumerate(others) if self.job_sorts_before(job, item)), None)
+        if index is None:
+            if self.jobs_has_more:
+                # Belongs past the loaded pages; it shows up again when that page is fetched
+                self.job_list.remove(job_id)
+                return
+            index = len(others)
+        self.job_list.upsert(job, index)
 
     # ---Updates Details Panel---
     def update_job_details(self, job):
@@ -574,6 +485,7 @@ class AdminPrintFrame(tk.Frame):
             success = False
 
             try:
+                ensure_rollups()
                 conn = get_db_connection()
                 if not conn:
                     messagebox.showerror("DB Error", "Connection failed.", parent=self)
@@ -628,18 +540,25 @@ class AdminPrintFrame(tk.Frame):
                         messagebox.showerror("Database Error", f"Failed to update inventory:\n{db_err}", parent=self)
                         return False
 
+                if new_status == "Declined" and not note_content:
+                    messagebox.showwarning("Note Required", "Reason needed.", parent=self)
+                    conn.rollback()
+                    return False
+
+                changed_at = record_status_change(cursor, job.get("job_id"), new_status)
+                if not changed_at:
+                    conn.rollback()
+                    messagebox.showerror("Not Found", "This request no longer exists.", parent=self)
+                    return False
+
                 if new_status == "Declined":
-                    if not note_content:
-                        messagebox.showwarning("Note Required", "Reason needed.", parent=self)
-                        conn.rollback()
-                        return False
                     cursor.execute(
-                        "UPDATE print_jobs SET status = %s, notes = %s, updated_at = NOW() WHERE job_id = %s",
-                        (new_status, note_content, job.get("job_id")))
+                        "UPDATE print_jobs SET status = %s, notes = %s, updated_at = %s WHERE job_id = %s",
+                        (new_status, note_content, changed_at, job.get("job_id")))
                 else:
                     cursor.execute(
-                        "UPDATE print_jobs SET status = %s, notes = NULL, updated_at = NOW() WHERE job_id = %s",
-                        (new_status, job.get("job_id")))
+                        "UPDATE print_jobs SET status = %s, notes = NULL, updated_at = %s WHERE job_id = %s",
+                        (new_status, changed_at, job.get("job_id")))
                     note_content = None
 
                 conn.commit()
@@ -680,10 +599,10 @@ class AdminPrintFrame(tk.Frame):
 
                 job["status"] = new_status
                 job["notes"] = note_content
-                job["updated_at"] = datetime.now()
+                job["updated_at"] = changed_at
 
                 self.update_job_details(job)
-                self.on_filter_click()
+                self.apply_job_change(job)
 
                 if new_status == "Completed":
                     messagebox.showinfo("Success", "Printing successful. Inventory updated.", parent=self)
@@ -814,7 +733,7 @@ class AdminPrintFrame(tk.Frame):
                 if not file_name or not file_path:
                     messagebox.showerror("Error", "Record incomplete.")
                     return
-                if not os.path.exists(file_path):
+                if not resolve_stored_path(file_path).exists():
                     messagebox.showerror("Error", f"File not found:\n{file_path}")
                     return
 
@@ -823,8 +742,10 @@ class AdminPrintFrame(tk.Frame):
                                                          filetypes=[("All Files", "*.*")])
 
                 if save_path:
-                    shutil.copy2(file_path, save_path)
-                    messagebox.showinfo("Download Complete", f"Saved to:\n{save_path}")
+                    run_write_in_background(self.controller, "download_file", export_file, file_path, save_path,
+                                            on_done=lambda size: messagebox.showinfo("Download Complete",
+                                                                                     f"Saved to:\n{save_path}"),
+                                            on_error=lambda err: messagebox.showerror("File Error", f"Error: {err}"))
             except mysql.connector.Error as err:
                 messagebox.showerror("DB Error", f"Error: {err}")
             except IOError as e:
@@ -937,32 +858,3 @@ class AdminPrintFrame(tk.Frame):
         self.canvas.tag_bind(button_tag, "<Button-1>", on_click)
         self.canvas.tag_bind(button_tag, "<Enter>", on_hover)
         self.canvas.tag_bind(button_tag, "<Leave>", on_leave)
-
-    # ---Updates Scrollable Area---
-    def on_frame_configure(self, canvas):
-        canvas.configure(scrollregion=canvas.bbox("all"))
-
-    # ---Handles Mouse Wheel---
-    def _on_mousewheel(self, event, canvas):
-        scroll_info = canvas.yview()
-        if scroll_info[0] == 0.0 and scroll_info[1] == 1.0:
-            return
-
-        if event.delta > 0 or event.num == 4:
-            if scroll_info[0] > 0.0:
-                canvas.yview_scroll(-1, "units")
-        elif event.delta < 0 or event.num == 5:
-            if scroll_info[1] < 1.0:
-                canvas.yview_scroll(1, "units")
-
-    # ---Binds Mouse Wheel---
-    def _bind_mousewheel(self, event, canvas):
-        self.bind_all("<MouseWheel>", lambda ev: self._on_mousewheel(ev, canvas))
-        self.bind_all("<Button-4>", lambda ev: self._on_mousewheel(ev, canvas))
-        self.bind_all("<Button-5>", lambda ev: self._on_mousewheel(ev, canvas))
-
-    # ---Unbinds Mouse Wheel---
-    def _unbind_mousewheel(self, event):
-        self.unbind_all("<MouseWheel>")
-        self.unbind_all("<Button-4>")
-        self.unbind_all("<Button-5>")
\ No newline at end of file
@@ -1,26 +1,30 @@
 from pathlib import Path
 import tkinter as tk
-from tkinter import Canvas, messagebox, PhotoImage, Frame, Label, ttk
-from utils import get_db_connection, round_rectangle
+from tkinter import Canvas, messagebox, Frame, Label, ttk
+from utils import db_connection, round_rectangle
+from image_cache import load_image
+from task_runner import run_in_background
+from rollups import ensure_rollups
 from datetime import datetime, timedelta, date
 from decimal import Decimal, ROUND_HALF_UP
 import mysql.connector
 
+# Imported when the report screen is first opened (main loads frames lazily), possibly on a
+# preload thread, so a missing library is recorded here and reported when the frame is built.
+MISSING_LIBRARIES = []
 try:
     from tkcalendar import DateEntry
 except ImportError:
-    messagebox.showerror("Missing Library", "Please install tkcalendar: pip install tkcalendar")
+    MISSING_LIBRARIES.append("tkcalendar")
 try:
     import pandas as pd
 except ImportError:
-    messagebox.showerror("Missing Library", "Please install pandas: pip install pandas")
+    MISSING_LIBRARIES.append("pandas")
 try:
-    import matplotlib.pyplot as plt
     from matplotlib.figure import Figure
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.dates import DateFormatter
 except ImportError:
-    messagebox.showerror("Missing Library", "Please install matplotlib: pip install matplotlib")
+    MISSING_LIBRARIES.append("matplotlib")
 
 # ---Asset Path Constructor---
 OUTPUT_PATH = Path(__file__).parent
@@ -40,6 +44,11 @@ class AdminReportFrame(tk.Frame):
         super().__init__(parent)
         self.controller = controller
 
+        if MISSING_LIBRARIES:
+            messagebox.showerror("Missing Library",
+                                 f"Please install {', '.join(MISSING_LIBRARIES)}: "
+                                 f"pip install {' '.join(MISSING_LIBRARIES)}")
+
         window_width = 905
         window_height = 575
 
@@ -53,7 +62,7 @@ class AdminReportFrame(tk.Frame):
         self.canvas.create_rectangle(37.0, 42.0, 866.0, 546.0, fill="#FFFFFF", outline="#000000")
         self.canvas.create_rectangle(53.0, 50.0, 256.0, 539.0, fill="#FFFFFF", outline="#000000")
         try:
-            self.image_image_1 = PhotoImage(file=relative_to_assets("image_1.png"))
+            self.image_image_1 = load_image(relative_to_assets("image_1.png"))
             self.canvas.create_image(154.0, 88.0, image=self.image_image_1)
         except tk.TclError as e:
             print(f"ERROR loading logo: {e}")
@@ -249,130 +258,141 @@ class AdminReportFrame(tk.Frame):
 
             print(f"Updating reports from {start_date} to {end_date}, grouped {group_by}")
 
-            self.update_stat_boxes(start_date, end_date)
-            self.update_revenue_chart(start_date, end_date, group_by)
-            self.update_top_users_table(start_date, end_date)
+            run_in_background(self.controller, self, "reports", self.fetch_report_data, start_date, end_date, group_by,
+                              on_done=lambda data: self.display_report_data(data, group_by),
+                              on_error=self.on_report_error)
 
         except Exception as e:
             messagebox.showerror("Update Error", f"Failed to update reports:\n{e}", parent=self)
             print(f"Error updating reports: {e}")
 
-    # ---Updates Statistics Boxes---
-    def update_stat_boxes(self, start_date, end_date):
-        conn = None
-        cursor = None
-        revenue = Decimal("0.00")
-        total_jobs = 0
-        pages_printed = 0
+    # ---Database: Fetches Report Data (runs on a worker thread)---
+    def fetch_report_data(self, start_date, end_date, group_by):
+        ensure_rollups()
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                stats = self.fetch_stats(cursor, start_date, end_date)
+            finally:
+                cursor.close()
+
+            cursor = conn.cursor(dictionary=True)
+            try:
+                chart_rows = self.fetch_revenue_chart(cursor, start_date, end_date, group_by)
+                top_users = self.fetch_top_users(cursor, start_date, end_date)
+            finally:
+                cursor.close()
+        return {"stats": stats, "chart_rows": chart_rows, "top_users": top_users}
+
+    # ---Displays Report Data---
+    def display_report_data(self, data, group_by):
+        self.update_stat_boxes(data["stats"])
+        self.update_revenue_chart(data["chart_rows"], group_by)
+        self.update_top_users_table(data["top_users"])
+
+    # ---Handles Fetch Error---
+    def on_report_error(self, err):
+        print(f"DB Error updating reports: {err}")
+        if isinstance(err, mysql.connector.Error):
+            messagebox.showerror("Database Error", f"Failed to fetch report data:\n{err}", parent=self)
+        else:
+            messagebox.showerror("Update Error", f"Failed to update reports:\n{err}", parent=self)
+
+    # ---Database: Fetches Statistics---
+    def fetch_stats(self, cursor, start_date, end_date):
         avg_payment_value = Decimal("0.00")
 
-        try:
-            conn = get_db_connection()
-            if not conn: return
-            cursor = conn.cursor()
+        query_rollup = """
+            SELECT COALESCE(SUM(total_revenue), 0), COALESCE(SUM(paid_jobs), 0),
+                   COALESCE(SUM(total_jobs), 0), COALESCE(SUM(pages_printed), 0)
+            FROM reports
+            WHERE report_date BETWEEN %s AND %s
+        """
+        cursor.execute(query_rollup, (start_date, end_date))
+        result = cursor.fetchone()
+        revenue = Decimal(result[0] or 0).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        paid_job_count = int(result[1] or 0)
+        total_jobs = int(result[2] or 0)
+        pages_printed = int(result[3] or 0)
+
+        if paid_job_count > 0:
+            avg_payment_value = (revenue / Decimal(paid_job_count)).quantize(Decimal("0.01"),
+                                                                             rounding=ROUND_HALF_UP)
+
+        return {
+            "revenue": revenue,
+            "total_jobs": total_jobs,
+            "pages_printed": pages_printed,
+            "avg_value": avg_payment_value,
+        }
 
-            query_payments = """
-                SELECT COALESCE(SUM(payment_amount), 0), COUNT(DISTINCT job_id)
-                FROM payments
-                WHERE DATE(payment_timestamp) BETWEEN %s AND %s
+    # ---Updates Statistics Boxes---
+    def update_stat_boxes(self, stats):
+        self.stat_labels["revenue"].config(text=f"₱{stats['revenue']:,.2f}")
+        self.stat_labels["total_jobs"].config(text=f"{stats['total_jobs']:,}")
+        self.stat_labels["pages_printed"].config(text=f"{stats['pages_printed']:,}")
+        self.stat_labels["avg_value"].config(text=f"₱{stats['avg_value']:,.2f}")
+
+    # ---Database: Fetches Revenue Chart Rows---
+    def fetch_revenue_chart(self, cursor, start_date, end_date, group_by):
+        query_base = "FROM reports WHERE report_date BETWEEN %s AND %s AND paid_jobs > 0"
+        params = (start_date, end_date)
+
+        if group_by == "Daily":
+            query = f"""
+                SELECT 
+                    DAYNAME(report_date) as date_group, 
+                    SUM(total_revenue) as revenue_total
+                {query_base}
+                GROUP BY date_group, WEEKDAY(report_date)
+                ORDER BY WEEKDAY(report_date) ASC
             """
-            cursor.execute(query_payments, (start_date, end_date))
-            payment_result = cursor.fetchone()
-            revenue = Decimal(payment_result[0] or 0).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            paid_job_count = payment_result[1] or 0
-
-            query_jobs_pages = """
-                SELECT
-                    COUNT(*),
-                    COALESCE(SUM(CASE WHEN status IN ('Completed', 'Paid') THEN pages ELSE 0 END), 0)
-                FROM print_jobs
-                WHERE DATE(created_at) BETWEEN %s AND %s
+
+        elif group_by == "Weekly":
+            query = f"""
+                    SELECT 
+                        FLOOR((DAY(report_date) - 1) / 7) + 1 as week_num,
+                        SUM(total_revenue) as revenue_total
+                    {query_base}
+                    GROUP BY week_num
+                    ORDER BY week_num ASC
+                """
+
+        elif group_by == "Monthly":
+            query = f"""
+                SELECT 
+                    DATE_FORMAT(report_date, '%Y-%m-01') as date_sort,
+                    DATE_FORMAT(report_date, '%b %Y') as date_group, 
+                    SUM(total_revenue) as revenue_total
+                {query_base}
+                GROUP BY date_sort, date_group
+                ORDER BY date_sort ASC
             """
-            cursor.execute(query_jobs_pages, (start_date, end_date))
-            job_page_result = cursor.fetchone()
-            total_jobs = job_page_result[0] if job_page_result else 0
-            pages_printed = job_page_result[1] if job_page_result else 0
-
-            if paid_job_count > 0:
-                avg_payment_value = (revenue / Decimal(paid_job_count)).quantize(Decimal("0.01"),
-                                                                                 rounding=ROUND_HALF_UP)
-
-        except mysql.connector.Error as err:
-            print(f"DB Error updating stats: {err}")
-            messagebox.showerror("Database Error", f"Failed to fetch statistics:\n{err}", parent=self)
-        except Exception as e:
-            print(f"Error updating stats: {e}")
-            messagebox.showerror("Error", f"An unexpected error occurred: {e}", parent=self)
-        finally:
-            if cursor: cursor.close()
-            if conn and conn.is_connected(): conn.close()
 
-        self.stat_labels["revenue"].config(text=f"₱{revenue:,.2f}")
-        self.stat_labels["total_jobs"].config(text=f"{total_jobs:,}")
-        self.stat_labels["pages_printed"].config(text=f"{pages_printed:,}")
-        self.stat_labels["avg_value"].config(text=f"₱{avg_payment_value:,.2f}")
+        cursor.execute(query, params)
+        return cursor.fetchall()
 
     # ---Updates Revenue Chart---
-    def update_revenue_chart(self, start_date, end_date, group_by):
-        conn = None
-        cursor = None
+    def update_revenue_chart(self, results, group_by):
         df = pd.DataFrame()
         plot_type = 'line'
         x_label = "Date"
         rotate_labels = False
 
-        try:
-            conn = get_db_connection()
-            if not conn: return
-            cursor = conn.cursor(dictionary=True)
-
-            query_base = "FROM payments WHERE DATE(payment_timestamp) BETWEEN %s AND %s"
-            params = (start_date, end_date)
-
-            if group_by == "Daily":
-                query = f"""
-                    SELECT 
-                        DAYNAME(payment_timestamp) as date_group, 
-                        SUM(payment_amount) as revenue_total
-                    {query_base}
-                    GROUP BY date_group, WEEKDAY(payment_timestamp)
-                    ORDER BY WEEKDAY(payment_timestamp) ASC
-                """
-                plot_type = 'bar'
-                x_label = "Day of the Week"
-                rotate_labels = True
-
-
-            elif group_by == "Weekly":
-                query = f"""
-                        SELECT 
-                            FLOOR((DAY(payment_timestamp) - 1) / 7) + 1 as week_num,
-                            SUM(payment_amount) as revenue_total
-                        {query_base}
-                        GROUP BY week_num
-                        ORDER BY week_num ASC
-                    """
-                plot_type = 'bar'
-                x_label = "Week of the Month"
-                rotate_labels = False
-
-            elif group_by == "Monthly":
-                query = f"""
-                    SELECT 
-                        DATE_FORMAT(payment_timestamp, '%Y-%m-01') as date_sort,
-                        DATE_FORMAT(payment_timestamp, '%b %Y') as date_group, 
-                        SUM(payment_amount) as revenue_total
-                    {query_base}
-                    GROUP BY date_sort, date_group
-                    ORDER BY date_sort ASC
-                """
-                plot_type = 'bar'
-                x_label = "Month"
-                rotate_labels = True
-
-            cursor.execute(query, params)
-            results = cursor.fetchall()
+        if group_by == "Daily":
+            plot_type = 'bar'
+            x_label = "Day of the Week"
+            rotate_labels = True
+        elif group_by == "Weekly":
+            plot_type = 'bar'
+            x_label = "Week of the Month"
+            rotate_labels = False
+        elif group_by == "Monthly":
+            plot_type = 'bar'
+            x_label = "Month"
+            rotate_labels = True
 
+        try:
             if results:
                 df = pd.DataFrame(results)
                 df['revenue_total'] = df['revenue_total'].apply(lambda x: float(Decimal(x or 0)))
@@ -388,15 +408,10 @@ class AdminReportFrame(tk.Frame):
                 elif group_by == "Monthly":
                     df['date_group'] = df['date_group'].astype(str)
 
-        except mysql.connector.Error as err:
-            print(f"DB Error fetching chart data: {err}")
-            messagebox.showerror("Database Error", f"Failed to get chart data:\n{err}", parent=self)
         except Exception as e:
             print(f"Error processing chart data: {e}")
             messagebox.showerror("Error", f"Error processing chart data:\n{e}", parent=self)
-        finally:
-            if cursor: cursor.close()
-            if conn and conn.is_connected(): conn.close()
+            df = pd.DataFrame()
 
         self.ax.clear()
         if not df.empty:
@@ -430,56 +445,27 @@ class AdminReportFrame(tk.Frame):
             print("Warning: tight_layout failed for chart.")
         self.chart_canvas.draw()
 
-    # ---Updates Top Users Table---
-    def update_top_users_table(self, start_date, end_date):
-        conn = None
-        cursor = None
-        top_users_data = []
-
-        try:
-            conn = get_db_connection()
-            if not conn: return
-            cursor = conn.cursor(dictionary=True)
-
-            query = """
-                SELECT
-                    u.username,
-                    COALESCE(job_counts.job_count, 0) AS job_count,
-                    COALESCE(page_counts.total_pages, 0) AS total_pages,
-                    COALESCE(SUM(p.payment_amount), 0) AS total_spend
-                FROM payments p
-                JOIN print_jobs pj ON p.job_id = pj.job_id
-                JOIN users u ON pj.user_id = u.user_id
-                LEFT JOIN (
-                    SELECT user_id, COUNT(*) as job_count
-                    FROM print_jobs
-                    WHERE DATE(created_at) BETWEEN %s AND %s
-                    GROUP BY user_id
-                ) AS job_counts ON u.user_id = job_counts.user_id
-                LEFT JOIN (
-                    SELECT user_id, SUM(pages) as total_pages
-                    FROM print_jobs
-                    WHERE DATE(created_at) BETWEEN %s AND %s AND status IN ('Completed', 'Paid')
-                    GROUP BY user_id
-                ) AS page_counts ON u.user_id = page_counts.user_id
-                WHERE DATE(p.payment_timestamp) BETWEEN %s AND %s
-                GROUP BY u.user_id, u.username, job_counts.job_count, page_counts.total_pages
-                ORDER BY total_spend DESC
-                LIMIT 10
-            """
-            cursor.execute(query, (start_date, end_date, start_date, end_date, start_date, end_date))
-            top_users_data = cursor.fetchall()
-
-        except mysql.connector.Error as err:
-            print(f"DB Error fetching top users: {err}")
-            messagebox.showerror("Database Error", f"Failed to fetch top users:\n{err}", parent=self)
-        except Exception as e:
-            print(f"Error processing top users: {e}")
-            messagebox.showerror("Error", f"Error processing top users:\n{e}", parent=self)
-        finally:
-            if cursor: cursor.close()
-            if conn and conn.is_connected(): conn.close()
+    # ---Database: Fetches Top Users---
+    def fetch_top_users(self, cursor, start_date, end_date):
+        query = """
+            SELECT
+                u.username,
+                SUM(d.total_jobs) AS job_count,
+                SUM(d.pages_printed) AS total_pages,
+                SUM(d.total_revenue) AS total_spend
+            FROM user_daily_usage d
+            JOIN users u ON d.user_id = u.user_id
+            WHERE d.report_date BETWEEN %s AND %s
+            GROUP BY d.user_id, u.username
+            HAVING SUM(d.paid_jobs) > 0
+            ORDER BY total_spend DESC
+            LIMIT 10
+        """
+        cursor.execute(query, (start_date, end_date))
+        return cursor.fetchall()
 
+    # ---Updates Top Users Table---
+    def update_top_users_table(self, top_users_data):
         for item in self.tree.get_children():
             self.tree.delete(item)
 
@@ -1,11 +1,14 @@
 from pathlib import Path
 import tkinter as tk
-from tkinter import Canvas, Entry, Text, Button, PhotoImage, messagebox, ttk, Listbox
+from tkinter import Canvas, Entry, Text, Button, messagebox, ttk, Listbox
 import mysql.connector
 import re
 import bcrypt
 from datetime import datetime
-from utils import get_db_connection, round_rectangle
+from utils import get_db_connection, db_connection, round_rectangle
+from image_cache import load_image
+from task_runner import run_in_background
+from virtual_list import VirtualList
 import random
 import string
 import os
@@ -31,7 +34,6 @@ class AdminUserFrame(tk.Frame):
         super().__init__(parent)
         self.controller = controller
         self.all_users = []
-        self.selected_user_row_bg = None
 
         self.canvas = Canvas(
             self,
@@ -49,7 +51,7 @@ class AdminUserFrame(tk.Frame):
         self.canvas.create_rectangle(44, 46, 247, 535, fill="#FFFFFF", outline="#000000")
 
         try:
-            self.logo_image = PhotoImage(file=relative_to_assets("image_2.png"))
+            self.logo_image = load_image(relative_to_assets("image_2.png"))
             self.canvas.create_image(145.0, 84.0, image=self.logo_image)
         except tk.TclError:
             self.canvas.create_text(145, 85, text="Logo Missing", fill="#555555", font=("Inter", 10))
@@ -143,23 +145,13 @@ class AdminUserFrame(tk.Frame):
                                                                                                       pady=5)
         ttk.Separator(header_frame, orient="horizontal").grid(row=1, column=0, columnspan=2, sticky="ew")
 
-        self.user_list_canvas = Canvas(scroll_container, bg="white", bd=0, highlightthickness=0)
-        user_scrollbar = ttk.Scrollbar(scroll_container, orient="vertical", command=self.user_list_canvas.yview)
-        self.user_list_canvas.configure(yscrollcommand=user_scrollbar.set)
-        user_scrollbar.pack(side="right", fill="y")
-        self.user_list_canvas.pack(side="left", fill="both", expand=True)
-        self.user_content_frame = tk.Frame(self.user_list_canvas, bg="white")
-        self.user_content_frame_window = self.user_list_canvas.create_window((0, 0), window=self.user_content_frame,
-                                                                             anchor="nw")
-
-        self.user_content_frame.bind("<Configure>", lambda event: self.on_frame_configure(self.user_list_canvas))
-        self.user_list_canvas.bind("<Configure>",
-                                   lambda e: self.user_list_canvas.itemconfig(self.user_content_frame_window,
-                                                                              width=e.width))
-        self.user_list_canvas.bind("<Enter>", lambda e: self._bind_mousewheel(e, self.user_list_canvas))
-        self.user_list_canvas.bind("<Leave>", lambda e: self._unbind_mousewheel(e))
-        self.user_content_frame.bind("<Enter>", lambda e: self._bind_mousewheel(e, self.user_list_canvas))
-        self.user_content_frame.bind("<Leave>", lambda e: self._unbind_mousewheel(e))
+        self.user_list = VirtualList(
+            scroll_container, columns=[{"weight": 1, "padx": (15, 5)}, {"weight": 3, "padx": (5, 15)}],
+            render=lambda user: [user["user_id"], user["username"]], key=lambda user: user["user_id"],
+            row_height=30, on_select=self.on_user_selected, empty_text="No users found.", font=("Inter", 11),
+            alt_bg="white", hover_bg="#E8F0FE", select_bg="#BBDEFB"
+        )
+        self.user_list.pack(side="top", fill="both", expand=True)
 
         sidebar_y_start = 150
         sidebar_y_offset = 56
@@ -218,87 +210,89 @@ class AdminUserFrame(tk.Frame):
 
     #---Loads User List---
     def load_users(self):
+        self.user_list.clear_selection()
         self.update_user_details(None)
-        self.all_users = self.fetch_users()
-        self.display_users_list(self.user_content_frame, self.all_users)
         self.search_entry.delete(0, tk.END)
+        run_in_background(self.controller, self, "users", self.fetch_users,
+                          on_done=self.on_users_loaded, on_error=self.on_users_error)
 
-    #---Database: Fetches Users---
+    #---Database: Fetches Users (runs on a worker thread)---
     def fetch_users(self):
-        try:
-            conn = get_db_connection()
+        with db_connection() as conn:
             cursor = conn.cursor(dictionary=True)
-            query = "SELECT user_id, username FROM users ORDER BY user_id ASC"
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return rows
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Error fetching users:\n{err}")
-            return []
+            try:
+                query = "SELECT user_id, username FROM users ORDER BY user_id ASC"
+                cursor.execute(query)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    #---Stores Loaded Users---
+    def on_users_loaded(self, rows):
+        self.all_users = rows
+        self.apply_user_search()
+
+    #---Handles Users Fetch Error---
+    def on_users_error(self, err):
+        messagebox.showerror("Database Error", f"Error fetching users:\n{err}")
+        self.on_users_loaded([])
 
-    #---Database: Fetches Details---
+    #---Database: Fetches Details (runs on a worker thread)---
     def fetch_user_details(self, user_id):
         details = {}
-        conn = None
-        cursor = None
-        try:
-            conn = get_db_connection()
-            if not conn:
-                return None
+        with db_connection() as conn:
             cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
+                user_info = cursor.fetchone()
+                if not user_info:
+                    return None
+                details.update(user_info)
+
+                cursor.execute("""
+                    SELECT
+                        COUNT(*) as total_jobs,
+                        SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END) as completed_jobs,
+                        SUM(CASE WHEN status = 'Declined' THEN 1 ELSE 0 END) as declined_jobs,
+                        SUM(CASE WHEN status = 'Completed' THEN pages ELSE 0 END) as total_pages
+                    FROM print_jobs
+                    WHERE user_id = %s
+                """, (user_id,))
+                stats = cursor.fetchone()
+                if stats:
+                    details.update(stats)
+
+                details['recent_activity'] = self.fetch_recent_activity(cursor, user_id)
+            finally:
+                cursor.close()
 
-            cursor.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
-            user_info = cursor.fetchone()
-            if not user_info:
-                return None
-            details.update(user_info)
-
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as total_jobs,
-                    SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END) as completed_jobs,
-                    SUM(CASE WHEN status = 'Declined' THEN 1 ELSE 0 END) as declined_jobs,
-                    SUM(CASE WHEN status = 'Completed' THEN pages ELSE 0 END) as total_pages
-                FROM print_jobs
-                WHERE user_id = %s
-            """, (user_id,))
-            stats = cursor.fetchone()
-            if stats:
-                details.update(stats)
-
-            if 'created_at' in details and details['created_at']:
-                if isinstance(details['created_at'], datetime):
-                    details['member_since'] = details['created_at'].strftime('%Y-%m-%d')
-                else:
-                    details['member_since'] = str(details['created_at'])
+        if 'created_at' in details and details['created_at']:
+            if isinstance(details['created_at'], datetime):
+                details['member_since'] = details['created_at'].strftime('%Y-%m-%d')
             else:
-                details['member_since'] = '-'
+                details['member_since'] = str(details['created_at'])
+        else:
+            details['member_since'] = '-'
 
-            details['total_jobs'] = details.get('total_jobs', 0)
-            details['completed_jobs'] = details.get('completed_jobs', 0)
-            details['declined_jobs'] = details.get('declined_jobs', 0)
-            details['total_pages'] = details.get('total_pages', 0) or 0
-            details['role'] = details.get('role', 'User')
+        details['total_jobs'] = details.get('total_jobs', 0)
+        details['completed_jobs'] = details.get('completed_jobs', 0)
+        details['declined_jobs'] = details.get('declined_jobs', 0)
+        details['total_pages'] = details.get('total_pages', 0) or 0
+        details['role'] = details.get('role', 'User')
 
-            return details
+        return details
 
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Error fetching user details:\n{err}")
-            return None
-        finally:
-            if cursor:
-                cursor.close()
-            if conn and conn.is_connected():
-                conn.close()
+    #---Handles Details Fetch Error---
+    def on_user_details_error(self, err):
+        messagebox.showerror("Database Error", f"Error fetching user details:\n{err}")
+        self.update_user_details(None)
 
     #---Disables Selected User---
     def disable_selected_user(self):
-        if not self.selected_user_row_bg or not hasattr(self.selected_user_row_bg, "user_data"):
+        user_data = self.user_list.selected_record()
+        if not user_data:
             messagebox.showwarning("No Selection", "Please select a user to disable.")
             return
-        user_data = self.selected_user_row_bg.user_data
         user_id = user_data["user_id"]
         if not messagebox.askyesno("Confirm Disable", f"Disable user ID {user_id}?"):
             return
@@ -316,10 +310,10 @@ class AdminUserFrame(tk.Frame):
 
     #---Handles Password Reset---
     def reset_password(self):
-        if not self.selected_user_row_bg or not hasattr(self.selected_user_row_bg, "user_data"):
+        user_data = self.user_list.selected_record()
+        if not user_data:
             messagebox.showwarning("No Selection", "Select user to reset password.")
             return
-        user_data = self.selected_user_row_bg.user_data
         user_id = user_data["user_id"]
         username = user_data["username"]
 
@@ -471,10 +465,10 @@ class AdminUserFrame(tk.Frame):
 
     #---Activates Selected User---
     def activate_selected_user(self):
-        if not self.selected_user_row_bg or not hasattr(self.selected_user_row_bg, "user_data"):
+        user_data = self.user_list.selected_record()
+        if not user_data:
             messagebox.showwarning("No Selection", "Please select a user to activate.")
             return
-        user_data = self.selected_user_row_bg.user_data
         user_id = user_data["user_id"]
         if not messagebox.askyesno("Confirm Activate", f"Activate user ID {user_id}?"):
             return
@@ -491,17 +485,12 @@ class AdminUserFrame(tk.Frame):
             messagebox.showerror("Database Error", f"Error activating user:\n{err}")
 
     #---Database: Fetches Activity---
-    def fetch_recent_activity(self, user_id):
+    def fetch_recent_activity(self, cursor, user_id):
         try:
-            conn = get_db_connection()
-            cursor = conn.cursor(dictionary=True)
             cursor.execute(
                 "SELECT action, details, created_at FROM activity_logs WHERE user_id = %s ORDER BY created_at DESC LIMIT 3",
                 (user_id,))
-            activities = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return activities
+            return cursor.fetchall()
         except mysql.connector.Error as err:
             print("DB error fetching activity:", err)
             if err.errno == 1146:
@@ -512,19 +501,18 @@ class AdminUserFrame(tk.Frame):
     #---Database: Creates Logs Table---
     def create_activity_logs_table(self):
         try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute("""CREATE TABLE IF NOT EXISTS activity_logs (
-                                log_id INT AUTO_INCREMENT PRIMARY KEY, 
-                                user_id INT, 
-                                action VARCHAR(100), 
-                                details VARCHAR(255), 
-                                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, 
-                                FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL
-                           )""")
-            conn.commit()
-            cursor.close()
-            conn.close()
+            with db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""CREATE TABLE IF NOT EXISTS activity_logs (
+                                    log_id INT AUTO_INCREMENT PRIMARY KEY, 
+                                    user_id INT, 
+                                    action VARCHAR(100), 
+                                    details VARCHAR(255), 
+                                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, 
+                                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL
+                               )""")
+                conn.commit()
+                cursor.close()
             print("'activity_logs' table OK.")
             return True
         except mysql.connector.Error as err:
@@ -594,7 +582,7 @@ class AdminUserFrame(tk.Frame):
                                 tags="user_detail")
         self.canvas.create_text(350, 407, anchor="nw", text="********", font=("Inter", 12 * -1), tags="user_detail")
 
-        recent_activities = self.fetch_recent_activity(details.get('user_id'))
+        recent_activities = details.get('recent_activity')
         y_position = activity_y_start
         if recent_activities:
             for activity in recent_activities:
@@ -642,105 +630,28 @@ class AdminUserFrame(tk.Frame):
 
         self.canvas.tag_raise("user_detail")
 
-    #---Displays Users in List---
-    def display_users_list(self, frame, users_to_display):
-        for widget in frame.winfo_children():
-            widget.destroy()
-        frame.columnconfigure(0, weight=1)
-        frame.columnconfigure(1, weight=3)
-
-        #---Handles Row Hover---
-        def on_row_enter(event, bg_widget):
-            if bg_widget != self.selected_user_row_bg:
-                bg_widget.config(bg="#E8F0FE")
-                [child.config(bg="#E8F0FE") for child in bg_widget.winfo_children() if isinstance(child, tk.Label)]
-            self.config(cursor="hand2")
-
-        #---Handles Row Leave---
-        def on_row_leave(event, bg_widget):
-            if bg_widget != self.selected_user_row_bg:
-                bg_widget.config(bg="white")
-                [child.config(bg="white") for child in bg_widget.winfo_children() if isinstance(child, tk.Label)]
-            self.config(cursor="")
-
-        #---Handles Row Click---
-        def on_row_click(event, user_data, bg_widget):
-            if self.selected_user_row_bg and self.selected_user_row_bg.winfo_exists():
-                self.selected_user_row_bg.config(bg="white")
-                [child.config(bg="white") for child in self.selected_user_row_bg.winfo_children() if
-                 isinstance(child, tk.Label)]
-            bg_widget.config(bg="#BBDEFB")
-            [child.config(bg="#BBDEFB") for child in bg_widget.winfo_children() if isinstance(child, tk.Label)]
-            self.selected_user_row_bg = bg_widget
-            bg_widget.user_data = user_data
-            details = self.fetch_user_details(user_data['user_id'])
-            self.update_user_details(details)
-
-        row_index = 0
-        if not users_to_display:
-            tk.Label(frame, text="No users found.", font=("Inter", 12), fg="grey", bg="white").grid(row=0, column=0,
-                                                                                                    columnspan=2,
-                                                                                                    pady=20)
-
-        for user in users_to_display:
-            row_bg_frame = tk.Frame(frame, bg="white", height=30)
-            row_bg_frame.grid(row=row_index, column=0, columnspan=2, sticky="ew", pady=(0, 1))
-            row_bg_frame.grid_propagate(False)
-            row_bg_frame.columnconfigure(0, weight=1)
-            row_bg_frame.columnconfigure(1, weight=3)
-
-            id_label = tk.Label(row_bg_frame, text=user["user_id"], font=("Inter", 11), bg="white", anchor="w")
-            id_label.place(relx=0.05, rely=0.5, anchor='w')
-            username_label = tk.Label(row_bg_frame, text=user["username"], font=("Inter", 11), bg="white", anchor="w")
-            username_label.place(relx=0.3, rely=0.5, anchor='w')
-
-            for widget in [row_bg_frame, id_label, username_label]:
-                widget.bind("<Enter>", lambda e, bg=row_bg_frame: on_row_enter(e, bg))
-                widget.bind("<Leave>", lambda e, bg=row_bg_frame: on_row_leave(e, bg))
-                widget.bind("<Button-1>", lambda e, u=user, bg=row_bg_frame: on_row_click(e, u, bg))
-            row_index += 1
+    #---Handles User Selection---
+    def on_user_selected(self, user_data, index):
+        run_in_background(self.controller, self, "user_details", self.fetch_user_details, user_data['user_id'],
+                          on_done=self.update_user_details, on_error=self.on_user_details_error)
 
     #---Handles User Search---
     def on_user_search(self, event):
-        search_term = self.search_entry.get().lower().strip()
         if not self.all_users:
-            self.all_users = self.fetch_users()
+            run_in_background(self.controller, self, "users", self.fetch_users,
+                              on_done=self.on_users_loaded, on_error=self.on_users_error)
+            return
+        self.apply_user_search()
 
+    #---Filters Loaded Users---
+    def apply_user_search(self):
+        search_term = self.search_entry.get().lower().strip()
         filtered_users = self.all_users if not search_term else [
             user for user in self.all_users
             if search_term in str(user.get("user_id", "")) or search_term in str(user.get("username", "")).lower()
         ]
 
-        self.display_users_list(self.user_content_frame, filtered_users)
-        self.user_list_canvas.after(50, lambda: self.on_frame_configure(self.user_list_canvas))
-
-    #---Updates Scrollable Area---
-    def on_frame_configure(self, canvas):
-        canvas.configure(scrollregion=canvas.bbox("all"))
-
-    #---Handles Mouse Wheel---
-    def _on_mousewheel(self, event, canvas):
-        scroll_info = canvas.yview()
-        if scroll_info[0] == 0.0 and scroll_info[1] == 1.0:
-            return
-        if event.delta > 0 or event.num == 4:
-            if scroll_info[0] > 0.0:
-                canvas.yview_scroll(-1, "units")
-        elif event.delta < 0 or event.num == 5:
-            if scroll_info[1] < 1.0:
-                canvas.yview_scroll(1, "units")
-
-    #---Binds Mouse Wheel---
-    def _bind_mousewheel(self, event, canvas):
-        self.bind_all("<MouseWheel>", lambda ev: self._on_mousewheel(ev, canvas))
-        self.bind_all("<Button-4>", lambda ev: self._on_mousewheel(ev, canvas))
-        self.bind_all("<Button-5>", lambda ev: self._on_mousewheel(ev, canvas))
-
-    #---Unbinds Mouse Wheel---
-    def _unbind_mousewheel(self, event):
-        self.unbind_all("<MouseWheel>")
-        self.unbind_all("<Button-4>")
-        self.unbind_all("<Button-5>")
+        self.user_list.set_items(filtered_users, reset_scroll=True)
 
     #---Creates Sidebar Button---
     def create_rounded_menu_button(self, x, y, w, h, text, command=None):
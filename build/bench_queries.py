@@ -0,0 +1,292 @@
+import argparse
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from db_migrate import MIGRATIONS, STATUS_PRIORITY
+
+load_dotenv()
+
+STATUSES = ["Pending", "Approved", "In Progress", "Completed", "Declined", "Paid", "Cash", "Voided"]
+STATUS_WEIGHTS = [10, 5, 2, 45, 8, 15, 12, 3]
+BATCH_SIZE = 5000
+
+# Tables as in copy_corner_db.sql, with only the keys the dump ships with.
+SCHEMA = [
+    """CREATE TABLE users (
+        user_id int(11) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        username varchar(50) DEFAULT NULL,
+        email varchar(100) DEFAULT NULL,
+        status varchar(20) DEFAULT 'active',
+        created_at timestamp NOT NULL DEFAULT current_timestamp(),
+        UNIQUE KEY username (username)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4""",
+    """CREATE TABLE files (
+        file_id int(11) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        user_id int(11) DEFAULT NULL,
+        file_name varchar(255) DEFAULT NULL,
+        file_type varchar(50) DEFAULT NULL,
+        KEY user_id (user_id)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4""",
+    """CREATE TABLE print_jobs (
+        job_id int(11) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        user_id int(11) DEFAULT NULL,
+        file_id int(11) DEFAULT NULL,
+        pages int(11) DEFAULT NULL,
+        paper_size enum('Short','A4','Long') DEFAULT NULL,
+        color_option enum('Black & White','Color') DEFAULT NULL,
+        copies int(11) DEFAULT NULL,
+        payment_method enum('Cash','Gcash','Other') DEFAULT NULL,
+        total_amount decimal(10,2) DEFAULT NULL,
+        status enum('Pending','Approved','In Progress','Completed','Voided','Declined','Paid','Cash') DEFAULT 'Pending',
+        notes text DEFAULT NULL,
+        created_at timestamp NOT NULL DEFAULT current_timestamp(),
+        updated_at varchar(255) NOT NULL,
+        KEY user_id (user_id),
+        KEY file_id (file_id)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4""",
+    """CREATE TABLE payments (
+        payment_id int(11) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        job_id int(11) NOT NULL,
+        payment_amount decimal(10,2) NOT NULL,
+        payment_method varchar(50) NOT NULL,
+        payment_timestamp timestamp NOT NULL DEFAULT current_timestamp(),
+        KEY job_id (job_id)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4""",
+    """CREATE TABLE notifications (
+        notif_id int(11) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        user_id int(11) DEFAULT NULL,
+        subject varchar(255) NOT NULL,
+        message text DEFAULT NULL,
+        status enum('Unread','Read') DEFAULT 'Unread',
+        created_at timestamp NOT NULL DEFAULT current_timestamp(),
+        KEY user_id (user_id)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4""",
+]
+
+OLD_STATUS_RANK_SQL = """CASE pj.status WHEN 'Paid' THEN 1 WHEN 'Cash' THEN 2 WHEN 'Pending' THEN 3
+    WHEN 'Approved' THEN 4 WHEN 'In Progress' THEN 5 WHEN 'Declined' THEN 6 WHEN 'Completed' THEN 7 ELSE 8 END"""
+
+JOB_COLUMNS = """pj.job_id, u.username, u.user_id, f.file_id, f.file_name, f.file_type, pj.pages, pj.paper_size,
+    pj.color_option, pj.copies, pj.payment_method, pj.total_amount, pj.status, pj.notes, pj.created_at, pj.updated_at"""
+JOB_JOINS = """FROM print_jobs pj LEFT JOIN users u ON pj.user_id = u.user_id
+    LEFT JOIN files f ON pj.file_id = f.file_id"""
+
+
+#---Bench: Connects---
+def connect(database=None):
+    return mysql.connector.connect(
+        host=os.getenv("DB_HOST", "localhost"),
+        user=os.getenv("DB_USER", "root"),
+        password=os.getenv("DB_PASS", ""),
+        database=database,
+    )
+
+
+#---Bench: Inserts in Batches---
+def insert_rows(conn, cursor, query, rows):
+    for start in range(0, len(rows), BATCH_SIZE):
+        cursor.executemany(query, rows[start:start + BATCH_SIZE])
+        conn.commit()
+
+
+#---Bench: Seeds Synthetic Data---
+# Deterministic for a given size: users = jobs / 100, notifications = jobs / 10, payments for paid jobs.
+def seed(conn, jobs):
+    rng = random.Random(jobs)
+    cursor = conn.cursor()
+    for statement in SCHEMA:
+        cursor.execute(statement)
+
+    user_count = max(100, jobs // 100)
+    insert_rows(conn, cursor, "INSERT INTO users (username, email) VALUES (%s, %s)",
+                [(f"user{i:07d}", f"user{i:07d}@example.com") for i in range(1, user_count + 1)])
+
+    now = datetime.now().replace(microsecond=0)
+    span = int(timedelta(days=730).total_seconds())
+    files, print_jobs, payments = [], [], []
+    for job_id in range(1, jobs + 1):
+        user_id = rng.randint(1, user_count)
+        created = now - timedelta(seconds=rng.randint(0, span))
+        status = rng.choices(STATUSES, STATUS_WEIGHTS)[0]
+        updated = "" if status == "Pending" else (created + timedelta(hours=rng.randint(1, 72))).strftime(
+            "%Y-%m-%d %H:%M:%S")
+        pages, copies = rng.randint(1, 40), rng.randint(1, 5)
+        amount = round(pages * copies * rng.choice([2.0, 5.0, 10.0]), 2)
+        method = "Cash" if status == "Cash" else "Gcash" if status in ("Paid", "Completed") else None
+        files.append((user_id, f"document_{job_id}.pdf", "pdf"))
+        print_jobs.append((user_id, job_id, pages, "A4", "Black & White", copies, method, amount, status,
+                           created, updated))
+        if method:
+            payments.append((job_id, amount, method, created + timedelta(minutes=rng.randint(1, 600))))
+
+    insert_rows(conn, cursor, "INSERT INTO files (user_id, file_name, file_type) VALUES (%s, %s, %s)", files)
+    insert_rows(conn, cursor, """INSERT INTO print_jobs (user_id, file_id, pages, paper_size, color_option, copies,
+                                     payment_method, total_amount, status, created_at, updated_at)
+                                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""", print_jobs)
+    insert_rows(conn, cursor, """INSERT INTO payments (job_id, payment_amount, payment_method, payment_timestamp)
+                                 VALUES (%s, %s, %s, %s)""", payments)
+
+    notifications = []
+    for _ in range(max(10, jobs // 10)):
+        user_id = None if rng.random() < 0.1 else rng.randint(1, user_count)
+        notifications.append((user_id, "Update", "Your request has been updated.",
+                              now - timedelta(seconds=rng.randint(0, span))))
+    insert_rows(conn, cursor, "INSERT INTO notifications (user_id, subject, message, created_at) VALUES (%s, %s, %s, %s)",
+                notifications)
+    cursor.execute("ANALYZE TABLE users, files, print_jobs, payments, notifications")
+    cursor.fetchall()
+    cursor.close()
+    return user_count
+
+
+#---Bench: Query Pairs---
+# (name, old query, new query, params builder); each pair mirrors a query in the app before/after the migration.
+def query_cases(user_count):
+    today = datetime.now().date()
+    month_start = today.replace(day=1)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    username = f"user{user_count // 2:07d}"
+    finished = (STATUS_PRIORITY["Completed"], STATUS_PRIORITY["Declined"])
+    priority = STATUS_PRIORITY
+
+    return [
+        ("print queue, first page",
+         f"SELECT {JOB_COLUMNS}, {OLD_STATUS_RANK_SQL} AS status_rank {JOB_JOINS} "
+         "ORDER BY status_rank, pj.updated_at DESC, pj.created_at DESC, pj.job_id DESC LIMIT 100", (),
+         f"SELECT {JOB_COLUMNS}, pj.status_priority {JOB_JOINS} "
+         "ORDER BY pj.status_priority DESC, pj.updated_at DESC, pj.created_at DESC, pj.job_id DESC LIMIT 100", ()),
+        ("print queue, status filter",
+         f"SELECT {JOB_COLUMNS}, {OLD_STATUS_RANK_SQL} AS status_rank {JOB_JOINS} WHERE pj.status = %s "
+         "ORDER BY status_rank, pj.updated_at DESC, pj.created_at DESC, pj.job_id DESC LIMIT 100", ("Approved",),
+         f"SELECT {JOB_COLUMNS}, pj.status_priority {JOB_JOINS} WHERE pj.status_priority = %s "
+         "ORDER BY pj.status_priority DESC, pj.updated_at DESC, pj.created_at DESC, pj.job_id DESC LIMIT 100",
+         (priority["Approved"],)),
+        ("print queue, username search",
+         f"SELECT {JOB_COLUMNS}, {OLD_STATUS_RANK_SQL} AS status_rank {JOB_JOINS} WHERE u.username LIKE %s "
+         "ORDER BY status_rank, pj.updated_at DESC, pj.created_at DESC, pj.job_id DESC LIMIT 100",
+         (f"%{username}%",),
+         f"SELECT {JOB_COLUMNS}, pj.status_priority {JOB_JOINS} "
+         "WHERE pj.user_id IN (SELECT user_id FROM users WHERE username LIKE %s) "
+         "ORDER BY pj.status_priority DESC, pj.updated_at DESC, pj.created_at DESC, pj.job_id DESC LIMIT 100",
+         (f"{username}%",)),
+        ("dashboard requests, this month",
+         f"""SELECT pj.job_id, u.username, f.file_name, pj.status, pj.payment_method {JOB_JOINS}
+             WHERE (pj.status NOT IN ('Completed', 'Declined'))
+                OR (pj.status IN ('Completed', 'Declined') AND DATE(pj.updated_at) BETWEEN %s AND %s)
+             ORDER BY {OLD_STATUS_RANK_SQL}, pj.updated_at DESC, pj.created_at DESC""",
+         (month_start, next_month - timedelta(days=1)),
+         f"""(SELECT pj.job_id, u.username, f.file_name, pj.status, pj.payment_method, pj.status_priority,
+                     pj.updated_at, pj.created_at {JOB_JOINS} WHERE pj.status_priority NOT IN (%s, %s))
+             UNION ALL
+             (SELECT pj.job_id, u.username, f.file_name, pj.status, pj.payment_method, pj.status_priority,
+                     pj.updated_at, pj.created_at {JOB_JOINS}
+              WHERE pj.status_priority IN (%s, %s) AND pj.updated_at >= %s AND pj.updated_at < %s)
+             ORDER BY status_priority DESC, updated_at DESC, created_at DESC""",
+         (*finished, *finished, str(month_start), str(next_month))),
+        ("dashboard status counts",
+         """SELECT SUM(CASE WHEN status = 'Pending' THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN status IN ('Paid', 'Cash') THEN 1 ELSE 0 END) FROM print_jobs""", (),
+         """SELECT COALESCE(SUM(status_priority = %s), 0), COALESCE(SUM(status_priority IN (%s, %s)), 0)
+            FROM print_jobs WHERE status_priority IN (%s, %s, %s)""",
+         (priority["Pending"], priority["Paid"], priority["Cash"],
+          priority["Pending"], priority["Paid"], priority["Cash"])),
+        ("revenue, this month",
+         "SELECT COALESCE(SUM(payment_amount), 0) FROM payments WHERE DATE(payment_timestamp) BETWEEN %s AND %s",
+         (month_start, next_month - timedelta(days=1)),
+         "SELECT COALESCE(SUM(payment_amount), 0) FROM payments WHERE payment_timestamp >= %s AND payment_timestamp < %s",
+         (month_start, next_month)),
+        ("user notifications",
+         """SELECT notif_id, subject, message, created_at, status FROM notifications
+            WHERE (user_id = %s OR user_id IS NULL) ORDER BY created_at DESC""", (user_count // 2,),
+         """(SELECT notif_id, subject, message, created_at, status FROM notifications WHERE user_id = %s)
+            UNION ALL
+            (SELECT notif_id, subject, message, created_at, status FROM notifications WHERE user_id IS NULL)
+            ORDER BY created_at DESC""", (user_count // 2,)),
+        ("user recent requests",
+         """SELECT pj.job_id, f.file_name, pj.status, pj.created_at FROM print_jobs pj
+            JOIN files f ON pj.file_id = f.file_id WHERE pj.user_id = %s ORDER BY pj.created_at DESC LIMIT 10""",
+         (user_count // 2,), None, None),
+        ("change feed marks",
+         """SELECT (SELECT MAX(job_id) FROM print_jobs), (SELECT MAX(updated_at) FROM print_jobs),
+                   (SELECT MAX(notif_id) FROM notifications), (SELECT MAX(payment_id) FROM payments)""", (),
+         None, None),
+    ]
+
+
+#---Bench: Times One Query---
+def time_query(cursor, query, params, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cursor.execute(query, params)
+        cursor.fetchall()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+#---Bench: Runs One Scale---
+def run_scale(jobs, database, repeat):
+    conn = connect()
+    cursor = conn.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+    cursor.execute(f"CREATE DATABASE `{database}`")
+    cursor.close()
+    conn.database = database
+
+    print(f"\n== {jobs:,} print jobs ==")
+    started = time.perf_counter()
+    user_count = seed(conn, jobs)
+    print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+    cases = query_cases(user_count)
+    cursor = conn.cursor()
+    before = [time_query(cursor, old_query, old_params, repeat) for _, old_query, old_params, _, _ in cases]
+
+    started = time.perf_counter()
+    for _, statement in MIGRATIONS:
+        cursor.execute(statement)
+    cursor.execute("ANALYZE TABLE print_jobs, payments, notifications")
+    cursor.fetchall()
+    print(f"Migrated in {time.perf_counter() - started:.1f}s")
+
+    after = []
+    for _, old_query, old_params, new_query, new_params in cases:
+        query, params = (new_query, new_params) if new_query else (old_query, old_params)
+        after.append(time_query(cursor, query, params, repeat))
+    cursor.close()
+    conn.close()
+
+    print(f"{'query':<32}{'before p50':>12}{'p95':>10}{'after p50':>12}{'p95':>10}{'speedup':>10}")
+    for (name, *_), (old_p50, old_p95), (new_p50, new_p95) in zip(cases, before, after):
+        speedup = old_p50 / new_p50 if new_p50 else float("inf")
+        print(f"{name:<32}{old_p50:>10.2f}ms{old_p95:>8.2f}ms{new_p50:>10.2f}ms{new_p95:>8.2f}ms{speedup:>9.1f}x")
+
+
+#---Bench: Command---
+# Usage: python bench_queries.py --scales 10000,100000,1000000
+# Drops and recreates the target database, so never point it at the app database.
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the hot queries before and after db_migrate.")
+    parser.add_argument("--scales", default="10000,100000,1000000",
+                        help="comma separated print_jobs row counts (default: %(default)s)")
+    parser.add_argument("--database", default="copy_corner_bench",
+                        help="scratch database to create and drop (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per query (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.database == os.getenv("DB_NAME", "copy_corner_db"):
+        parser.error("refusing to benchmark against the application database")
+
+    for jobs in (int(scale) for scale in args.scales.split(",") if scale.strip()):
+        run_scale(jobs, args.database, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import os
+import threading
+
+from utils import db_connection
+from task_runner import run_in_background
+
+
+#---Feed: Reads High-Water Marks (runs on a worker thread)---
+# One round trip of MAX() lookups; three of them are on primary keys.
+def fetch_marks():
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT
+                    (SELECT COALESCE(MAX(job_id), 0) FROM print_jobs),
+                    (SELECT COALESCE(MAX(updated_at), '') FROM print_jobs),
+                    (SELECT COALESCE(MAX(notif_id), 0) FROM notifications),
+                    (SELECT COALESCE(MAX(payment_id), 0) FROM payments)
+            """)
+            job_id, job_updated_at, notif_id, payment_id = cursor.fetchone()
+        finally:
+            cursor.close()
+    return {
+        "job_id": int(job_id or 0),
+        "job_updated_at": str(job_updated_at or ""),
+        "notif_id": int(notif_id or 0),
+        "payment_id": int(payment_id or 0),
+    }
+
+
+#---Feed: Change Detection---
+class ChangeFeed:
+    """Polls cheap high-water marks and tells the visible frame which tables moved.
+
+    Subscribers get the set of changed topics ("print_jobs", "payments", "notifications") and
+    the marks from before the change, so they can fetch just the rows past those marks.
+    Polling only runs while the frame on screen is subscribed. Loads wrapped with
+    after_baseline() read the marks before their query, so nothing committed between the two
+    is missed.
+    """
+
+    def __init__(self, controller, interval_ms=None):
+        self.controller = controller
+        self.interval_ms = interval_ms or int(os.getenv("CHANGE_FEED_INTERVAL_MS", "5000"))
+        self._subscribers = {}
+        self._marks = None
+        self._marks_lock = threading.Lock()
+        self._after_id = None
+        self._in_flight = False
+        self._stopped = False
+
+    #---Feed: Registers Frame---
+    def subscribe(self, owner, callback):
+        self._subscribers[id(owner)] = (owner, callback)
+        self._schedule()
+
+    #---Feed: Takes Baseline (runs on a worker thread)---
+    # Reads fresh marks just before a frame's full load, so the next poll compares against marks
+    # no newer than the rows on screen and reports anything committed after them.
+    def take_baseline(self):
+        try:
+            marks = fetch_marks()
+        except Exception as e:
+            print(f"Change feed baseline failed: {e}")
+            return
+        with self._marks_lock:
+            self._marks = marks
+
+    #---Feed: Removes Frame---
+    def unsubscribe(self, owner):
+        self._subscribers.pop(id(owner), None)
+
+    #---Feed: Visible Subscriber---
+    def _current_subscriber(self):
+        frame = getattr(self.controller, "current_frame", None)
+        if frame is None:
+            return None
+        return self._subscribers.get(id(frame))
+
+    #---Feed: Schedules Next Poll---
+    def _schedule(self):
+        if self._after_id is None and not self._stopped and self._subscribers:
+            self._after_id = self.controller.after(self.interval_ms, self._tick)
+
+    #---Feed: Timer Tick---
+    def _tick(self):
+        self._after_id = None
+        if self._current_subscriber() is not None and not self._in_flight:
+            self._poll()
+        self._schedule()
+
+    #---Feed: Starts Poll---
+    def _poll(self):
+        self._in_flight = True
+        run_in_background(self.controller, self, "marks", fetch_marks,
+                          on_done=self._on_marks, on_error=self._on_error)
+
+    #---Feed: Compares Marks---
+    def _on_marks(self, marks):
+        self._in_flight = False
+        with self._marks_lock:
+            previous, self._marks = self._marks, marks
+        if previous is None:
+            return
+
+        topics = set()
+        if marks["job_id"] != previous["job_id"] or marks["job_updated_at"] != previous["job_updated_at"]:
+            topics.add("print_jobs")
+        if marks["payment_id"] != previous["payment_id"]:
+            topics.add("payments")
+        if marks["notif_id"] != previous["notif_id"]:
+            topics.add("notifications")
+        if not topics:
+            return
+
+        subscriber = self._current_subscriber()
+        if subscriber is None:
+            return
+        owner, callback = subscriber
+        try:
+            if hasattr(owner, "winfo_exists") and not owner.winfo_exists():
+                return
+            callback(topics, previous)
+        except Exception as e:
+            print(f"Error delivering changes to {type(owner).__name__}: {e}")
+
+    #---Feed: Handles Poll Error---
+    def _on_error(self, err):
+        self._in_flight = False
+        print(f"Change feed poll failed: {err}")
+
+    #---Feed: Stops Polling---
+    def stop(self):
+        self._stopped = True
+        if self._after_id is not None:
+            try:
+                self.controller.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+
+#---Feed: Load Wrapper---
+# Wraps a frame's full-load function so the feed's baseline marks are read first, on the same
+# worker thread. Returns fn unchanged if no feed is attached.
+def after_baseline(controller, fn):
+    feed = getattr(controller, "feed", None)
+    if feed is None:
+        return fn
+
+    def load(*args, **kwargs):
+        feed.take_baseline()
+        return fn(*args, **kwargs)
+    return load
+
+
+#---Feed: Subscription Lookup---
+# Frames call this with their controller; does nothing if no feed is attached.
+def subscribe_changes(controller, owner, callback):
+    feed = getattr(controller, "feed", None)
+    if feed is not None:
+        feed.subscribe(owner, callback)
@@ -0,0 +1,97 @@
+import threading
+
+from utils import db_connection
+
+# Queue order of print_jobs, highest first; statuses not listed (e.g. Voided) sort last.
+STATUS_PRIORITY = {
+    "Paid": 7, "Cash": 6, "Pending": 5, "Approved": 4,
+    "In Progress": 3, "Declined": 2, "Completed": 1
+}
+STATUS_PRIORITY_SQL = ("CASE status "
+                       + " ".join(f"WHEN '{status}' THEN {priority}" for status, priority in STATUS_PRIORITY.items())
+                       + " ELSE 0 END")
+
+# Idempotent (MariaDB IF NOT EXISTS) so they can run on every start.
+# The queue index lists every column the admin print list sorts by, in one direction, so
+# "ORDER BY status_priority DESC, updated_at DESC, created_at DESC, job_id DESC" is a backward index scan.
+MIGRATIONS = [
+    ("print_jobs.status_priority",
+     f"ALTER TABLE print_jobs ADD COLUMN IF NOT EXISTS status_priority tinyint AS ({STATUS_PRIORITY_SQL}) PERSISTENT"),
+    ("print_jobs queue order",
+     "CREATE INDEX IF NOT EXISTS idx_jobs_queue ON print_jobs (status_priority, updated_at, created_at, job_id)"),
+    ("print_jobs last update",
+     "CREATE INDEX IF NOT EXISTS idx_jobs_updated_at ON print_jobs (updated_at)"),
+    ("print_jobs per user",
+     "CREATE INDEX IF NOT EXISTS idx_jobs_user_created ON print_jobs (user_id, created_at)"),
+    ("payments by time",
+     "CREATE INDEX IF NOT EXISTS idx_payments_timestamp ON payments (payment_timestamp)"),
+    ("notifications per user",
+     "CREATE INDEX IF NOT EXISTS idx_notifications_user_created ON notifications (user_id, created_at)"),
+    ("files content address",
+     "ALTER TABLE files ADD COLUMN IF NOT EXISTS content_hash char(64) DEFAULT NULL AFTER file_type, "
+     "ADD COLUMN IF NOT EXISTS size_bytes bigint DEFAULT NULL AFTER content_hash"),
+    ("files by content",
+     "CREATE INDEX IF NOT EXISTS idx_files_content_hash ON files (content_hash)"),
+    ("outbound email queue",
+     "CREATE TABLE IF NOT EXISTS email_queue ("
+     "email_id bigint NOT NULL AUTO_INCREMENT PRIMARY KEY, "
+     "recipient varchar(255) NOT NULL, "
+     "subject varchar(255) NOT NULL, "
+     "html_body mediumtext NOT NULL, "
+     "priority tinyint NOT NULL DEFAULT 5, "
+     "status enum('queued','sending','sent','failed') NOT NULL DEFAULT 'queued', "
+     "attempts int NOT NULL DEFAULT 0, "
+     "next_attempt_at datetime NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+     "last_error varchar(500) DEFAULT NULL, "
+     "claimed_by varchar(64) DEFAULT NULL, "
+     "claimed_at datetime DEFAULT NULL, "
+     "created_at datetime NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+     "sent_at datetime DEFAULT NULL, "
+     "KEY idx_email_due (status, next_attempt_at, priority, email_id), "
+     "KEY idx_email_claim (claimed_by)"
+     ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"),
+]
+
+_ensure_lock = threading.Lock()
+_ensured = False
+
+
+#---Migrations: Applies All---
+def apply_migrations(cursor, verbose=False):
+    for name, statement in MIGRATIONS:
+        cursor.execute(statement)
+        if verbose:
+            print(f"Applied: {name}")
+
+
+#---Migrations: Ensures Schema---
+# Runs once per process on its own connection, before the first query that needs the new columns.
+def ensure_schema():
+    global _ensured
+    if _ensured:
+        return
+    with _ensure_lock:
+        if _ensured:
+            return
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                apply_migrations(cursor)
+            finally:
+                cursor.close()
+        _ensured = True
+
+
+#---Migrations: Command---
+# Usage: python db_migrate.py
+def main():
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            apply_migrations(cursor, verbose=True)
+        finally:
+            cursor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import mysql.connector
+
+
+#---Pool: Borrowed Connection Wrapper---
+class PooledConnection:
+    """Wraps a live MySQL connection; close() hands it back to the pool instead of dropping it."""
+
+    def __init__(self, pool, raw_conn):
+        self._pool = pool
+        self._raw = raw_conn
+
+    def __getattr__(self, name):
+        raw = self.__dict__.get("_raw")
+        if raw is None:
+            raise mysql.connector.errors.OperationalError("Connection was already returned to the pool.")
+        return getattr(raw, name)
+
+    # Callers guard close() with is_connected(); answering from local state saves a ping round trip.
+    # A dead socket is caught when the connection is reset on release.
+    def is_connected(self):
+        return self._raw is not None
+
+    def close(self):
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool._release(raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self._raw is not None:
+            try:
+                self._raw.rollback()
+            except mysql.connector.Error:
+                pass
+        self.close()
+        return False
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+#---Pool: Connection Pool---
+class ConnectionPool:
+    """Thread-safe pool of warm MySQL connections with ping-on-borrow and usage counters."""
+
+    def __init__(self, size=5, timeout=10.0, ping_after=30.0, **connect_args):
+        self.size = max(1, int(size))
+        self.timeout = float(timeout)
+        self.ping_after = float(ping_after)
+        self.connect_args = connect_args
+
+        self._idle = deque()
+        self._open_count = 0
+        self._cond = threading.Condition()
+        self._stats = {
+            "borrows": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "handshakes": 0,
+            "handshake_time": 0.0,
+            "reconnects": 0,
+            "discarded": 0,
+        }
+
+    #---Pool: Opens Raw Connection---
+    def _connect(self):
+        started = time.perf_counter()
+        raw = mysql.connector.connect(**self.connect_args)
+        elapsed = time.perf_counter() - started
+        with self._cond:
+            self._stats["handshakes"] += 1
+            self._stats["handshake_time"] += elapsed
+        return raw
+
+    #---Pool: Health Check---
+    def _ensure_alive(self, raw, idle_since):
+        if time.monotonic() - idle_since < self.ping_after:
+            return raw
+        try:
+            raw.ping(reconnect=False)
+            return raw
+        except mysql.connector.Error:
+            pass
+        try:
+            raw.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._stats["reconnects"] += 1
+        return self._connect()
+
+    #---Pool: Borrows Connection---
+    def acquire(self, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited_from = None
+
+        with self._cond:
+            while not self._idle and self._open_count >= self.size:
+                if waited_from is None:
+                    waited_from = time.perf_counter()
+                    self._stats["waits"] += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["wait_time"] += time.perf_counter() - waited_from
+                    raise mysql.connector.errors.PoolError(
+                        f"No database connection became free within {timeout:g}s (pool size {self.size})."
+                    )
+                self._cond.wait(remaining)
+
+            if waited_from is not None:
+                self._stats["wait_time"] += time.perf_counter() - waited_from
+            self._stats["borrows"] += 1
+
+            if self._idle:
+                raw, idle_since = self._idle.pop()
+            else:
+                raw, idle_since = None, None
+                self._open_count += 1
+
+        try:
+            if raw is None:
+                raw = self._connect()
+            else:
+                raw = self._ensure_alive(raw, idle_since)
+        except Exception:
+            with self._cond:
+                self._open_count -= 1
+                self._cond.notify()
+            raise
+
+        return PooledConnection(self, raw)
+
+    #---Pool: Returns Connection---
+    def _release(self, raw):
+        keep = True
+        try:
+            # Ends any open transaction so the next borrower does not inherit a stale snapshot
+            raw.rollback()
+        except Exception:
+            keep = False
+
+        with self._cond:
+            if keep:
+                self._idle.append((raw, time.monotonic()))
+            else:
+                self._open_count -= 1
+                self._stats["discarded"] += 1
+            self._cond.notify()
+
+        if not keep:
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+    #---Pool: Context Manager---
+    @contextmanager
+    def connection(self, timeout=None):
+        conn = self.acquire(timeout)
+        with conn:
+            yield conn
+
+    #---Pool: Closes Idle Connections---
+    def close_all(self):
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open_count -= len(idle)
+        for raw, _ in idle:
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+    #---Pool: Counter Snapshot---
+    def stats(self):
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot["size"] = self.size
+            snapshot["open"] = self._open_count
+            snapshot["idle"] = len(self._idle)
+        handshakes = snapshot["handshakes"]
+        snapshot["avg_handshake_ms"] = (snapshot["handshake_time"] / handshakes * 1000) if handshakes else 0.0
+        # Every borrow beyond the first handshake of each connection reused a warm one
+        snapshot["handshakes_saved"] = max(0, snapshot["borrows"] - handshakes)
+        snapshot["est_time_saved_ms"] = snapshot["handshakes_saved"] * snapshot["avg_handshake_ms"]
+        return snapshot
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# Threads that may each hold a connection at once: the Tk thread, the change feed poller and the
+# mail worker, on top of the TaskRunner workers.
+BACKGROUND_BORROWERS = 3
+POOL_HEADROOM = 2
+
+
+#---Pool: Default Size---
+def default_pool_size():
+    return int(os.getenv("UI_WORKERS", "4")) + BACKGROUND_BORROWERS + POOL_HEADROOM
+
+
+#---Pool: Shared Instance---
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    size=int(os.getenv("DB_POOL_SIZE") or default_pool_size()),
+                    timeout=float(os.getenv("DB_POOL_TIMEOUT", "10")),
+                    ping_after=float(os.getenv("DB_POOL_PING_AFTER", "30")),
+                    host=os.getenv("DB_HOST", "localhost"),
+                    user=os.getenv("DB_USER", "root"),
+                    password=os.getenv("DB_PASS", ""),
+                    database=os.getenv("DB_NAME", "copy_corner_db"),
+                )
+                atexit.register(_pool.close_all)
+    return _pool
+
+
+#---Pool: Counter Snapshot---
+def pool_stats():
+    return get_pool().stats()
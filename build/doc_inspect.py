@@ -0,0 +1,207 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from file_store import STORE_ROOT
+
+CACHE_DIR = STORE_ROOT / "inspect"
+CACHE_VERSION = 2
+# A page counts as coloured when more than this share of its pixels is noticeably saturated.
+COLOR_PAGE_THRESHOLD = 0.001
+SATURATION_DELTA = 40
+# Pages are rendered as thumbnails no longer than this many pixels on their long side.
+COVERAGE_SIZE = 96
+CHUNK_SIZE = 1024 * 1024
+PAGE_PATTERN = re.compile(rb"/Type\s{0,32}/Page(?![a-zA-Z])")
+# Longer than any match plus its one-byte lookahead, so a match is never split between chunks.
+PAGE_SCAN_OVERLAP = 64
+# Inspection results kept in memory, least recently used dropped first; the rest stay on disk.
+MEMORY_CACHE_SIZE = 256
+
+_executor = None
+_executor_lock = threading.Lock()
+_memory_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+#---Inspect: PDF Page Count---
+# pypdf when installed, otherwise a chunked scan for page objects that is good enough for ordinary PDFs.
+def _pdf_page_count(path):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        PdfReader = None
+    if PdfReader is not None:
+        return len(PdfReader(path).pages)
+    count = 0
+    tail = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            buffer = tail + chunk
+            # Matches starting in the last PAGE_SCAN_OVERLAP bytes are counted with the next chunk
+            cutoff = len(buffer) if not chunk else len(buffer) - PAGE_SCAN_OVERLAP
+            count += sum(1 for match in PAGE_PATTERN.finditer(buffer) if match.start() < cutoff)
+            if not chunk:
+                break
+            tail = buffer[max(cutoff, 0):]
+    return count or None
+
+
+#---Inspect: Coloured Share of a Pixmap---
+def _colored_share(pix):
+    samples = pix.samples
+    reds, greens, blues = samples[0::3], samples[1::3], samples[2::3]
+    colored = sum(1 for r, g, b in zip(reds, greens, blues) if max(r, g, b) - min(r, g, b) > SATURATION_DELTA)
+    total = pix.width * pix.height
+    return colored / total if total else 0.0
+
+
+#---Inspect: PDF Colour Coverage---
+# Needs PyMuPDF to render pages; returns None without it. Each page is rendered as a small
+# thumbnail, which is plenty to tell a coloured page from a black-and-white one.
+def _pdf_color_coverage(path):
+    try:
+        import fitz
+    except ImportError:
+        return None
+    coverage = []
+    with fitz.open(path) as doc:
+        for page in doc:
+            scale = COVERAGE_SIZE / max(page.rect.width, page.rect.height, 1)
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=fitz.csRGB, alpha=False)
+            # A page of one colour (usually blank white) needs no pixel scan
+            if pix.is_unicolor:
+                r, g, b = pix.pixel(0, 0)
+                coverage.append(1.0 if max(r, g, b) - min(r, g, b) > SATURATION_DELTA else 0.0)
+            else:
+                coverage.append(_colored_share(pix))
+    return coverage
+
+
+#---Inspect: DOCX Page Count---
+# Word records the page count in docProps/app.xml when it saves the file.
+def _docx_page_count(path):
+    with zipfile.ZipFile(path) as archive:
+        try:
+            app_xml = archive.read("docProps/app.xml").decode("utf-8", "ignore")
+        except KeyError:
+            return None
+    match = re.search(r"<Pages>(\d+)</Pages>", app_xml)
+    return int(match.group(1)) if match else None
+
+
+#---Inspect: Reads Document (runs in the worker process)---
+def _inspect(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".pdf":
+        pages = _pdf_page_count(path)
+        coverage = _pdf_color_coverage(path)
+    elif ext == ".docx":
+        pages = _docx_page_count(path)
+        coverage = None
+    else:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+    color_pages = None
+    if coverage is not None:
+        color_pages = sum(1 for share in coverage if share > COLOR_PAGE_THRESHOLD)
+    return {"pages": pages, "color_pages": color_pages, "coverage": coverage}
+
+
+#---Inspect: Hashes File---
+def _hash_file(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+#---Inspect: Memory Cache---
+def _cache_get(content_hash):
+    with _cache_lock:
+        result = _memory_cache.get(content_hash)
+        if result is not None:
+            _memory_cache.move_to_end(content_hash)
+        return result
+
+
+def _cache_put(content_hash, result):
+    with _cache_lock:
+        _memory_cache[content_hash] = result
+        _memory_cache.move_to_end(content_hash)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+#---Inspect: Worker Process Pool---
+# Spawned rather than forked: the app process has Tk and worker threads running, which a
+# forked child would inherit in an undefined state.
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        return _executor
+
+
+#---Inspect: Inspects File (runs on a worker thread)---
+# Results are cached by content hash in memory and under uploads/inspect, so the same document
+# is only parsed once. The parsing itself runs in a separate process. Pass content_hash when it
+# is already known (store_file returns it) to skip hashing the file again.
+def inspect_file(path, content_hash=None):
+    if content_hash is None:
+        content_hash = _hash_file(path)
+    result = _cache_get(content_hash)
+    if result is not None:
+        return result
+
+    cache_path = CACHE_DIR / f"{content_hash}.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("version") == CACHE_VERSION:
+            _cache_put(content_hash, cached)
+            return cached
+    except (OSError, ValueError):
+        pass
+
+    result = _get_executor().submit(_inspect, str(path)).result()
+    result.update({"version": CACHE_VERSION, "content_hash": content_hash})
+    _cache_put(content_hash, result)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Could not cache inspection result: {e}")
+    return result
+
+
+#---Inspect: Suggested Colour Option---
+# Maps coverage to the PrinterFrame choices ("bw", "pc", "color"); None when coverage is unknown.
+def suggest_color_option(result):
+    color_pages, pages = result.get("color_pages"), result.get("pages")
+    if color_pages is None or not pages:
+        return None
+    if color_pages == 0:
+        return "bw"
+    return "color" if color_pages >= pages else "pc"
+
+
+#---Inspect: Shuts Down Worker---
+def shutdown():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
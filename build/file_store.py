@@ -0,0 +1,204 @@
+import argparse
+import hashlib
+import os
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+
+STORE_ROOT = Path(os.getenv("UPLOAD_DIR", Path(__file__).parent / "uploads"))
+# files.file_path holds paths under this prefix (legacy rows: "uploads\\<name>"), resolved against
+# STORE_ROOT when read, so the database stays valid if the install or UPLOAD_DIR moves.
+STORED_PREFIX = "uploads"
+BLOB_DIR = STORE_ROOT / "blobs"
+TMP_DIR = STORE_ROOT / "tmp"
+CHUNK_SIZE = 1024 * 1024
+# Blobs and temp files younger than this are left alone by the collector; an upload may still be
+# between writing its blob and committing the files row that references it.
+GC_GRACE_SECONDS = 3600
+
+
+#---Store: Copy Progress---
+# Written by the worker thread, read by the UI on its own timer.
+class CopyProgress:
+    def __init__(self, total=0):
+        self._lock = threading.Lock()
+        self.total = total
+        self.done = 0
+
+    def advance(self, count):
+        with self._lock:
+            self.done += count
+
+    def fraction(self):
+        with self._lock:
+            return min(self.done / self.total, 1.0) if self.total else 0.0
+
+
+#---Store: Blob Path---
+def blob_path(content_hash):
+    return BLOB_DIR / content_hash[:2] / content_hash
+
+
+#---Store: Path For Database---
+def stored_path(path):
+    relative = Path(path).resolve().relative_to(STORE_ROOT.resolve())
+    return "/".join((STORED_PREFIX,) + relative.parts)
+
+
+#---Store: Path From Database---
+# Accepts new "uploads/..." paths, legacy "uploads\\..." ones and absolute paths from any machine
+# (e.g. "D:\\...\\uploads\\x.pdf"); anything under an uploads folder is remapped onto STORE_ROOT.
+def resolve_stored_path(value):
+    text = str(value).replace("\\", "/")
+    parts = [part for part in text.split("/") if part]
+    lowered = [part.lower() for part in parts]
+    if STORED_PREFIX in lowered:
+        last = len(lowered) - 1 - lowered[::-1].index(STORED_PREFIX)
+        return STORE_ROOT.joinpath(*parts[last + 1:])
+    path = Path(text)
+    if path.is_absolute() or re.match(r"^[A-Za-z]:/", text):
+        return path
+    return Path(__file__).parent / path
+
+
+#---Store: Saves File (runs on a worker thread)---
+# Streams the source in chunks, hashing as it copies. If a blob with the same hash already
+# exists the new copy is dropped and the existing blob is reused.
+# Returns (content_hash, size_bytes, path for files.file_path).
+def store_file(source_path, progress=None, chunk_size=CHUNK_SIZE):
+    TMP_DIR.mkdir(parents=True, exist_ok=True)
+    temp_path = TMP_DIR / f"{uuid.uuid4().hex}.part"
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(source_path, "rb") as src, open(temp_path, "wb") as dst:
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                dst.write(chunk)
+                size += len(chunk)
+                if progress is not None:
+                    progress.advance(len(chunk))
+            dst.flush()
+            os.fsync(dst.fileno())
+
+        content_hash = digest.hexdigest()
+        target = blob_path(content_hash)
+        if target.exists():
+            os.utime(target)
+            temp_path.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temp_path, target)
+        return content_hash, size, stored_path(target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+#---Store: Kernel Copy---
+# Tries copy_file_range, then sendfile (file-to-file works on Linux); returns bytes copied
+# so far, which is 0 if neither call is usable and the caller should fall back to read/write.
+def _kernel_copy(src_fd, dst_fd, size, progress):
+    copied = 0
+    for name in ("copy_file_range", "sendfile"):
+        call = getattr(os, name, None)
+        if call is None:
+            continue
+        try:
+            while copied < size:
+                if name == "copy_file_range":
+                    sent = call(src_fd, dst_fd, size - copied)
+                else:
+                    sent = call(dst_fd, src_fd, copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+                if progress is not None:
+                    progress.advance(sent)
+            return copied
+        except OSError:
+            if copied:
+                raise
+    return copied
+
+
+#---Store: Exports File (runs on a worker thread)---
+# Copies a stored file (a files.file_path value) to dest_path without pulling it through
+# Python buffers where the OS allows.
+def export_file(source_path, dest_path, progress=None, chunk_size=CHUNK_SIZE):
+    source_path = resolve_stored_path(source_path)
+    size = os.path.getsize(source_path)
+    with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+        copied = _kernel_copy(src.fileno(), dst.fileno(), size, progress)
+        if copied < size:
+            src.seek(copied)
+            dst.seek(copied)
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                dst.write(chunk)
+                if progress is not None:
+                    progress.advance(len(chunk))
+    return size
+
+
+#---Store: Collects Orphaned Blobs---
+# Deletes blobs no files row references, plus stale temp files from interrupted uploads.
+# Returns (files removed, bytes freed).
+def collect_garbage(dry_run=False, grace_seconds=GC_GRACE_SECONDS):
+    from utils import db_connection
+
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT DISTINCT content_hash FROM files WHERE content_hash IS NOT NULL")
+            referenced = {row[0] for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    cutoff = time.time() - grace_seconds
+    candidates = []
+    if BLOB_DIR.exists():
+        candidates += [path for path in BLOB_DIR.glob("*/*") if path.name not in referenced]
+    if TMP_DIR.exists():
+        candidates += list(TMP_DIR.glob("*.part"))
+
+    removed = freed = 0
+    for path in candidates:
+        try:
+            stat = path.stat()
+            if stat.st_mtime > cutoff:
+                continue
+            if not dry_run:
+                path.unlink()
+            removed += 1
+            freed += stat.st_size
+        except FileNotFoundError:
+            continue
+    return removed, freed
+
+
+#---Store: Command---
+# Usage: python file_store.py gc [--dry-run]
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the upload blob store.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    gc_parser = subparsers.add_parser("gc", help="remove blobs no longer referenced by the files table")
+    gc_parser.add_argument("--dry-run", action="store_true", help="only report what would be removed")
+    gc_parser.add_argument("--grace", type=int, default=GC_GRACE_SECONDS,
+                           help="skip files modified in the last N seconds (default: %(default)s)")
+    args = parser.parse_args()
+
+    removed, freed = collect_garbage(dry_run=args.dry_run, grace_seconds=args.grace)
+    verb = "Would remove" if args.dry_run else "Removed"
+    print(f"{verb} {removed} file(s), {freed / (1024 * 1024):.1f} MB.")
+
+
+if __name__ == "__main__":
+    main()
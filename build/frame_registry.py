@@ -0,0 +1,83 @@
+import importlib
+import threading
+
+import ui_profile
+from task_runner import run_in_background
+
+# Frame class name -> module it lives in. Modules are imported on first navigation, so the
+# admin screens (and pandas/matplotlib behind the report screen) never load for ordinary users.
+FRAME_MODULES = {
+    "LoginFrame": "login_frame",
+    "PrinterFrame": "printer_frame",
+    "UserFrame": "user_frame",
+    "HistoryFrame": "history_frame",
+    "PricesFrame": "prices_frame",
+    "HelpFrame": "help_frame",
+    "NotificationFrame": "notification_frame",
+    "AdminDashboardFrame": "admin_dashboard",
+    "AdminUserFrame": "admin_user",
+    "AdminPrintFrame": "admin_print",
+    "AdminReportFrame": "admin_report",
+    "AdminNotificationFrame": "admin_notification",
+    "AdminInventoryFrame": "admin_inventory",
+    "RegisterFrame": "register_frame",
+    "OTPFrame": "otp_frame",
+    "ForgotFrame": "forgot_frame",
+    "OTP1Frame": "otp1_frame",
+    "OTP2Frame": "otp2_frame",
+}
+
+# Screens a signed-in user or admin is likely to open next, imported in the background after login.
+PRELOAD_AFTER_LOGIN = {
+    "user": ["UserFrame", "NotificationFrame", "HistoryFrame", "PricesFrame", "HelpFrame"],
+    "admin": ["AdminPrintFrame", "AdminUserFrame", "AdminNotificationFrame", "AdminInventoryFrame",
+              "AdminReportFrame"],
+}
+
+# Refresh hooks show_frame calls, in this order, on frames that define them.
+LOAD_METHODS = (
+    "load_user_data", "load_user_requests", "load_history", "load_notifications",
+    "load_dashboard_data", "load_print_jobs", "load_users", "load_notifications_admin",
+    "load_products", "load_prices", "prepare_otp_entry",
+)
+
+
+#---Registry: Lazy Frame Classes---
+class FrameRegistry:
+    def __init__(self, controller):
+        self.controller = controller
+        self._classes = {}
+        self._lock = threading.Lock()
+
+    #---Registry: Frame Class---
+    # Imports the frame's module on first use; safe to call while a preload is importing it.
+    def get(self, name):
+        frame_class = self._classes.get(name)
+        if frame_class is None:
+            module_name = FRAME_MODULES[name]
+            with ui_profile.timed(f"import {module_name}"):
+                module = importlib.import_module(module_name)
+            frame_class = getattr(module, name)
+            with self._lock:
+                self._classes[name] = frame_class
+        return frame_class
+
+    #---Registry: Imports Modules (runs on a worker thread)---
+    def _import_frames(self, names):
+        for name in names:
+            if name in self._classes:
+                continue
+            try:
+                with ui_profile.timed(f"preload {FRAME_MODULES[name]}"):
+                    module = importlib.import_module(FRAME_MODULES[name])
+                with self._lock:
+                    self._classes[name] = getattr(module, name)
+            except Exception as e:
+                print(f"Error preloading {name}: {e}")
+
+    #---Registry: Preloads Likely Frames---
+    # role is "user" or "admin". Only imports; frames are still built when first shown.
+    def preload(self, role):
+        names = [name for name in PRELOAD_AFTER_LOGIN.get(role, []) if name not in self._classes]
+        if names:
+            run_in_background(self.controller, self, f"preload_{role}", self._import_frames, names)
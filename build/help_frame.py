@@ -1,12 +1,13 @@
 from pathlib import Path
 import tkinter as tk
-from tkinter import Canvas, Button, PhotoImage, Label, messagebox, filedialog
+from tkinter import Canvas, Button, Label, messagebox, filedialog
 import math
 import sys
 import subprocess
 import shutil
 import os
 from utils import get_db_connection, round_rectangle
+from image_cache import load_image
 
 from printer_frame import PrinterFrame
 from user_frame import UserFrame
@@ -78,15 +79,15 @@ class HelpFrame(tk.Frame):
         self.canvas = canvas
 
         try:
-            self.image_image_2 = PhotoImage(file=relative_to_assets("image_2.png"))
-            self.image_image_3 = PhotoImage(file=relative_to_assets("image_3.png"))
-            self.image_image_4 = PhotoImage(file=relative_to_assets("image_4.png"))
-            self.button_image_7 = PhotoImage(file=relative_to_assets("button_7.png"))
-            self.button_image_8 = PhotoImage(file=relative_to_assets("button_8.png"))
-            self.icon_edit = PhotoImage(file=relative_to_assets("account.png"))
-            self.icon_pr = PhotoImage(file=relative_to_assets("image_6.png"))
-            self.icon_bell = PhotoImage(file=relative_to_assets("image_8.png"))
-            self.icon_sheet = PhotoImage(file=relative_to_assets("image_7.png"))
+            self.image_image_2 = load_image(relative_to_assets("image_2.png"))
+            self.image_image_3 = load_image(relative_to_assets("image_3.png"))
+            self.image_image_4 = load_image(relative_to_assets("image_4.png"))
+            self.button_image_7 = load_image(relative_to_assets("button_7.png"))
+            self.button_image_8 = load_image(relative_to_assets("button_8.png"))
+            self.icon_edit = load_image(relative_to_assets("account.png"))
+            self.icon_pr = load_image(relative_to_assets("image_6.png"))
+            self.icon_bell = load_image(relative_to_assets("image_8.png"))
+            self.icon_sheet = load_image(relative_to_assets("image_7.png"))
         except tk.TclError as e:
             messagebox.showerror("Asset Error", f"Could not load assets for HelpFrame:\n{e}")
             return
@@ -1,11 +1,12 @@
 from pathlib import Path
-from tkinter import Tk, Canvas, PhotoImage, messagebox, Frame, Label, Scrollbar, ttk
+from tkinter import Tk, Canvas, PhotoImage, messagebox, Frame, Scrollbar
 import tkinter as tk
 import subprocess
 import sys
-import mysql.connector
 from datetime import datetime
-from utils import get_db_connection, round_rectangle
+from utils import db_connection, round_rectangle
+from task_runner import run_in_background
+from virtual_list import VirtualList
 
 from printer_frame import PrinterFrame
 
@@ -43,26 +44,15 @@ class HistoryFrame(tk.Frame):
         history_container = Frame(self, bg=WHITE)
         history_container.place(x=HISTORY_X, y=HISTORY_Y, width=HISTORY_W, height=HISTORY_H)
 
-        self.history_canvas = Canvas(history_container, bg=WHITE, bd=0, highlightthickness=0)
-        self.history_scrollbar = ttk.Scrollbar(history_container, orient="vertical", command=self.history_canvas.yview)
-        self.history_canvas.configure(yscrollcommand=self.history_scrollbar.set)
-
-        self.history_scrollbar.pack(side="right", fill="y")
-        self.history_canvas.pack(side="left", fill="both", expand=True)
-
-        self.history_content_frame = Frame(self.history_canvas, bg=WHITE)
-        self.history_content_frame_window = self.history_canvas.create_window((0, 0), window=self.history_content_frame,
-                                                                              anchor="nw")
-
-        self.history_content_frame.bind("<Configure>", self._on_frame_configure)
-        self.history_canvas.bind("<Configure>",
-                                 lambda e: self.history_canvas.itemconfig(self.history_content_frame_window,
-                                                                          width=e.width))
-
-        self.history_canvas.bind("<Enter>", self._bind_mousewheel)
-        self.history_canvas.bind("<Leave>", self._unbind_mousewheel)
-        self.history_content_frame.bind("<Enter>", self._bind_mousewheel)
-        self.history_content_frame.bind("<Leave>", self._unbind_mousewheel)
+        self.history_list = VirtualList(
+            history_container,
+            columns=[{"weight": 1, "padx": (30, 10), "anchor": "nw"}, {"weight": 5, "padx": 10, "anchor": "nw"},
+                     {"weight": 3, "padx": (10, 30), "anchor": "ne", "justify": "right"}],
+            render=self.render_history_row, key=lambda item: item["job_id"], row_height=64,
+            empty_text="No print history found.", font=("Inter Bold", 16), fg=BLACK, bg=WHITE, alt_bg=WHITE,
+            hover_bg="#F5F5F5", select_bg="#F5F5F5"
+        )
+        self.history_list.pack(side="left", fill="both", expand=True)
 
         back_rect = round_rectangle(canvas, 31, 450, 140, 493, r=15, fill="#000000", outline="#000000")
         back_text = canvas.create_text(60, 457, anchor="nw", text="Back", fill="#FFFFFF", font=("Inter Bold", 20))
@@ -78,88 +68,51 @@ class HistoryFrame(tk.Frame):
 
     #---Loads History Data---
     def load_history(self):
-        self.fetch_and_display_history(self.history_content_frame, self.user_id)
+        if self.user_id is None:
+            self.history_list.empty_label.config(text="Could not load history (User ID missing).", fg="red")
+            self.history_list.set_items([])
+            return
+        self.history_list.empty_label.config(text="No print history found.", fg="#888888")
+        run_in_background(self.controller, self, "history", self.fetch_history, self.user_id,
+                          on_done=self.display_history, on_error=self.on_history_error)
 
     #---Navigation: Go Back---
     def go_back(self, event=None):
         self.controller.geometry("859x534")
         self.controller.show_frame(PrinterFrame)
 
-    #---Database: Fetches History---
-    def fetch_and_display_history(self, frame, target_user_id):
-        for widget in frame.winfo_children():
-            widget.destroy()
-
-        if target_user_id is None:
-            Label(frame, text="Could not load history (User ID missing).",
-                  font=("Inter Bold", 16), bg=WHITE, fg="red").pack(pady=20, padx=10)
-            return
-        conn = None
-        try:
-            conn = get_db_connection()
-            if not conn: return
-
+    #---Database: Fetches History (runs on a worker thread)---
+    def fetch_history(self, target_user_id):
+        with db_connection() as conn:
             cursor = conn.cursor(dictionary=True)
-            sql_query = """
-                SELECT pj.job_id, f.file_name, pj.created_at
-                FROM print_jobs pj
-                LEFT JOIN files f ON pj.file_id = f.file_id
-                WHERE pj.user_id = %s
-                ORDER BY pj.created_at DESC
-            """
-            cursor.execute(sql_query, (target_user_id,))
-            history = cursor.fetchall()
-
-            if not history:
-                Label(frame, text="No print history found.",
-                      font=("Inter Bold", 16), bg=WHITE, fg="grey").pack(pady=20, padx=10)
-                return
-
-            frame.columnconfigure(0, weight=1)
-            frame.columnconfigure(1, weight=5)
-            frame.columnconfigure(2, weight=3)
-            row_index, item_number = 0, 1
-
-            for item in history:
-                job_id = item['job_id']
-                file_name = item.get('file_name', 'File not found')
-                created_at = item['created_at']
-                date_str = created_at.strftime("%Y-%m-%d") if created_at else "N/A"
-                time_str = created_at.strftime("%I:%M %p") if created_at else ""
-                full_time_str = f"{date_str}\n{time_str}".strip()
-
-                Label(frame, text=str(item_number), font=("Inter Bold", 16), bg=WHITE, anchor="nw").grid(row=row_index,
-                                                                                                         column=0,
-                                                                                                         padx=(30, 10),
-                                                                                                         pady=10,
-                                                                                                         sticky="nw")
-                Label(frame, text=file_name, font=("Inter Bold", 16), bg=WHITE, anchor="nw", wraplength=350,
-                      justify="left").grid(row=row_index, column=1, padx=10, pady=10, sticky="nw")
-                Label(frame, text=full_time_str, font=("Inter Bold", 16), bg=WHITE, anchor="ne", justify="right").grid(
-                    row=row_index, column=2, padx=(10, 30), pady=10, sticky="ne")
-                ttk.Separator(frame, orient="horizontal").grid(row=row_index + 1, column=0, columnspan=3, sticky="ew",
-                                                               padx=5)
-                row_index += 2
-                item_number += 1
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Failed to fetch history: {err}")
-        finally:
-            if conn and conn.is_connected():
-                if 'cursor' in locals() and cursor: cursor.close()
-                conn.close()
-
-    #---Updates Scrollable Area---
-    def _on_frame_configure(self, event):
-        self.history_canvas.configure(scrollregion=self.history_canvas.bbox("all"))
-
-    #---Handles Mouse Wheel---
-    def _on_mousewheel(self, event):
-        self.history_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-    #---Binds Mouse Wheel---
-    def _bind_mousewheel(self, event):
-        self.bind_all("<MouseWheel>", self._on_mousewheel)
-
-    #---Unbinds Mouse Wheel---
-    def _unbind_mousewheel(self, event):
-        self.unbind_all("<MouseWheel>")
\ No newline at end of file
+            try:
+                sql_query = """
+                    SELECT pj.job_id, f.file_name, pj.created_at
+                    FROM print_jobs pj
+                    LEFT JOIN files f ON pj.file_id = f.file_id
+                    WHERE pj.user_id = %s
+                    ORDER BY pj.created_at DESC
+                """
+                cursor.execute(sql_query, (target_user_id,))
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    #---Handles Fetch Error---
+    def on_history_error(self, err):
+        messagebox.showerror("Database Error", f"Failed to fetch history: {err}")
+
+    #---Displays History---
+    def display_history(self, history):
+        for item_number, item in enumerate(history, start=1):
+            item['item_number'] = item_number
+        self.history_list.set_items(history, reset_scroll=True)
+
+    #---Formats History Row---
+    def render_history_row(self, item):
+        file_name = item.get('file_name') or 'File not found'
+        file_name = file_name[:32] + "..." if len(file_name) > 35 else file_name
+        created_at = item['created_at']
+        date_str = created_at.strftime("%Y-%m-%d") if created_at else "N/A"
+        time_str = created_at.strftime("%I:%M %p") if created_at else ""
+        return [str(item['item_number']), file_name, f"{date_str}\n{time_str}".strip()]
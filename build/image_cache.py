@@ -0,0 +1,36 @@
+import hashlib
+from pathlib import Path
+from tkinter import PhotoImage
+
+# Decoded images keyed by file content. The asset folders carry many copies of the same icons,
+# so frames that load the same picture from different folders share one PhotoImage.
+_images = {}
+_digests = {}
+
+
+#---Images: Loads Shared PhotoImage---
+# Must be called on the Tk thread. A missing or unreadable file raises tk.TclError like PhotoImage does.
+# The returned image is shared; do not modify it in place.
+def load_image(path):
+    key = str(Path(path).resolve())
+    digest = _digests.get(key)
+    if digest is None:
+        try:
+            with open(key, "rb") as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            return PhotoImage(file=key)
+        _digests[key] = digest
+
+    image = _images.get(digest)
+    if image is None:
+        image = PhotoImage(file=key)
+        _images[digest] = image
+    return image
+
+
+#---Images: Clears Cache---
+# Called when the main window is destroyed; the images belong to its Tk interpreter.
+def clear():
+    _images.clear()
+    _digests.clear()
@@ -1,9 +1,10 @@
 from pathlib import Path
 import tkinter as tk
-from tkinter import Canvas, Entry, Text, Button, PhotoImage, messagebox, font
+from tkinter import Canvas, Entry, Text, Button, messagebox, font
 import mysql.connector
 import bcrypt
 from utils import get_db_connection, round_rectangle
+from image_cache import load_image
 
 
 class PlaceholderEntry(Entry):
@@ -106,11 +107,11 @@ class LoginFrame(tk.Frame):
         try:
             self._eye_image = controller.eye_image
             self._eye_slash_image = controller.eye_slash_image
-            self._image_image_1 = PhotoImage(file=relative_to_assets("image_-1.png"))
-            self._image_image_2 = PhotoImage(file=relative_to_assets("image_2.png"))
-            self._image_image_3 = PhotoImage(file=relative_to_assets("image_3.png"))
-            self._image_image_4 = PhotoImage(file=relative_to_assets("image_4.png"))
-            self._image_image_5 = PhotoImage(file=relative_to_assets("image_5.png"))
+            self._image_image_1 = load_image(relative_to_assets("image_-1.png"))
+            self._image_image_2 = load_image(relative_to_assets("image_2.png"))
+            self._image_image_3 = load_image(relative_to_assets("image_3.png"))
+            self._image_image_4 = load_image(relative_to_assets("image_4.png"))
+            self._image_image_5 = load_image(relative_to_assets("image_5.png"))
         except tk.TclError as e:
             messagebox.showerror("Asset Error", f"Could not find assets in the 'frame0' folder.\n{e}", parent=self)
             if controller and controller.winfo_exists(): controller.destroy()
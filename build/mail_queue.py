@@ -0,0 +1,438 @@
+import argparse
+import os
+import queue
+import random
+import smtplib
+import socket
+import threading
+import time
+import uuid
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from html import escape
+
+from utils import db_connection
+from db_migrate import ensure_schema
+
+# Lower sends first: OTP codes go out ahead of broadcast mail.
+PRIORITY_OTP = 0
+PRIORITY_BULK = 5
+
+
+#---Mail: Settings---
+# Defaults match the old Gmail setup. For a local stand-in (python -m aiosmtpd -n -l localhost:8025)
+# use SMTP_HOST=localhost SMTP_PORT=8025 SMTP_STARTTLS=0 and leave EMAIL_PASS empty.
+def _settings():
+    return {
+        "host": os.getenv("SMTP_HOST", "smtp.gmail.com"),
+        "port": int(os.getenv("SMTP_PORT", "587")),
+        "starttls": os.getenv("SMTP_STARTTLS", "1") != "0",
+        "user": os.getenv("EMAIL_USER"),
+        "password": os.getenv("EMAIL_PASS"),
+        "sender": os.getenv("MAIL_FROM") or os.getenv("EMAIL_USER"),
+        "rate_per_minute": float(os.getenv("MAIL_RATE_PER_MIN", "30")),
+        "batch_size": int(os.getenv("MAIL_BATCH_SIZE", "20")),
+        "max_attempts": int(os.getenv("MAIL_MAX_ATTEMPTS", "5")),
+        "poll_seconds": float(os.getenv("MAIL_POLL_SECONDS", "30")),
+        "idle_seconds": float(os.getenv("MAIL_IDLE_SECONDS", "60")),
+    }
+
+
+#---Mail: Sender Address---
+def sender_address():
+    return _settings()["sender"]
+
+
+#---Mail: Queues Messages---
+# rows: iterable of (recipient, subject, html_body). Pass a cursor to queue inside the caller's
+# transaction (call ensure_schema() before opening it, and wake_worker() after committing);
+# otherwise they are committed here.
+def enqueue_many(rows, priority=PRIORITY_BULK, cursor=None):
+    rows = [(recipient, subject, html_body, priority) for recipient, subject, html_body in rows if recipient]
+    if not rows:
+        return 0
+    query = """
+        INSERT INTO email_queue (recipient, subject, html_body, priority, next_attempt_at)
+        VALUES (%s, %s, %s, %s, NOW())
+    """
+    if cursor is not None:
+        cursor.executemany(query, rows)
+    else:
+        ensure_schema()
+        with db_connection() as conn:
+            own_cursor = conn.cursor()
+            try:
+                own_cursor.executemany(query, rows)
+                conn.commit()
+            finally:
+                own_cursor.close()
+        wake_worker()
+    return len(rows)
+
+
+#---Mail: Queues One Message---
+def enqueue(recipient, subject, html_body, priority=PRIORITY_BULK, cursor=None):
+    return enqueue_many([(recipient, subject, html_body)], priority=priority, cursor=cursor) == 1
+
+
+# Messages handed over by the Tk thread, waiting for the worker to insert them.
+_handoff = queue.SimpleQueue()
+
+
+#---Mail: Queues From the Tk Thread---
+# Returns at once: the worker thread runs the INSERT (and ensure_schema) before its next batch,
+# so a click never waits on the database.
+def submit(recipient, subject, html_body, priority=PRIORITY_BULK):
+    if not recipient:
+        return False
+    _handoff.put((recipient, subject, html_body, priority))
+    start_worker().wake.set()
+    return True
+
+
+#---Mail: Stores Handed-Over Messages (runs on the worker thread)---
+# Rows that fail to insert go back on the hand-off queue for the next pass.
+def store_handoff():
+    rows = []
+    while True:
+        try:
+            rows.append(_handoff.get_nowait())
+        except queue.Empty:
+            break
+    stored = 0
+    try:
+        for priority in sorted({row[3] for row in rows}):
+            group = [row for row in rows if row[3] == priority]
+            stored += enqueue_many([row[:3] for row in group], priority=priority)
+            rows = [row for row in rows if row[3] != priority]
+    finally:
+        for row in rows:
+            _handoff.put(row)
+    return stored
+
+
+#---Mail: Notification Body---
+def render_notification_email(subject, message):
+    paragraphs = "".join(f"<p>{escape(line)}</p>" for line in message.splitlines() if line.strip())
+    return f"""
+        <html>
+        <body style="font-family: Arial, sans-serif; background-color: #f4f4f4; padding: 20px;">
+            <div style="max-width: 600px; margin: auto; background: white; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
+                <div style="background-color: #ffffff; padding: 20px; text-align: center;">
+                    <h2 style="color: #222;">{escape(subject)}</h2>
+                </div>
+                <div style="padding: 30px; color: #333;">
+                    <p>Hello,</p>
+                    {paragraphs}
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+
+#---Mail: Rate Limiter---
+# Token bucket; wait() blocks the worker thread until a send is allowed or stop is set.
+class RateLimiter:
+    def __init__(self, per_minute, burst=None):
+        self.rate = per_minute / 60.0
+        self.capacity = burst or max(1.0, per_minute / 6.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def wait(self, stop_event=None):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            delay = (1 - self.tokens) / self.rate
+            if stop_event is not None:
+                if stop_event.wait(delay):
+                    return False
+            else:
+                time.sleep(delay)
+
+
+#---Mail: Persistent SMTP Session---
+class SMTPSession:
+    """One SMTP connection that stays logged in between messages.
+
+    The session reconnects when the server has dropped it, and the worker closes it after a
+    quiet spell so an idle app does not hold a connection open.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.server = None
+        self.last_used = 0.0
+
+    def _connect(self):
+        server = smtplib.SMTP(self.settings["host"], self.settings["port"], timeout=30)
+        server.ehlo()
+        if self.settings["starttls"]:
+            server.starttls()
+            server.ehlo()
+        if self.settings["user"] and self.settings["password"]:
+            server.login(self.settings["user"], self.settings["password"])
+        self.server = server
+
+    def send(self, recipient, message):
+        for attempt in range(2):
+            if self.server is None:
+                self._connect()
+            try:
+                self.server.sendmail(self.settings["sender"], [recipient], message)
+                self.last_used = time.monotonic()
+                return
+            except (smtplib.SMTPServerDisconnected, ConnectionError, socket.timeout):
+                # Servers drop idle sessions; reconnect once before counting it as a failure
+                self.close()
+                if attempt:
+                    raise
+
+    def close_if_idle(self):
+        if self.server is not None and time.monotonic() - self.last_used > self.settings["idle_seconds"]:
+            self.close()
+
+    def close(self):
+        server, self.server = self.server, None
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+
+
+#---Mail: Classifies Send Errors---
+# Permanent rejections (5xx, refused recipients) are not retried; dropped connections and
+# temporary 4xx replies are.
+def is_permanent_error(error):
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    if isinstance(error, (smtplib.SMTPDataError, smtplib.SMTPSenderRefused)):
+        return getattr(error, "smtp_code", 500) >= 500
+    return False
+
+
+#---Mail: Retry Delay---
+# Seconds before attempt number `attempts` + 1: 30s doubling up to an hour, with +/-20% jitter
+# so a burst of failures does not retry in lockstep.
+def retry_delay(attempts, jitter=None):
+    if jitter is None:
+        jitter = random.uniform(0.8, 1.2)
+    return min(30 * 2 ** (attempts - 1), 3600) * jitter
+
+
+#---Mail: Builds MIME Message---
+def build_message(sender, recipient, subject, html_body):
+    message = MIMEMultipart("alternative")
+    message["From"] = sender
+    message["To"] = recipient
+    message["Subject"] = subject
+    message.attach(MIMEText(html_body, "html"))
+    return message.as_string()
+
+
+#---Mail: Background Sender---
+class MailWorker(threading.Thread):
+    """Drains email_queue on one persistent SMTP session.
+
+    Rows are claimed with an UPDATE tagged by this worker's id, so several app instances can share
+    the queue. Failures are retried with exponential backoff; permanent SMTP rejections and rows that
+    run out of attempts are marked failed with the last error.
+    """
+
+    STALE_CLAIM_MINUTES = 10
+
+    def __init__(self):
+        super().__init__(name="mail-worker", daemon=True)
+        self.settings = _settings()
+        self.worker_id = f"{socket.gethostname()[:40]}-{uuid.uuid4().hex[:12]}"
+        self.session = SMTPSession(self.settings)
+        self.limiter = RateLimiter(self.settings["rate_per_minute"])
+        self.wake = threading.Event()
+        self.stopping = threading.Event()
+
+    def run(self):
+        while not self.stopping.is_set():
+            try:
+                store_handoff()
+                sent_any = self.drain_once()
+            except Exception as e:
+                print(f"Mail worker error: {e}")
+                sent_any = False
+            if sent_any:
+                continue
+            self.session.close_if_idle()
+            self.wake.wait(self.settings["poll_seconds"])
+            self.wake.clear()
+        self.session.close()
+        try:
+            store_handoff()
+        except Exception as e:
+            print(f"Could not queue pending email: {e}")
+
+    #---Mail: Sends One Batch---
+    # Returns True when a batch was claimed, so the caller loops straight back for more.
+    def drain_once(self):
+        ensure_schema()
+        batch = self._claim_batch()
+        if not batch:
+            return False
+        pending = list(batch)
+        try:
+            while pending:
+                row = pending[0]
+                if not self.limiter.wait(self.stopping):
+                    break
+                try:
+                    message = build_message(self.settings["sender"], row["recipient"], row["subject"],
+                                            row["html_body"])
+                    self.session.send(row["recipient"], message)
+                    self._mark_sent(row["email_id"])
+                except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError,
+                        smtplib.SMTPSenderRefused) as e:
+                    self._mark_failed(row, e, permanent=is_permanent_error(e))
+                except (smtplib.SMTPException, OSError) as e:
+                    self.session.close()
+                    self._mark_failed(row, e, permanent=False)
+                pending.pop(0)
+        finally:
+            if pending:
+                self._release([row["email_id"] for row in pending])
+        return True
+
+    def _claim_batch(self):
+        with db_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute("""
+                    UPDATE email_queue SET status = 'queued', claimed_by = NULL
+                    WHERE status = 'sending' AND claimed_at < NOW() - INTERVAL %s MINUTE
+                """, (self.STALE_CLAIM_MINUTES,))
+                cursor.execute("""
+                    UPDATE email_queue SET status = 'sending', claimed_by = %s, claimed_at = NOW()
+                    WHERE status = 'queued' AND next_attempt_at <= NOW()
+                    ORDER BY priority, email_id
+                    LIMIT %s
+                """, (self.worker_id, self.settings["batch_size"]))
+                conn.commit()
+                cursor.execute("""
+                    SELECT email_id, recipient, subject, html_body, attempts
+                    FROM email_queue
+                    WHERE status = 'sending' AND claimed_by = %s
+                    ORDER BY priority, email_id
+                """, (self.worker_id,))
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def _execute(self, query, params):
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params)
+                conn.commit()
+            finally:
+                cursor.close()
+
+    def _mark_sent(self, email_id):
+        self._execute("""
+            UPDATE email_queue SET status = 'sent', sent_at = NOW(), attempts = attempts + 1,
+                                   claimed_by = NULL, last_error = NULL
+            WHERE email_id = %s
+        """, (email_id,))
+
+    def _mark_failed(self, row, error, permanent):
+        attempts = (row.get("attempts") or 0) + 1
+        message = str(error)[:500]
+        if permanent or attempts >= self.settings["max_attempts"]:
+            print(f"Giving up on email {row['email_id']} to {row['recipient']}: {message}")
+            self._execute("""
+                UPDATE email_queue SET status = 'failed', attempts = %s, last_error = %s, claimed_by = NULL
+                WHERE email_id = %s
+            """, (attempts, message, row["email_id"]))
+            return
+        delay = retry_delay(attempts)
+        print(f"Email {row['email_id']} failed (attempt {attempts}), retrying in {delay:.0f}s: {message}")
+        self._execute("""
+            UPDATE email_queue SET status = 'queued', attempts = %s, last_error = %s, claimed_by = NULL,
+                                   next_attempt_at = NOW() + INTERVAL %s SECOND
+            WHERE email_id = %s
+        """, (attempts, message, int(delay), row["email_id"]))
+
+    def _release(self, email_ids):
+        placeholders = ", ".join(["%s"] * len(email_ids))
+        self._execute(f"""
+            UPDATE email_queue SET status = 'queued', claimed_by = NULL
+            WHERE status = 'sending' AND email_id IN ({placeholders})
+        """, tuple(email_ids))
+
+    def stop(self, timeout=2.0):
+        self.stopping.set()
+        self.wake.set()
+        if self.is_alive():
+            self.join(timeout)
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+#---Mail: Starts Worker---
+def start_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = MailWorker()
+            _worker.start()
+        return _worker
+
+
+#---Mail: Wakes Worker---
+# Lets a queued OTP go out right away instead of waiting for the next poll.
+def wake_worker():
+    worker = _worker
+    if worker is not None:
+        worker.wake.set()
+
+
+#---Mail: Stops Worker---
+def stop_worker():
+    global _worker
+    with _worker_lock:
+        worker, _worker = _worker, None
+    if worker is not None:
+        worker.stop()
+
+
+#---Mail: Command---
+# Usage: python mail_queue.py drain            send everything that is due, then exit
+#        python mail_queue.py test <address>   queue and send one test message
+def main():
+    parser = argparse.ArgumentParser(description="Send queued email.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("drain", help="send all due messages and exit")
+    test_parser = subparsers.add_parser("test", help="queue a test message and send it")
+    test_parser.add_argument("recipient")
+    args = parser.parse_args()
+
+    if args.command == "test":
+        ensure_schema()
+        enqueue(args.recipient, "Copy Corner test message",
+                render_notification_email("Copy Corner test message", "If you can read this, mail works."),
+                priority=PRIORITY_OTP)
+
+    worker = MailWorker()
+    total = 0
+    while worker.drain_once():
+        total += 1
+    worker.session.close()
+    print(f"Processed {total} batch(es).")
+
+
+if __name__ == "__main__":
+    main()
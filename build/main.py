@@ -1,36 +1,42 @@
+import time
+
+STARTED_AT = time.perf_counter()
+
+import os
 import tkinter as tk
-from tkinter import PhotoImage, messagebox
+from tkinter import messagebox
 from pathlib import Path
+from db_pool import pool_stats
+from task_runner import TaskRunner
+from change_feed import ChangeFeed
+from db_migrate import ensure_schema
+from rollups import ensure_rollups
+from frame_registry import FrameRegistry, LOAD_METHODS
+from image_cache import load_image
+import image_cache
+import ui_profile
+import doc_inspect
+import mail_queue
 
-# --- Import all standard frames ---
-from login_frame import LoginFrame
-from printer_frame import PrinterFrame
-from user_frame import UserFrame
-from history_frame import HistoryFrame
-from prices_frame import PricesFrame
-from help_frame import HelpFrame
-from notification_frame import NotificationFrame
-
-# --- Import all ADMIN frames ---
-from admin_dashboard import AdminDashboardFrame
-from admin_user import AdminUserFrame
-from admin_print import AdminPrintFrame
-from admin_report import AdminReportFrame
-from admin_notification import AdminNotificationFrame
-from admin_inventory import AdminInventoryFrame  # <-- ADDED
-
-# --- Import NEW frames ---
-from register_frame import RegisterFrame
-from otp_frame import OTPFrame
-from forgot_frame import ForgotFrame
-from otp1_frame import OTP1Frame
-from otp2_frame import  OTP2Frame
+# Frame modules are imported by FrameRegistry when a screen is first shown.
 
 
 class MainApplication(tk.Tk):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # Frames hand their DB reads to this pool; results come back on the Tk thread
+        self.tasks = TaskRunner(self)
+        self.current_frame = None
+        # Polls table high-water marks so the visible frame can pull only new or changed rows
+        self.feed = ChangeFeed(self)
+        self.registry = FrameRegistry(self)
+        # Migrations and the first rollup backfill run here, before any screen opens a write transaction
+        self.tasks.submit(self, "prepare_database", self.prepare_database,
+                          on_error=lambda e: print(f"Error preparing database: {e}"))
+        # Sends queued OTP and notification email over one SMTP session
+        mail_queue.start_worker()
+
         self.user_id = None
         self.fullname = None
         self.admin_name = None
@@ -44,8 +50,8 @@ class MainApplication(tk.Tk):
         OUTPUT_PATH = Path(__file__).parent
         ASSETS_PATH = OUTPUT_PATH / "assets" / "frame0"
         try:
-            self.eye_image = PhotoImage(file=ASSETS_PATH / "view.png")
-            self.eye_slash_image = PhotoImage(file=ASSETS_PATH / "hide.png")
+            self.eye_image = load_image(ASSETS_PATH / "view.png")
+            self.eye_slash_image = load_image(ASSETS_PATH / "hide.png")
         except tk.TclError as e:
             messagebox.showerror("Asset Error", f"Could not find eye icons (view.png, hide.png).\n{e}")
             self.destroy()
@@ -66,13 +72,19 @@ class MainApplication(tk.Tk):
         self.frames = {}
 
         try:
-            self.show_frame(LoginFrame)
+            self.show_frame("LoginFrame")
+            ui_profile.record("startup to login screen", time.perf_counter() - STARTED_AT)
         except Exception as e:
             print(f"Error during initial LoginFrame display: {e}")
             messagebox.showerror("Initialization Error",
                                  f"Failed to load the login screen:\n{e}\nCheck console for details.")
             self.destroy()
 
+    @staticmethod
+    def prepare_database():
+        ensure_schema()
+        ensure_rollups()
+
     def center_window(self, width, height):
         self.update_idletasks()
         try:
@@ -89,20 +101,29 @@ class MainApplication(tk.Tk):
             print(f"Error centering window: {e}")
             self.geometry(f"{self.default_width}x{self.default_height}")
 
+    # Takes a frame class name (or the class itself, as the user frames pass).
     def show_frame(self, frame_class):
-        name = frame_class.__name__
+        name = frame_class if isinstance(frame_class, str) else frame_class.__name__
         frame = self.frames.get(name)
 
         if not frame or not frame.winfo_exists():
             print(f"Creating instance of {name}")
             try:
-                frame = frame_class(parent=self.container, controller=self)
+                if isinstance(frame_class, str):
+                    frame_class = self.registry.get(name)
+                with ui_profile.timed(f"construct {name}"):
+                    frame = frame_class(parent=self.container, controller=self)
                 self.frames[name] = frame
                 frame.grid(row=0, column=0, sticky="nsew")
             except Exception as e:
                 messagebox.showerror("Frame Error", f"Could not create frame: {name}\nError: {e}")
                 return
 
+        # Results still in flight for the screen being left are no longer wanted
+        if self.current_frame is not None and self.current_frame is not frame:
+            self.tasks.cancel_owner(self.current_frame)
+        self.current_frame = frame
+
         # --- Resize Window Based on Frame ---
         target_width, target_height = self.default_width, self.default_height
 
@@ -141,60 +162,15 @@ class MainApplication(tk.Tk):
 
         # --- Refresh data logic ---
         if frame and frame.winfo_exists():
-            try:
-                if hasattr(frame, "load_user_data") and callable(frame.load_user_data):
-                    frame.load_user_data()
-            except Exception as e:
-                print(f"Error calling load_user_data for {name}: {e}")
-            try:
-                if hasattr(frame, "load_user_requests") and callable(frame.load_user_requests):
-                    frame.load_user_requests()
-            except Exception as e:
-                print(f"Error calling load_user_requests for {name}: {e}")
-            try:
-                if hasattr(frame, "load_history") and callable(frame.load_history):
-                    frame.load_history()
-            except Exception as e:
-                print(f"Error calling load_history for {name}: {e}")
-            try:
-                if hasattr(frame, "load_notifications") and callable(frame.load_notifications):
-                    frame.load_notifications()
-            except Exception as e:
-                print(f"Error calling load_notifications for {name}: {e}")
-
-            # Admin frames
-            try:
-                if hasattr(frame, "load_dashboard_data") and callable(frame.load_dashboard_data):
-                    frame.load_dashboard_data()
-            except Exception as e:
-                print(f"Error calling load_dashboard_data for {name}: {e}")
-            try:
-                if hasattr(frame, "load_print_jobs") and callable(frame.load_print_jobs):
-                    frame.load_print_jobs()
-            except Exception as e:
-                print(f"Error calling load_print_jobs for {name}: {e}")
-            try:
-                if hasattr(frame, "load_users") and callable(frame.load_users):
-                    frame.load_users()
-            except Exception as e:
-                print(f"Error calling load_users for {name}: {e}")
-            try:
-                if hasattr(frame, "load_notifications_admin") and callable(frame.load_notifications_admin):
-                    frame.load_notifications_admin()
-            except Exception as e:
-                print(f"Error calling load_notifications_admin for {name}: {e}")
-            try:
-                if hasattr(frame, "load_products") and callable(frame.load_products):  # <-- ADDED
-                    frame.load_products()
-            except Exception as e:
-                print(f"Error calling load_products for {name}: {e}")
-
-            # OTP/Forgot Frames
-            try:
-                if hasattr(frame, "prepare_otp_entry") and callable(frame.prepare_otp_entry):
-                    frame.prepare_otp_entry()
-            except Exception as e:
-                print(f"Error calling prepare_otp_entry for {name}: {e}")
+            for method_name in LOAD_METHODS:
+                method = getattr(frame, method_name, None)
+                if not callable(method):
+                    continue
+                try:
+                    with ui_profile.timed(f"{name}.{method_name}"):
+                        method()
+                except Exception as e:
+                    print(f"Error calling {method_name} for {name}: {e}")
             try:
                 if name == "ForgotFrame" and hasattr(frame, "hide_reset_stage") and not self.temp_reset_email:
                     frame.hide_reset_stage()
@@ -203,17 +179,31 @@ class MainApplication(tk.Tk):
 
             frame.tkraise()
 
+    def destroy(self):
+        feed = getattr(self, "feed", None)
+        if feed is not None:
+            feed.stop()
+        tasks = getattr(self, "tasks", None)
+        if tasks is not None:
+            tasks.shutdown()
+        doc_inspect.shutdown()
+        mail_queue.stop_worker()
+        image_cache.clear()
+        super().destroy()
+
     def on_login_success(self, user_id, fullname):
         self.user_id = user_id
         self.fullname = fullname
         self.admin_name = None
         self.show_printer_frame()
+        self.registry.preload("user")
 
     def on_admin_login(self, admin_name):
         self.admin_name = admin_name
         self.user_id = None
         self.fullname = None
         self.show_admin_dashboard()
+        self.registry.preload("admin")
 
     def show_login_frame(self):
         """Logs out user/admin, clears login fields, and returns to login screen."""
@@ -224,7 +214,7 @@ class MainApplication(tk.Tk):
         self.temp_otp = None
         self.temp_reset_email = None
 
-        login_frame_instance = self.frames.get(LoginFrame.__name__)
+        login_frame_instance = self.frames.get("LoginFrame")
         if login_frame_instance and login_frame_instance.winfo_exists():
             if hasattr(login_frame_instance, 'clear_fields') and callable(login_frame_instance.clear_fields):
                 login_frame_instance.clear_fields()
@@ -234,7 +224,7 @@ class MainApplication(tk.Tk):
             self.destroy()
             return
 
-        self.show_frame(LoginFrame)
+        self.show_frame("LoginFrame")
 
         if login_frame_instance and login_frame_instance.winfo_exists():
             if hasattr(login_frame_instance, 'entry_email'):
@@ -242,74 +232,86 @@ class MainApplication(tk.Tk):
 
     # --- USER NAVIGATION METHODS ---
     def show_printer_frame(self):
-        self.show_frame(PrinterFrame)
+        self.show_frame("PrinterFrame")
 
     def show_user_frame(self):
-        self.show_frame(UserFrame)
+        self.show_frame("UserFrame")
 
     def show_history_frame(self):
-        self.show_frame(HistoryFrame)
+        self.show_frame("HistoryFrame")
 
     def show_prices_frame(self):
-        self.show_frame(PricesFrame)
+        self.show_frame("PricesFrame")
 
     def show_help_frame(self):
-        self.show_frame(HelpFrame)
+        self.show_frame("HelpFrame")
 
     def show_notification_frame(self):
-        self.show_frame(NotificationFrame)
+        self.show_frame("NotificationFrame")
 
     # --- ADMIN NAVIGATION METHODS ---
     def show_admin_dashboard(self):
-        self.show_frame(AdminDashboardFrame)
+        self.show_frame("AdminDashboardFrame")
 
     def show_admin_user(self):
-        self.show_frame(AdminUserFrame)
+        self.show_frame("AdminUserFrame")
 
     def show_admin_print(self):
-        self.show_frame(AdminPrintFrame)
+        self.show_frame("AdminPrintFrame")
 
     def show_admin_report(self):
-        self.show_frame(AdminReportFrame)
+        self.show_frame("AdminReportFrame")
 
     def show_admin_notification(self):
-        self.show_frame(AdminNotificationFrame)
+        self.show_frame("AdminNotificationFrame")
 
     # --- ADDED: show_admin_inventory ---
     def show_admin_inventory(self):
-        self.show_frame(AdminInventoryFrame)
+        self.show_frame("AdminInventoryFrame")
 
     # --- END ADDITION ---
 
     # --- NEW NAVIGATION METHODS for Register/OTP/Forgot ---
     def show_register_frame(self):
-        register_frame = self.frames.get(RegisterFrame.__name__)
+        register_frame = self.frames.get("RegisterFrame")
         if register_frame and hasattr(register_frame, 'clear_fields') and callable(register_frame.clear_fields):
             try:
                 register_frame.clear_fields()
             except Exception as e:
                 print(f"Error clearing RegisterFrame fields: {e}")
-        self.show_frame(RegisterFrame)
+        self.show_frame("RegisterFrame")
 
     def show_otp_frame(self):
-        self.show_frame(OTPFrame)
+        self.show_frame("OTPFrame")
 
     def show_forgot_frame(self):
-        forgot_frame = self.frames.get(ForgotFrame.__name__)
+        forgot_frame = self.frames.get("ForgotFrame")
         if forgot_frame and hasattr(forgot_frame, 'hide_reset_stage') and not self.temp_reset_email:
             try:
                 forgot_frame.hide_reset_stage()
             except Exception as e:
                 print(f"Error resetting ForgotFrame stage: {e}")
-        self.show_frame(ForgotFrame)
+        self.show_frame("ForgotFrame")
 
     def show_otp1_frame(self):
-        self.show_frame(OTP1Frame)
+        self.show_frame("OTP1Frame")
 
     def show_otp2_frame(self):
-        self.show_frame(OTP2Frame)
+        self.show_frame("OTP2Frame")
 
 
 if __name__ == "__main__":
     app = MainApplication()
-    app.mainloop()
\ No newline at end of file
+    app.mainloop()
+
+    # --- Connection pool counters (set DB_POOL_STATS=1 to print on exit) ---
+    if os.getenv("DB_POOL_STATS"):
+        stats = pool_stats()
+        print(f"DB pool: {stats['borrows']} borrows, {stats['handshakes']} handshakes "
+              f"(avg {stats['avg_handshake_ms']:.1f} ms), {stats['waits']} waits "
+              f"({stats['wait_time'] * 1000:.1f} ms), {stats['reconnects']} reconnects, "
+              f"~{stats['est_time_saved_ms']:.0f} ms of handshakes avoided")
+
+    # --- UI timings (set UI_PROFILE=1) ---
+    if ui_profile.ENABLED:
+        print("UI timings, slowest first:\n" + ui_profile.summary())
\ No newline at end of file
@@ -1,9 +1,12 @@
 from pathlib import Path
-from tkinter import Canvas, Button, PhotoImage, Label, Frame, messagebox, ttk, Toplevel, Text
+from tkinter import Canvas, Button, Label, Frame, messagebox, ttk, Toplevel, Text
 import tkinter as tk
 import mysql.connector
 from datetime import datetime
-from utils import get_db_connection, round_rectangle
+from utils import get_db_connection, db_connection, round_rectangle
+from image_cache import load_image
+from task_runner import run_in_background
+from change_feed import after_baseline, subscribe_changes
 
 from printer_frame import PrinterFrame
 from user_frame import UserFrame
@@ -27,28 +30,30 @@ BLACK = "#000000"
 
 
 # ---Database: Fetches Notifications---
-def fetch_notifications(current_user_id):
+# Runs on a worker thread, so errors are raised to the caller instead of shown here.
+# Personal and broadcast (user_id IS NULL) rows are two lookups on (user_id, created_at) joined by UNION ALL.
+def fetch_notifications(current_user_id, since_id=None):
     if current_user_id is None: return []
-    notifications = []
-    conn = get_db_connection()
-    if not conn: return notifications
-    try:
+    with db_connection() as conn:
         cursor = conn.cursor(dictionary=True)
-        query = """
-            SELECT notif_id, subject, message, created_at, status
-            FROM notifications
-            WHERE (user_id = %s OR user_id IS NULL)
-            ORDER BY created_at DESC
-        """
-        cursor.execute(query, (current_user_id,))
-        notifications = cursor.fetchall()
-    except mysql.connector.Error as err:
-        messagebox.showerror("Database Error", f"Error fetching notifications:\n{err}")
-    finally:
-        if conn and conn.is_connected():
-            if 'cursor' in locals() and cursor: cursor.close()
-            conn.close()
-    return notifications
+        try:
+            select = """
+                SELECT notif_id, subject, message, created_at, status
+                FROM notifications
+            """
+            since_clause = " AND notif_id > %s" if since_id is not None else ""
+            query = f"""
+                ({select} WHERE user_id = %s{since_clause})
+                UNION ALL
+                ({select} WHERE user_id IS NULL{since_clause})
+                ORDER BY created_at DESC
+            """
+            since_params = [since_id] if since_id is not None else []
+            params = [current_user_id, *since_params, *since_params]
+            cursor.execute(query, tuple(params))
+            return cursor.fetchall()
+        finally:
+            cursor.close()
 
 
 # ---Database: Marks as Read---
@@ -85,10 +90,10 @@ class NotificationFrame(tk.Frame):
         self.canvas.place(x=0, y=0)
 
         try:
-            self.icon_edit = PhotoImage(file=relative_to_assets("account.png"))
-            self.icon_bell = PhotoImage(file=relative_to_assets("image_13.png"))
-            self.icon_sheet = PhotoImage(file=relative_to_assets("image_15.png"))
-            self.icon_help = PhotoImage(file=relative_to_assets("image_16.png"))
+            self.icon_edit = load_image(relative_to_assets("account.png"))
+            self.icon_bell = load_image(relative_to_assets("image_13.png"))
+            self.icon_sheet = load_image(relative_to_assets("image_15.png"))
+            self.icon_help = load_image(relative_to_assets("image_16.png"))
         except tk.TclError as e:
             messagebox.showerror("Asset Error", f"Could not load assets for NotificationFrame:\n{e}")
             return
@@ -173,13 +178,47 @@ class NotificationFrame(tk.Frame):
         # --- END OF BUTTON CHANGES ---
 
         self.load_notifications()
+        subscribe_changes(controller, self, self.on_feed_change)
 
     # ---Loads Notifications---
     def load_notifications(self):
-        notifications = fetch_notifications(self.user_id)
+        run_in_background(self.controller, self, "notifications",
+                          after_baseline(self.controller, fetch_notifications), self.user_id,
+                          on_done=self.on_notifications_loaded, on_error=self.on_notifications_error)
+
+    # ---Displays Loaded Notifications---
+    def on_notifications_loaded(self, notifications):
         self.display_notifications(self.notif_content_frame, notifications)
         self.canvas.after(50, lambda: self._on_frame_configure(None))
 
+    # ---Handles Change Feed---
+    def on_feed_change(self, topics, since):
+        if "notifications" not in topics:
+            return
+        run_in_background(self.controller, self, "new_notifications", fetch_notifications, self.user_id,
+                          since["notif_id"], on_done=self.prepend_notifications,
+                          on_error=lambda err: print(f"Error fetching new notifications: {err}"))
+
+    # ---Adds New Notifications to Top---
+    def prepend_notifications(self, notifications):
+        if not notifications:
+            return
+        existing = [w for w in self.notif_content_frame.winfo_children() if getattr(w, "notif_id", None)]
+        known_ids = {w.notif_id for w in existing}
+        notifications = [n for n in notifications if n['notif_id'] not in known_ids]
+        if not existing:
+            self.on_notifications_loaded(notifications)
+            return
+        first_item = existing[0]
+        for notification in notifications:
+            self.create_notification_item(self.notif_content_frame, notification, before=first_item)
+        self.canvas.after(50, lambda: self._on_frame_configure(None))
+
+    # ---Handles Fetch Error---
+    def on_notifications_error(self, err):
+        messagebox.showerror("Database Error", f"Error fetching notifications:\n{err}")
+        self.on_notifications_loaded([])
+
     # ---Marks All Notifications as Read---
     def mark_all_as_read(self):
         if self.user_id is None: return
@@ -320,35 +359,42 @@ class NotificationFrame(tk.Frame):
             return
 
         for notification in notifications_data:
-            notif_id = notification['notif_id']
-            status = notification.get('status', 'Unread')
-            text_color = BLACK if status == 'Unread' else "grey"
-            time_color = "grey"
-            frame_bg = WHITE
-
-            item_frame = Frame(frame, bg=frame_bg, bd=1, relief="solid", padx=5, pady=5)
+            self.create_notification_item(frame, notification)
+
+    # ---Creates Notification Item---
+    def create_notification_item(self, frame, notification, before=None):
+        status = notification.get('status', 'Unread')
+        text_color = BLACK if status == 'Unread' else "grey"
+        time_color = "grey"
+        frame_bg = WHITE
+
+        item_frame = Frame(frame, bg=frame_bg, bd=1, relief="solid", padx=5, pady=5)
+        item_frame.notif_id = notification['notif_id']
+        if before is not None:
+            item_frame.pack(fill="x", padx=10, pady=(5, 0), before=before)
+        else:
             item_frame.pack(fill="x", padx=10, pady=(5, 0))
 
-            subject_text = notification.get('subject', 'No Subject')
-            subject_label = Label(item_frame, text=subject_text, font=("Inter Bold", 13), bg=frame_bg, fg=text_color,
-                                  anchor="w", justify="left")
-            subject_label.pack(fill="x")
-
-            timestamp = notification.get('created_at', datetime.now())
-            try:
-                time_str = timestamp.strftime("%b %d, %Y - %I:%M %p")
-            except AttributeError:
-                time_str = "Invalid Date"
-            time_label = Label(item_frame, text=time_str, font=("Inter", 9), bg=frame_bg, fg=time_color, anchor="w",
-                               justify="left")
-            time_label.pack(fill="x")
-
-            item_frame.bind("<Button-1>", lambda e, notif=notification: self.show_message_window(notif))
-            subject_label.bind("<Button-1>", lambda e, notif=notification: self.show_message_window(notif))
-            time_label.bind("<Button-1>", lambda e, notif=notification: self.show_message_window(notif))
-            for w in [item_frame, subject_label, time_label]:
-                w.bind("<Enter>", lambda e: self.config(cursor="hand2"))
-                w.bind("<Leave>", lambda e: self.config(cursor=""))
+        subject_text = notification.get('subject', 'No Subject')
+        subject_label = Label(item_frame, text=subject_text, font=("Inter Bold", 13), bg=frame_bg, fg=text_color,
+                              anchor="w", justify="left")
+        subject_label.pack(fill="x")
+
+        timestamp = notification.get('created_at', datetime.now())
+        try:
+            time_str = timestamp.strftime("%b %d, %Y - %I:%M %p")
+        except AttributeError:
+            time_str = "Invalid Date"
+        time_label = Label(item_frame, text=time_str, font=("Inter", 9), bg=frame_bg, fg=time_color, anchor="w",
+                           justify="left")
+        time_label.pack(fill="x")
+
+        item_frame.bind("<Button-1>", lambda e, notif=notification: self.show_message_window(notif))
+        subject_label.bind("<Button-1>", lambda e, notif=notification: self.show_message_window(notif))
+        time_label.bind("<Button-1>", lambda e, notif=notification: self.show_message_window(notif))
+        for w in [item_frame, subject_label, time_label]:
+            w.bind("<Enter>", lambda e: self.config(cursor="hand2"))
+            w.bind("<Leave>", lambda e: self.config(cursor=""))
 
     # ---Updates Scrollable Area---
     def _on_frame_configure(self, event):
@@ -8,6 +8,8 @@ import shutil
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from utils import get_db_connection, round_rectangle
+from rollups import ensure_rollups, record_payment, record_status_change
+from price_cache import prices
 
 
 OUTPUT_PATH = Path(__file__).parent
@@ -34,7 +36,7 @@ def fetch_job_details(job_id):
         query = """
             SELECT
                 pj.job_id, u.username, f.file_name, pj.status,
-                pj.pages, pj.copies, pj.paper_size, pj.color_option
+                pj.pages, pj.copies, pj.paper_size, pj.color_option, pj.total_amount
             FROM print_jobs pj
             LEFT JOIN users u ON pj.user_id = u.user_id
             LEFT JOIN files f ON pj.file_id = f.file_id
@@ -66,11 +68,29 @@ def fetch_job_details(job_id):
             conn.close()
     return details
 
+#---Quotes Job From Price List---
+# Same price cache as the printer and price list screens. Only used to warn when the price list
+# has changed since the job was priced; the customer is charged the job's stored amount.
+# Returns None when the job cannot be quoted.
+def quote_job_amount(details):
+    try:
+        prices.refresh()
+    except Exception as e:
+        print(f"Could not refresh price list, using cached prices: {e}")
+    try:
+        quoted = prices.quote(details.get('pages'), details.get('copies'), details.get('paper_size'),
+                              details.get('color_option'))
+    except (ValueError, TypeError, InvalidOperation):
+        return None
+    return quoted if quoted > 0 else None
+
 #---Database: Records Payment---
 def record_payment_and_update_status(job_id, payment_amount, payment_method, gcash_name=None, gcash_number=None, screenshot_path=None):
     conn = None
     cursor = None
     try:
+        # Outside the payment transaction: the first run on a database creates the rollup tables
+        ensure_rollups()
         conn = get_db_connection()
         if not conn:
             messagebox.showerror("Database Error", "Could not connect to record payment.")
@@ -95,17 +115,22 @@ def record_payment_and_update_status(job_id, payment_amount, payment_method, gca
         cursor.execute(insert_query, payment_data)
         payment_id = cursor.lastrowid
         print(f"Payment record {payment_id} inserted for job {job_id}.")
+        record_payment(cursor, job_id, payment_amount)
 
         new_status = "Cash" if payment_method == "Cash" else "Paid"
 
-        update_query = """
-            UPDATE print_jobs
-            SET status = %s, 
-                payment_method = %s
-            WHERE job_id = %s AND status = 'Approved'
-        """
-        cursor.execute(update_query, (new_status, payment_method, job_id))
-        affected_rows = cursor.rowcount
+        affected_rows = 0
+        changed_at = record_status_change(cursor, job_id, new_status, expected_status="Approved")
+        if changed_at:
+            update_query = """
+                UPDATE print_jobs
+                SET status = %s, 
+                    payment_method = %s,
+                    updated_at = %s
+                WHERE job_id = %s AND status = 'Approved'
+            """
+            cursor.execute(update_query, (new_status, payment_method, changed_at, job_id))
+            affected_rows = cursor.rowcount
 
         conn.commit()
         print(f"Job {job_id} status updated to Paid (Affected rows: {affected_rows}). Transaction committed.")
@@ -151,6 +176,17 @@ class PaymentWindow(Tk):
             messagebox.showerror("Error", f"Could not fetch essential details for Job ID {job_id}.")
             self.destroy()
             return
+        # Charge what was stored (and approved) on the job; the command-line amount is a fallback
+        stored_amount = self.job_details.get('total_amount')
+        if stored_amount is not None:
+            self.payment_amount = Decimal(stored_amount).quantize(Decimal("0.01"))
+        current_quote = quote_job_amount(self.job_details)
+        if current_quote is not None and current_quote != self.payment_amount:
+            print(f"Job {job_id}: stored amount ₱{self.payment_amount}, current price list ₱{current_quote}.")
+            messagebox.showwarning("Price List Changed",
+                                   f"Prices have changed since this request was submitted.\n\n"
+                                   f"You will be charged the approved amount of ₱{self.payment_amount:.2f} "
+                                   f"(current price list: ₱{current_quote:.2f}).")
 
         self.title(f"Payment for Job #{self.job_id}")
         window_width = 650
@@ -0,0 +1,89 @@
+import threading
+import time
+from decimal import Decimal
+
+# Used until the first load from price_list finishes (and if it never can).
+DEFAULT_PRICES = {
+    ('Black & White', 'Short'): Decimal('3.00'),
+    ('Black & White', 'A4'): Decimal('3.00'),
+    ('Black & White', 'Long'): Decimal('3.00'),
+    ('Partially Colored', 'Short'): Decimal('7.00'),
+    ('Partially Colored', 'A4'): Decimal('7.00'),
+    ('Partially Colored', 'Long'): Decimal('8.00'),
+    ('Full Colored', 'Short'): Decimal('10.00'),
+    ('Full Colored', 'A4'): Decimal('10.00'),
+    ('Full Colored', 'Long'): Decimal('15.00'),
+}
+
+# print_jobs.color_option values mapped to price_list.type
+COLOR_TYPES = {"Color": "Full Colored"}
+
+
+#---Prices: In-Memory Price Table---
+class PriceCache:
+    """Holds price_list in memory so quoting never touches the database.
+
+    refresh() is cheap to call often: it compares a CHECKSUM of price_list and only reloads
+    the rows when an admin has changed them. Call it from a worker thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._prices = dict(DEFAULT_PRICES)
+        self._checksum = None
+        self.loaded_at = None
+
+    #---Prices: Reloads If Changed---
+    # Returns True when the table changed since the last refresh.
+    def refresh(self):
+        from utils import db_connection
+
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("CHECKSUM TABLE price_list")
+                row = cursor.fetchone()
+                checksum = row[1] if row else None
+                if checksum is not None and checksum == self._checksum:
+                    return False
+                cursor.execute("SELECT type, paper_size, price_per_page FROM price_list")
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+
+        prices = {(price_type, paper_size): Decimal(price)
+                  for price_type, paper_size, price in rows
+                  if price_type and paper_size and price is not None}
+        with self._lock:
+            changed = prices != self._prices
+            if prices:
+                self._prices = prices
+            self._checksum = checksum
+            self.loaded_at = time.time()
+        return changed
+
+    #---Prices: Price Per Page---
+    def price_per_page(self, color_option, paper_size):
+        price_type = COLOR_TYPES.get(color_option, color_option)
+        with self._lock:
+            price = self._prices.get((price_type, paper_size))
+            if price is None:
+                print(f"Warning: Price not found for {(price_type, paper_size)}, using Black & White")
+                price = self._prices.get(('Black & White', paper_size), Decimal('0.00'))
+        return price
+
+    #---Prices: Quotes a Job---
+    def quote(self, pages, copies, paper_size, color_option):
+        pages, copies = int(pages), int(copies)
+        if pages <= 0 or copies <= 0:
+            return Decimal('0.00')
+        return (self.price_per_page(color_option, paper_size) * pages * copies).quantize(Decimal("0.01"))
+
+    #---Prices: Copy of Table---
+    def snapshot(self):
+        with self._lock:
+            return dict(self._prices)
+
+
+# Shared by every frame in the process (and by pay.py in its own process).
+prices = PriceCache()
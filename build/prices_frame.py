@@ -1,9 +1,12 @@
 from pathlib import Path
-from tkinter import Canvas, Button, PhotoImage, messagebox
+from tkinter import Canvas, Button, messagebox
 import tkinter as tk
 
 # We import PrinterFrame to be able to navigate back to it
 from printer_frame import PrinterFrame
+from price_cache import prices
+from task_runner import run_in_background
+from image_cache import load_image
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / "assets" / "frame0"
@@ -11,6 +14,19 @@ ASSETS_PATH = OUTPUT_PATH / "assets" / "frame0"
 def relative_to_assets(path: str) -> Path:
     return ASSETS_PATH / Path(path)
 
+# (price type, paper size) -> (x, y, label) of each price row
+PRICE_ROWS = {
+    ('Black & White', 'Short'): (87.0, 162.0, "Short Size                "),
+    ('Black & White', 'A4'): (87.0, 187.0, "A4 Size                     "),
+    ('Black & White', 'Long'): (87.0, 212.0, "Long Size                 "),
+    ('Partially Colored', 'Short'): (86.0, 282.0, "Short Size                "),
+    ('Partially Colored', 'A4'): (86.0, 306.0, "A4  Size                     "),
+    ('Partially Colored', 'Long'): (86.0, 332.0, "Long  Size                 "),
+    ('Full Colored', 'Short'): (88.0, 402.0, "Short Size                "),
+    ('Full Colored', 'A4'): (88.0, 425.0, "A4  Size                     "),
+    ('Full Colored', 'Long'): (88.0, 448.0, "Long  Size                 "),
+}
+
 # --- MAIN PRICES FRAME CLASS ---
 class PricesFrame(tk.Frame):
     def __init__(self, parent, controller):
@@ -30,13 +46,13 @@ class PricesFrame(tk.Frame):
         # --- Load Assets ---
         # Store images on self to prevent garbage collection
         try:
-            self.image_image_1 = PhotoImage(file=relative_to_assets("image_6.png"))
-            self.image_image_2 = PhotoImage(file=relative_to_assets("image_7.png"))
-            self.image_image_3 = PhotoImage(file=relative_to_assets("image_8.png"))
-            self.image_image_4 = PhotoImage(file=relative_to_assets("image_9.png"))
-            self.image_image_5 = PhotoImage(file=relative_to_assets("image_10.png"))
-            self.image_image_6 = PhotoImage(file=relative_to_assets("image_11.png"))
-            self.button_image_1 = PhotoImage(file=relative_to_assets("button_8.png"))
+            self.image_image_1 = load_image(relative_to_assets("image_6.png"))
+            self.image_image_2 = load_image(relative_to_assets("image_7.png"))
+            self.image_image_3 = load_image(relative_to_assets("image_8.png"))
+            self.image_image_4 = load_image(relative_to_assets("image_9.png"))
+            self.image_image_5 = load_image(relative_to_assets("image_10.png"))
+            self.image_image_6 = load_image(relative_to_assets("image_11.png"))
+            self.button_image_1 = load_image(relative_to_assets("button_8.png"))
         except tk.TclError as e:
             messagebox.showerror("Asset Error", f"Could not load assets for PricesFrame:\n{e}")
             return
@@ -56,19 +72,12 @@ class PricesFrame(tk.Frame):
         canvas.create_text(71.0, 248.0, anchor="nw", text="Partially Colored:", fill="#000000", font=("Inter Bold", -20))
         canvas.create_text(71.0, 372.0, anchor="nw", text="Full Colored:", fill="#000000", font=("Inter Bold", -20))
 
-        # Price rows
-        # ---B&W Prize---
-        canvas.create_text(87.0, 162.0, anchor="nw", text="Short Size                ₱3.00/per page", fill="#000000", font=("Inter Bold", -14))
-        canvas.create_text(87.0, 187.0, anchor="nw", text="A4 Size                     ₱3.00/per page", fill="#000000", font=("Inter Bold", -14))
-        canvas.create_text(87.0, 212.0, anchor="nw", text="Long Size                 ₱3.00/per page", fill="#000000", font=("Inter Bold", -14))
-        # ---Partially Colored Prize---
-        canvas.create_text(86.0, 282.0, anchor="nw", text="Short Size                ₱7.00/per page", fill="#000000", font=("Inter Bold", -14))
-        canvas.create_text(86.0, 306.0, anchor="nw", text="A4  Size                     ₱7.00/per page", fill="#000000", font=("Inter Bold", -14))
-        canvas.create_text(86.0, 332.0, anchor="nw", text="Long  Size                 ₱8.00/per page", fill="#000000", font=("Inter Bold", -14))
-        # ---Colored Prize---
-        canvas.create_text(88.0, 402.0, anchor="nw", text="Short Size                ₱10.00/per page", fill="#000000", font=("Inter Bold", -14))
-        canvas.create_text(88.0, 425.0, anchor="nw", text="A4  Size                     ₱10.00/per page", fill="#000000", font=("Inter Bold", -14))
-        canvas.create_text(88.0, 448.0, anchor="nw", text="Long  Size                 ₱15.00/per page", fill="#000000", font=("Inter Bold", -14))
+        # Price rows, filled from the shared price cache
+        self.price_items = {}
+        for key, (x, y, label) in PRICE_ROWS.items():
+            self.price_items[key] = canvas.create_text(x, y, anchor="nw", text=label, fill="#000000",
+                                                       font=("Inter Bold", -14))
+        self.show_prices()
 
         # Example pictures
         canvas.create_image(512.0, 197.0, image=self.image_image_3)
@@ -85,6 +94,20 @@ class PricesFrame(tk.Frame):
         )
         button_1.place(x=726.0, y=446.0, width=71.0, height=31.0)
 
+    # ---Loads Price List---
+    def load_prices(self):
+        run_in_background(self.controller, self, "prices", prices.refresh,
+                          on_done=lambda changed: self.show_prices(),
+                          on_error=lambda err: print(f"Error loading price list: {err}"))
+
+    # ---Shows Prices---
+    def show_prices(self):
+        current = prices.snapshot()
+        for key, item in getattr(self, "price_items", {}).items():
+            price = current.get(key)
+            price_text = f"₱{price:.2f}/per page" if price is not None else "N/A"
+            self.canvas.itemconfig(item, text=PRICE_ROWS[key][2] + price_text)
+
     def go_back(self):
         self.controller.center_window(self.controller.default_width, self.controller.default_height)
         self.controller.show_frame(PrinterFrame)
\ No newline at end of file
@@ -3,14 +3,21 @@ import subprocess
 from pathlib import Path
 from tkinter import (
     Canvas, Entry, Text, messagebox, filedialog,
-    Checkbutton, IntVar, DISABLED, NORMAL, StringVar, OptionMenu, PhotoImage, Label
+    Checkbutton, IntVar, DISABLED, NORMAL, StringVar, OptionMenu, Label
 )
 import tkinter as tk
 import os
-from datetime import datetime
 import mysql.connector
 from decimal import Decimal, InvalidOperation
-from utils import get_db_connection, round_rectangle
+from utils import db_connection, round_rectangle
+from image_cache import load_image
+from task_runner import run_in_background, run_write_in_background
+from change_feed import after_baseline, subscribe_changes
+from rollups import ensure_rollups, record_job_created
+from db_migrate import ensure_schema
+from file_store import CopyProgress, store_file
+from price_cache import prices
+from doc_inspect import inspect_file, suggest_color_option
 
 
 OUTPUT_PATH = Path(__file__).parent
@@ -26,35 +33,25 @@ def relative_to_assets(path: str) -> Path:
 
 
 class PrinterFrame(tk.Frame):
-    PRICES = {
-        ('Black & White', 'Short'): Decimal('3.00'),
-        ('Black & White', 'A4'): Decimal('3.00'),
-        ('Black & White', 'Long'): Decimal('3.00'),
-        ('Color', 'Short'): Decimal('10.00'),
-        ('Color', 'A4'): Decimal('10.00'),
-        ('Color', 'Long'): Decimal('15.00'),
-        ('Partially Colored', 'Short'): Decimal('7.00'),
-        ('Partially Colored', 'A4'): Decimal('7.00'),
-        ('Partially Colored', 'Long'): Decimal('8.00'),
-    }
-
     #---Initializes Printer UI---
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
 
         self.user_id = controller.user_id
+        self.user_requests = []
         self.fullname = controller.fullname
         self.selected_file = None
+        self.upload_future = None
 
         self.canvas = Canvas(self, bg="#FFFFFF", height=540, width=871, bd=0, highlightthickness=0, relief="ridge")
         self.canvas.place(x=0, y=0)
 
         try:
-            self.icon_profile = PhotoImage(file=relative_to_assets("account.png"))
-            self.icon_notif = PhotoImage(file=relative_to_assets("image_14.png"))
-            self.icon_prices = PhotoImage(file=relative_to_assets("image_15.png"))
-            self.icon_help = PhotoImage(file=relative_to_assets("image_16.png"))
+            self.icon_profile = load_image(relative_to_assets("account.png"))
+            self.icon_notif = load_image(relative_to_assets("image_14.png"))
+            self.icon_prices = load_image(relative_to_assets("image_15.png"))
+            self.icon_help = load_image(relative_to_assets("image_16.png"))
         except tk.TclError as e:
             messagebox.showerror("Asset Error", f"Could not load menu icons for PrinterFrame:\n{e}")
 
@@ -102,6 +99,8 @@ class PrinterFrame(tk.Frame):
                                                    font=("Inter Bold", 12))
         self.file_label = self.canvas.create_text(610, 185, anchor="nw", text="No file selected", fill="#000000",
                                                   font=("Inter", 11))
+        self.quote_label = self.canvas.create_text(262, 188, anchor="nw", text="", fill="#000000",
+                                                   font=("Inter Bold", 11))
         self.canvas.create_text(249, 232, anchor="nw", text="Number of Pages", fill="#000000", font=("Inter Bold", 13))
         round_rectangle(self.canvas, 249, 254, 351, 282, r=10, fill="#FFFFFF", outline="#000000")
         self.pages_entry = Entry(self, bd=0, bg="#FFFFFF", relief="flat", highlightthickness=0)
@@ -174,6 +173,7 @@ class PrinterFrame(tk.Frame):
 
         self.bind_events()
         self.load_user_requests()
+        subscribe_changes(controller, self, self.on_feed_change)
 
     #---Updates Scroll Region---
     def on_frame_configure(self, event=None):
@@ -226,72 +226,104 @@ class PrinterFrame(tk.Frame):
 
     #---Loads User Requests---
     def load_user_requests(self):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
         if not self.user_id:
             print("load_user_requests: No user_id found.")
+            self.clear_request_list()
             no_requests_label = tk.Label(self.scrollable_frame, text="Not logged in.",
                                          font=("Inter Italic", 11), bg="#FFFFFF", fg="#888888")
             no_requests_label.pack(pady=10, padx=10, anchor="w")
             return
 
-        conn = None
-        cursor = None
-        try:
-            conn = get_db_connection()
-            if not conn:
-                print("load_user_requests: Database connection failed.")
-                return
+        run_in_background(self.controller, self, "user_requests",
+                          after_baseline(self.controller, self.fetch_user_requests), self.user_id,
+                          on_done=self.display_user_requests, on_error=self.on_user_requests_error)
 
+    #---Database: Fetches User Requests (runs on a worker thread)---
+    def fetch_user_requests(self, user_id, changed_since=None):
+        with db_connection() as conn:
             cursor = conn.cursor(dictionary=True)
+            try:
+                sql_query = """
+                    SELECT pj.job_id, f.file_name, pj.status, pj.created_at, pj.total_amount,
+                           pj.pages, pj.copies, pj.paper_size, pj.color_option, pj.payment_method
+                    FROM print_jobs pj
+                    JOIN files f ON pj.file_id = f.file_id
+                    WHERE pj.user_id = %s
+                """
+                params = [user_id]
+                if changed_since:
+                    sql_query += """ AND (pj.job_id > %s OR pj.updated_at > %s
+                                         OR pj.job_id IN (SELECT job_id FROM payments WHERE payment_id > %s)) """
+                    params.extend([changed_since["job_id"], changed_since["job_updated_at"],
+                                   changed_since["payment_id"]])
+                sql_query += " ORDER BY pj.created_at DESC LIMIT 10"
+                cursor.execute(sql_query, tuple(params))
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    #---Clears Request List---
+    def clear_request_list(self):
+        for widget in self.scrollable_frame.winfo_children():
+            widget.destroy()
 
-            sql_query = """
-                SELECT pj.job_id, f.file_name, pj.status, pj.created_at, pj.total_amount,
-                       pj.pages, pj.copies, pj.paper_size, pj.color_option, pj.payment_method
-                FROM print_jobs pj
-                JOIN files f ON pj.file_id = f.file_id
-                WHERE pj.user_id = %s
-                ORDER BY pj.created_at DESC
-                LIMIT 10
-            """
-            cursor.execute(sql_query, (self.user_id,))
-            requests = cursor.fetchall()
-
-            if requests:
-                for request in requests:
-                    job_id = request.get('job_id')
-                    filename = request.get('file_name', 'N/A')
-                    created_at = request.get('created_at')
-                    date_str = created_at.strftime("%b %d, %Y") if created_at else "N/A"
-                    status = request.get('status', 'N/A')
-                    db_total_amount = request.get('total_amount')
-                    pages = request.get('pages')
-                    copies = request.get('copies')
-                    paper_size = request.get('paper_size')
-                    color_option = request.get('color_option')
-                    payment_method = request.get('payment_method')
-
-                    self.create_request_widget(
-                        job_id, filename, date_str, status, db_total_amount, pages, copies,
-                        paper_size, color_option, payment_method
-                    )
-            else:
-                no_requests_label = tk.Label(self.scrollable_frame, text="No recent print requests found.",
-                                             font=("Inter Italic", 11), bg="#FFFFFF", fg="#888888")
-                no_requests_label.pack(pady=10, padx=10, anchor="w")
+    #---Handles Change Feed---
+    def on_feed_change(self, topics, since):
+        if not self.user_id or not topics & {"print_jobs", "payments"}:
+            return
+        run_in_background(self.controller, self, "changed_requests", self.fetch_user_requests, self.user_id,
+                          changed_since=since, on_done=self.merge_user_requests,
+                          on_error=lambda err: print(f"Error fetching changed requests: {err}"))
 
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Failed to load request status:\n{err}", parent=self)
-        except Exception as e:
-            messagebox.showerror("Error", f"An unexpected error occurred loading request status:\n{e}", parent=self)
-        finally:
-            if cursor: cursor.close()
-            if conn and conn.is_connected(): conn.close()
+    #---Merges Changed Requests---
+    def merge_user_requests(self, changed):
+        if not changed:
+            return
+        merged = {request['job_id']: request for request in self.user_requests}
+        merged.update((request['job_id'], request) for request in changed)
+        requests = sorted(merged.values(), key=lambda r: (r.get('created_at') is not None, r.get('created_at')),
+                          reverse=True)
+        self.display_user_requests(requests[:10])
+
+    #---Displays User Requests---
+    def display_user_requests(self, requests):
+        self.user_requests = requests
+        self.clear_request_list()
+
+        if requests:
+            for request in requests:
+                job_id = request.get('job_id')
+                filename = request.get('file_name', 'N/A')
+                created_at = request.get('created_at')
+                date_str = created_at.strftime("%b %d, %Y") if created_at else "N/A"
+                status = request.get('status', 'N/A')
+                db_total_amount = request.get('total_amount')
+                pages = request.get('pages')
+                copies = request.get('copies')
+                paper_size = request.get('paper_size')
+                color_option = request.get('color_option')
+                payment_method = request.get('payment_method')
+
+                self.create_request_widget(
+                    job_id, filename, date_str, status, db_total_amount, pages, copies,
+                    paper_size, color_option, payment_method
+                )
+        else:
+            no_requests_label = tk.Label(self.scrollable_frame, text="No recent print requests found.",
+                                         font=("Inter Italic", 11), bg="#FFFFFF", fg="#888888")
+            no_requests_label.pack(pady=10, padx=10, anchor="w")
 
         self.scrollable_frame.update_idletasks()
         self.on_frame_configure()
 
+    #---Handles Fetch Error---
+    def on_user_requests_error(self, err):
+        self.clear_request_list()
+        if isinstance(err, mysql.connector.Error):
+            messagebox.showerror("Database Error", f"Failed to load request status:\n{err}", parent=self)
+        else:
+            messagebox.showerror("Error", f"An unexpected error occurred loading request status:\n{err}", parent=self)
+
     #---Creates Request Widget---
     def create_request_widget(self, job_id, filename, date, status, db_total_amount, pages, copies, paper_size,
                               color_option, payment_method):
@@ -365,28 +397,38 @@ class PrinterFrame(tk.Frame):
     #---Calculates Price---
     def _calculate_price(self, pages, copies, paper_size, color_option):
         try:
-            num_pages = int(pages)
-            num_copies = int(copies)
-            if num_pages <= 0 or num_copies <= 0:
-                return Decimal('0.00')
-
-            color_key = color_option
-            price_key = (color_key, paper_size)
-            price_per_page = self.PRICES.get(price_key)
-
-            if price_per_page is None:
-                print(f"Warning: Price not found for key {price_key}")
-                fallback_key = ('Black & White', paper_size)
-                price_per_page = self.PRICES.get(fallback_key, Decimal('0.00'))
-                if price_per_page == Decimal('0.00'):
-                    print(f"Error: Fallback price also not found for {fallback_key}")
-
-            total = price_per_page * num_pages * num_copies
-            return total.quantize(Decimal("0.01"))
+            return prices.quote(pages, copies, paper_size, color_option)
         except (ValueError, TypeError, InvalidOperation) as e:
             print(f"Error calculating price: {e} (Inputs: p={pages}, c={copies}, s={paper_size}, clr={color_option})")
             return Decimal('0.00')
 
+    #---Loads Price List---
+    # Reloads only when price_list changed; quotes come from memory either way.
+    def load_prices(self):
+        run_in_background(self.controller, self, "prices", prices.refresh,
+                          on_done=lambda changed: self.update_quote(),
+                          on_error=lambda err: print(f"Error loading price list: {err}"))
+
+    #---Color Option as Stored---
+    def selected_color_value(self):
+        color_option = self.color_choice.get()
+        if color_option == 'color':
+            return "Color"
+        if color_option == 'pc':
+            return "Partially Colored"
+        return "Black & White"
+
+    #---Updates Quote---
+    def update_quote(self, *args):
+        pages_str = self.pages_entry.get().strip()
+        copies_str = self.copies_entry.get().strip()
+        if not (pages_str.isdigit() and copies_str.isdigit() and self.color_choice.get()):
+            self.canvas.itemconfig(self.quote_label, text="")
+            return
+        total = self._calculate_price(int(pages_str), int(copies_str), self.paper_size_var.get(),
+                                      self.selected_color_value())
+        self.canvas.itemconfig(self.quote_label, text=f"Quote: ₱{total:,.2f}")
+
     #---Creates Sidebar Button---
     def create_rounded_menu_button(self, x, y, w, h, text, command=None):
         rect = round_rectangle(self.canvas, x, y, x + w, y + h, r=10, fill="#FFFFFF", outline="#000000", width=1)
@@ -422,6 +464,10 @@ class PrinterFrame(tk.Frame):
 
     #---Binds UI Events---
     def bind_events(self):
+        for entry in (self.pages_entry, self.copies_entry):
+            entry.bind("<KeyRelease>", self.update_quote)
+        self.paper_size_var.trace_add("write", self.update_quote)
+        self.color_choice.trace_add("write", self.update_quote)
         for tag in (self.submit_rect, self.submit_text):
             self.canvas.tag_bind(tag, "<Enter>", lambda e: (self.canvas.itemconfig(self.submit_rect, fill="#333333"),
                                                             self.config(cursor="hand2")))
@@ -471,10 +517,32 @@ class PrinterFrame(tk.Frame):
             filename = os.path.basename(filepath)
             display_name = filename if len(filename) <= 30 else filename[:27] + "..."
             self.canvas.itemconfig(self.file_label, text=f"Selected: {display_name}")
+            if os.path.splitext(filename)[1].lower() in (".pdf", ".docx"):
+                run_in_background(self.controller, self, "inspect_file", inspect_file, filepath,
+                                  on_done=lambda result: self.on_document_inspected(filepath, result),
+                                  on_error=lambda err: print(f"Could not inspect {filename}: {err}"))
         else:
             self.selected_file = None
             self.canvas.itemconfig(self.file_label, text="No file selected")
 
+    #---Applies Inspection Result---
+    # Fills in the detected page count and, when colour coverage is known and the user has not
+    # picked an option yet, the matching colour option.
+    def on_document_inspected(self, filepath, result):
+        if filepath != self.selected_file:
+            return
+        pages = result.get("pages")
+        if pages:
+            self.pages_entry.delete(0, "end")
+            self.pages_entry.insert(0, str(pages))
+            filename = os.path.basename(filepath)
+            display_name = filename if len(filename) <= 22 else filename[:19] + "..."
+            self.canvas.itemconfig(self.file_label, text=f"Selected: {display_name} ({pages} pages)")
+        suggestion = suggest_color_option(result)
+        if suggestion and not self.color_choice.get():
+            self.color_choice.set(suggestion)
+        self.update_quote()
+
     #---Toggles Notes Field---
     def toggle_notes(self):
         if self.notes_var.get() == 1:
@@ -498,6 +566,7 @@ class PrinterFrame(tk.Frame):
         self.bw_check.deselect()
         self.color_check.deselect()
         self.pc_check.deselect()
+        self.update_quote()
 
     #---Handles Submit Button---
     def submit_request(self):
@@ -527,83 +596,104 @@ class PrinterFrame(tk.Frame):
         filename = os.path.basename(self.selected_file)
         paper_size = self.paper_size_var.get()
 
-        if color_option == 'color':
-            color_value_db = "Color"
-        elif color_option == 'pc':
-            color_value_db = "Partially Colored"
-        else:
-            color_value_db = "Black & White"
+        color_value_db = self.selected_color_value()
 
         notes = self.notes_text.get("1.0", "end-1c").strip() if self.notes_var.get() == 1 else ""
 
-        conn = None
-        cursor = None
+        allowed_extensions = {".pdf", ".docx"}
+        file_ext = os.path.splitext(filename)[1].lower()
+        if file_ext not in allowed_extensions:
+            messagebox.showerror("Invalid File Type",
+                                 f"Only PDF and DOCX files are allowed.\nYou selected: {file_ext}", parent=self)
+            return
+        if self.upload_future is not None and not self.upload_future.done():
+            messagebox.showinfo("Upload in Progress", "Please wait for the current upload to finish.", parent=self)
+            return
+
         try:
-            conn = get_db_connection()
-            if conn is None:
-                return
+            file_size = os.path.getsize(self.selected_file)
+        except OSError as e:
+            messagebox.showerror("File Error", f"Could not read the selected file.\nError: {e}", parent=self)
+            return
 
+        request = {
+            "user_id": self.user_id,
+            "source_path": self.selected_file,
+            "file_name": filename,
+            "file_type": file_ext.replace(".", ""),
+            "pages": pages,
+            "paper_size": paper_size,
+            "color_option": color_value_db,
+            "copies": copies,
+            "notes": notes,
+            "total_amount": self._calculate_price(pages, copies, paper_size, color_value_db),
+        }
+        progress = CopyProgress(file_size)
+        self.upload_future = run_write_in_background(self.controller, "submit_request", self.save_request, request,
+                                                     progress, on_done=self.on_request_saved,
+                                                     on_error=self.on_request_error)
+        self.show_upload_progress(progress)
+
+    #---Saves Request (runs on a worker thread)---
+    # Streams the file into the content-addressed store, then records the files row and the job.
+    def save_request(self, request, progress):
+        ensure_schema()
+        ensure_rollups()
+        content_hash, size_bytes, file_path = store_file(request["source_path"], progress)
+        with db_connection() as conn:
             cursor = conn.cursor()
+            try:
+                insert_file_query = """
+                    INSERT INTO files (user_id, file_name, file_path, file_type, content_hash, size_bytes, upload_date)
+                    VALUES (%s, %s, %s, %s, %s, %s, NOW())
+                """
+                cursor.execute(insert_file_query, (request["user_id"], request["file_name"], file_path,
+                                                   request["file_type"], content_hash, size_bytes))
+                file_id = cursor.lastrowid
+
+                insert_job_query = """
+                    INSERT INTO print_jobs
+                    (user_id, file_id, pages, paper_size, color_option, copies, notes, status, created_at, total_amount)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), %s)
+                """
+                job_data = (request["user_id"], file_id, request["pages"], request["paper_size"],
+                            request["color_option"], request["copies"], request["notes"], "Pending",
+                            request["total_amount"])
+                cursor.execute(insert_job_query, job_data)
+                record_job_created(cursor, request["user_id"])
+
+                conn.commit()
+            finally:
+                cursor.close()
+        return request["file_name"]
+
+    #---Shows Upload Progress---
+    def show_upload_progress(self, progress):
+        future = self.upload_future
+        if future is None or future.done() or not self.winfo_exists():
+            return
+        self.canvas.itemconfig(self.file_label, text=f"Uploading... {progress.fraction():.0%}")
+        self.after(100, lambda: self.show_upload_progress(progress))
 
-            file_name = os.path.basename(self.selected_file)
-            allowed_extensions = {".pdf", ".docx"}
-            file_ext = os.path.splitext(file_name)[1].lower()
-            if file_ext not in allowed_extensions:
-                messagebox.showerror("Invalid File Type",
-                                     f"Only PDF and DOCX files are allowed.\nYou selected: {file_ext}", parent=self)
-                return
-
-            file_type_for_db = file_ext.replace(".", "")
-            upload_dir = Path("./uploads")
-            upload_dir.mkdir(exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            safe_filename_base = "".join(
-                c for c in os.path.splitext(file_name)[0] if c.isalnum() or c in (' ', '_', '-')).rstrip()
-            unique_filename = f"{timestamp}_{self.user_id}_{safe_filename_base}{file_ext}"
-            destination_path = (upload_dir / unique_filename).resolve()
+    #---Handles Saved Request---
+    def on_request_saved(self, filename):
+        messagebox.showinfo("Success", f"Print request for '{filename}' submitted successfully!", parent=self)
+        self.load_user_requests()
+        self.clear_form()
 
-            try:
-                import shutil
-                shutil.copy2(self.selected_file, destination_path)
-            except Exception as e:
-                messagebox.showerror("File Error",
-                                     f"Could not save the selected file.\nError: {e}", parent=self)
-                return
-
-            insert_file_query = """
-                INSERT INTO files (user_id, file_name, file_path, file_type, upload_date)
-                VALUES (%s, %s, %s, %s, NOW())
-            """
-            cursor.execute(insert_file_query, (self.user_id, file_name, str(destination_path), file_type_for_db))
-            file_id = cursor.lastrowid
-
-            insert_job_query = """
-                INSERT INTO print_jobs
-                (user_id, file_id, pages, paper_size, color_option, copies, notes, status, created_at, total_amount)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), %s)
-            """
-            calculated_amount = self._calculate_price(pages, copies, paper_size, color_value_db)
-
-            job_data = (self.user_id, file_id, pages, paper_size, color_value_db, copies, notes, "Pending",
-                        calculated_amount)
-            cursor.execute(insert_job_query, job_data)
-
-            conn.commit()
-
-            messagebox.showinfo("Success", f"Print request for '{filename}' submitted successfully!", parent=self)
-            self.load_user_requests()
-            self.clear_form()
-
-        except mysql.connector.Error as err:
-            if conn: conn.rollback()
+    #---Handles Submit Error---
+    def on_request_error(self, err):
+        if self.selected_file:
+            filename = os.path.basename(self.selected_file)
+            display_name = filename if len(filename) <= 30 else filename[:27] + "..."
+            self.canvas.itemconfig(self.file_label, text=f"Selected: {display_name}")
+        if isinstance(err, mysql.connector.Error):
             messagebox.showerror("Database Error", f"An error occurred while submitting the request:\n{err}",
                                  parent=self)
-        except Exception as e:
-            if conn: conn.rollback()
-            messagebox.showerror("Error", f"An unexpected error occurred:\Hn{e}", parent=self)
-        finally:
-            if cursor: cursor.close()
-            if conn and conn.is_connected(): conn.close()
+        elif isinstance(err, OSError):
+            messagebox.showerror("File Error", f"Could not save the selected file.\nError: {err}", parent=self)
+        else:
+            messagebox.showerror("Error", f"An unexpected error occurred:\n{err}", parent=self)
 
     #---Opens Payment Window---
     def open_pay_script(self, job_id, amount):
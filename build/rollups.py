@@ -0,0 +1,276 @@
+import argparse
+import threading
+from collections import defaultdict
+from decimal import Decimal
+
+from utils import db_connection
+
+# Statuses whose pages count as printed (matches the old report query).
+PRINTED_STATUSES = ("Completed", "Paid")
+# Statuses tallied by the day the job last changed, or its creation day when updated_at is empty.
+FINAL_STATUS_COLUMNS = {"Completed": "completed_jobs", "Declined": "declined_jobs"}
+
+DAILY_COLUMNS = ("total_jobs", "completed_jobs", "declined_jobs", "pages_printed", "total_revenue", "paid_jobs")
+USER_COLUMNS = ("total_jobs", "pages_printed", "total_revenue", "paid_jobs")
+
+_ensure_lock = threading.Lock()
+_ensured = False
+
+
+#---Rollups: Schema---
+# `reports` gets one row per day; `user_daily_usage` one row per user per day;
+# `rollup_state` marks a finished backfill.
+def create_rollup_tables(cursor):
+    cursor.execute("""
+        ALTER TABLE reports
+            ADD COLUMN IF NOT EXISTS declined_jobs int(11) NOT NULL DEFAULT 0 AFTER completed_jobs,
+            ADD COLUMN IF NOT EXISTS paid_jobs int(11) NOT NULL DEFAULT 0,
+            MODIFY total_jobs int(11) NOT NULL DEFAULT 0,
+            MODIFY completed_jobs int(11) NOT NULL DEFAULT 0,
+            MODIFY pages_printed int(11) NOT NULL DEFAULT 0,
+            MODIFY total_revenue decimal(10,2) NOT NULL DEFAULT 0.00,
+            ADD UNIQUE KEY IF NOT EXISTS report_date (report_date)
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS user_daily_usage (
+            report_date date NOT NULL,
+            user_id int(11) NOT NULL,
+            total_jobs int(11) NOT NULL DEFAULT 0,
+            pages_printed int(11) NOT NULL DEFAULT 0,
+            total_revenue decimal(10,2) NOT NULL DEFAULT 0.00,
+            paid_jobs int(11) NOT NULL DEFAULT 0,
+            PRIMARY KEY (report_date, user_id),
+            KEY user_id (user_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS rollup_state (
+            name varchar(64) NOT NULL PRIMARY KEY,
+            completed_at datetime NOT NULL
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+    """)
+
+
+#---Rollups: Checks Backfill Marker---
+def backfill_done(conn):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SHOW TABLES LIKE 'rollup_state'")
+        if cursor.fetchone() is None:
+            return False
+        cursor.execute("SELECT 1 FROM rollup_state WHERE name = 'backfill'")
+        return cursor.fetchone() is not None
+    finally:
+        cursor.close()
+
+
+#---Rollups: Rebuilds From Base Tables---
+# Replaces every rollup row in one transaction, together with the rollup_state marker, so a
+# failed rebuild leaves no marker and is retried. Writes that land mid-rebuild may be missed,
+# so run it while the shop is idle.
+def backfill(conn):
+    cursor = conn.cursor()
+    try:
+        conn.start_transaction()
+        cursor.execute("DELETE FROM reports")
+        cursor.execute("DELETE FROM user_daily_usage")
+
+        cursor.execute("""
+            INSERT INTO reports (report_date, total_jobs, pages_printed)
+            SELECT DATE(created_at), COUNT(*),
+                   COALESCE(SUM(CASE WHEN status IN ('Completed', 'Paid') THEN pages ELSE 0 END), 0)
+            FROM print_jobs
+            GROUP BY DATE(created_at)
+        """)
+        cursor.execute("""
+            INSERT INTO reports (report_date, completed_jobs, declined_jobs)
+            SELECT DATE(COALESCE(NULLIF(updated_at, ''), created_at)) AS day,
+                   SUM(status = 'Completed'), SUM(status = 'Declined')
+            FROM print_jobs
+            WHERE status IN ('Completed', 'Declined')
+            GROUP BY day
+            ON DUPLICATE KEY UPDATE completed_jobs = VALUES(completed_jobs),
+                                    declined_jobs = VALUES(declined_jobs)
+        """)
+        cursor.execute("""
+            INSERT INTO reports (report_date, total_revenue, paid_jobs)
+            SELECT DATE(payment_timestamp), SUM(payment_amount), COUNT(DISTINCT job_id)
+            FROM payments
+            GROUP BY DATE(payment_timestamp)
+            ON DUPLICATE KEY UPDATE total_revenue = VALUES(total_revenue),
+                                    paid_jobs = VALUES(paid_jobs)
+        """)
+
+        cursor.execute("""
+            INSERT INTO user_daily_usage (report_date, user_id, total_jobs, pages_printed)
+            SELECT DATE(created_at), user_id, COUNT(*),
+                   COALESCE(SUM(CASE WHEN status IN ('Completed', 'Paid') THEN pages ELSE 0 END), 0)
+            FROM print_jobs
+            WHERE user_id IS NOT NULL
+            GROUP BY DATE(created_at), user_id
+        """)
+        cursor.execute("""
+            INSERT INTO user_daily_usage (report_date, user_id, total_revenue, paid_jobs)
+            SELECT DATE(p.payment_timestamp), pj.user_id, SUM(p.payment_amount), COUNT(DISTINCT p.job_id)
+            FROM payments p
+            JOIN print_jobs pj ON p.job_id = pj.job_id
+            WHERE pj.user_id IS NOT NULL
+            GROUP BY DATE(p.payment_timestamp), pj.user_id
+            ON DUPLICATE KEY UPDATE total_revenue = VALUES(total_revenue),
+                                    paid_jobs = VALUES(paid_jobs)
+        """)
+        cursor.execute("""
+            INSERT INTO rollup_state (name, completed_at) VALUES ('backfill', NOW())
+            ON DUPLICATE KEY UPDATE completed_at = VALUES(completed_at)
+        """)
+        conn.commit()
+
+        cursor.execute("SELECT COUNT(*) FROM reports")
+        days = cursor.fetchone()[0]
+        cursor.execute("SELECT COUNT(*) FROM user_daily_usage")
+        user_days = cursor.fetchone()[0]
+        return days, user_days
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+#---Rollups: Ensures Tables Exist---
+# Runs once per process on its own connection. Call it before borrowing a connection for a
+# write, never inside an open transaction: the first run on a database migrates `reports`
+# (DDL commits implicitly) and backfills it from history. main.py runs it at startup.
+def ensure_rollups():
+    global _ensured
+    if _ensured:
+        return
+    with _ensure_lock:
+        if _ensured:
+            return
+        with db_connection() as conn:
+            if not backfill_done(conn):
+                cursor = conn.cursor()
+                try:
+                    create_rollup_tables(cursor)
+                finally:
+                    cursor.close()
+                days, user_days = backfill(conn)
+                print(f"Rollups: created and backfilled {days} day(s), {user_days} user-day(s).")
+        _ensured = True
+
+
+#---Rollups: Applies Deltas---
+# deltas maps (report_date, user_id) -> {column: amount}; user_id None only touches `reports`.
+def _apply(cursor, deltas):
+    daily = defaultdict(lambda: defaultdict(int))
+    for (day, user_id), changes in deltas.items():
+        for column, amount in changes.items():
+            daily[str(day)][column] += amount
+
+    for day, changes in daily.items():
+        _upsert(cursor, "reports", ("report_date",), (day,), changes, DAILY_COLUMNS)
+    for (day, user_id), changes in deltas.items():
+        if user_id is not None:
+            _upsert(cursor, "user_daily_usage", ("report_date", "user_id"), (str(day), user_id), changes,
+                    USER_COLUMNS)
+
+
+#---Rollups: Upserts One Row---
+def _upsert(cursor, table, key_columns, key_values, changes, allowed):
+    changes = {column: amount for column, amount in changes.items() if column in allowed and amount}
+    if not changes:
+        return
+    columns = list(key_columns) + list(changes)
+    placeholders = ", ".join(["%s"] * len(columns))
+    updates = ", ".join(f"{column} = {column} + VALUES({column})" for column in changes)
+    cursor.execute(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) ON DUPLICATE KEY UPDATE {updates}",
+        tuple(key_values) + tuple(changes.values()))
+
+
+# The record_* helpers run inside the caller's write transaction and expect ensure_rollups()
+# to have run already.
+
+#---Rollups: Records New Job---
+# Call inside the transaction that inserts the job with created_at = NOW().
+def record_job_created(cursor, user_id):
+    cursor.execute("SELECT CURDATE()")
+    day = cursor.fetchone()[0]
+    _apply(cursor, {(day, user_id): {"total_jobs": 1}})
+
+
+#---Rollups: Records Payment---
+# Call inside the transaction, after inserting the payment with payment_timestamp = NOW().
+# paid_jobs counts distinct jobs per day like the backfill, so only the job's first payment
+# of the day adds to it.
+def record_payment(cursor, job_id, amount):
+    cursor.execute("""
+        SELECT CURDATE(), COUNT(*) FROM payments
+        WHERE job_id = %s AND DATE(payment_timestamp) = CURDATE()
+    """, (job_id,))
+    day, payments_today = cursor.fetchone()
+    cursor.execute("SELECT user_id FROM print_jobs WHERE job_id = %s", (job_id,))
+    row = cursor.fetchone()
+    user_id = row[0] if row else None
+    _apply(cursor, {(day, user_id): {"total_revenue": Decimal(str(amount)),
+                                     "paid_jobs": 1 if payments_today <= 1 else 0}})
+
+
+#---Rollups: Records Status Change---
+# Call inside the transaction, before the UPDATE: the old row is locked and read here.
+# Returns the timestamp string to store in updated_at, or None if the job is missing or
+# not in expected_status (the caller then skips its UPDATE).
+def record_status_change(cursor, job_id, new_status, expected_status=None):
+    cursor.execute("""
+        SELECT user_id, pages, status, DATE(created_at), updated_at, NOW()
+        FROM print_jobs WHERE job_id = %s FOR UPDATE
+    """, (job_id,))
+    row = cursor.fetchone()
+    if not row:
+        return None
+    user_id, pages, old_status, created_day, old_updated_at, now = row
+    changed_at = now.strftime("%Y-%m-%d %H:%M:%S")
+    if expected_status is not None and old_status != expected_status:
+        return None
+
+    deltas = defaultdict(lambda: defaultdict(int))
+    created_day = str(created_day)
+    printed_change = (new_status in PRINTED_STATUSES) - (old_status in PRINTED_STATUSES)
+    if printed_change and pages:
+        deltas[(created_day, user_id)]["pages_printed"] += printed_change * int(pages)
+
+    if old_status in FINAL_STATUS_COLUMNS:
+        # Legacy rows have updated_at = ''; the backfill counted those on their creation day
+        old_day = old_updated_at[:10] if old_updated_at else created_day
+        deltas[(old_day, user_id)][FINAL_STATUS_COLUMNS[old_status]] -= 1
+    if new_status in FINAL_STATUS_COLUMNS:
+        deltas[(changed_at[:10], user_id)][FINAL_STATUS_COLUMNS[new_status]] += 1
+
+    _apply(cursor, deltas)
+    return changed_at
+
+
+#---Rollups: Backfill Command---
+# Usage: python rollups.py --backfill
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the daily report rollup tables.")
+    parser.add_argument("--backfill", action="store_true",
+                        help="create the rollup tables if needed and rebuild them from print_jobs and payments")
+    args = parser.parse_args()
+    if not args.backfill:
+        parser.print_help()
+        return
+
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            create_rollup_tables(cursor)
+        finally:
+            cursor.close()
+        days, user_days = backfill(conn)
+    print(f"Rebuilt {days} day(s) and {user_days} user-day(s) of rollups.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+import itertools
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+#---Tasks: Background Job Runner---
+class TaskRunner:
+    """Runs DB/IO work on worker threads and hands results back to Tk on the main loop.
+
+    Each job is submitted under an (owner, name) key. Submitting again under the same key,
+    or cancelling the owner, makes any older result for that key stale so it is dropped
+    instead of overwriting newer data on screen. Only keys with a job in flight are tracked;
+    generations come from one runner-wide counter, so a dropped key never reuses a number.
+    """
+
+    def __init__(self, root, max_workers=None, poll_ms=20):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or int(os.getenv("UI_WORKERS", "4")),
+            thread_name_prefix="ui-worker",
+        )
+        self._results = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._generations = {}
+        self._next_generation = itertools.count(1)
+        self._futures = {}
+        self._pending = 0
+        self._poll_id = None
+        self._closed = False
+
+    #---Tasks: Key Helper---
+    @staticmethod
+    def _key(owner, name):
+        return (id(owner), name)
+
+    #---Tasks: Submits Job---
+    def submit(self, owner, name, fn, *args, on_done=None, on_error=None, **kwargs):
+        if self._closed:
+            return None
+        key = self._key(owner, name)
+        with self._lock:
+            generation = next(self._next_generation)
+            self._generations[key] = generation
+            previous = self._futures.pop(key, None)
+        if previous is not None:
+            self._cancel_future(previous)
+
+        def work():
+            try:
+                result = fn(*args, **kwargs)
+                self._results.put((key, generation, owner, on_done, result, None))
+            except Exception as e:
+                self._results.put((key, generation, owner, on_error, None, e))
+
+        future = self._executor.submit(work)
+        with self._lock:
+            self._futures[key] = future
+            self._pending += 1
+        self._schedule_poll()
+        return future
+
+    #---Tasks: Cancels One Job---
+    def cancel(self, owner, name):
+        key = self._key(owner, name)
+        with self._lock:
+            self._generations.pop(key, None)
+            future = self._futures.pop(key, None)
+        if future is not None:
+            self._cancel_future(future)
+
+    #---Tasks: Cancels All Jobs of Owner---
+    def cancel_owner(self, owner):
+        owner_id = id(owner)
+        with self._lock:
+            keys = [key for key in self._generations if key[0] == owner_id]
+            futures = []
+            for key in keys:
+                del self._generations[key]
+                future = self._futures.pop(key, None)
+                if future is not None:
+                    futures.append(future)
+        for future in futures:
+            self._cancel_future(future)
+
+    #---Tasks: Drops Queued Future---
+    # A job that never started will never report back, so it no longer counts as pending.
+    def _cancel_future(self, future):
+        if future.cancel():
+            with self._lock:
+                self._pending -= 1
+
+    #---Tasks: Schedules Result Polling---
+    def _schedule_poll(self):
+        if self._poll_id is None and not self._closed:
+            try:
+                self._poll_id = self.root.after(self.poll_ms, self._drain)
+            except Exception:
+                self._poll_id = None
+
+    #---Tasks: Delivers Finished Results---
+    def _drain(self):
+        self._poll_id = None
+        while True:
+            try:
+                key, generation, owner, callback, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            with self._lock:
+                self._pending -= 1
+                current = self._generations.get(key) == generation
+                if current:
+                    del self._generations[key]
+                    self._futures.pop(key, None)
+
+            if not current or (callback is None and error is None):
+                continue
+            try:
+                if hasattr(owner, "winfo_exists") and not owner.winfo_exists():
+                    continue
+            except Exception:
+                continue
+
+            try:
+                if error is not None:
+                    if callback is not None:
+                        callback(error)
+                    else:
+                        print(f"Background task {key[1]} failed: {error}")
+                else:
+                    callback(result)
+            except Exception as e:
+                print(f"Error in callback for background task {key[1]}: {e}")
+
+        with self._lock:
+            still_pending = self._pending > 0
+        if still_pending:
+            self._schedule_poll()
+
+    #---Tasks: Shuts Down Workers---
+    def shutdown(self):
+        self._closed = True
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+#---Tasks: Runner Lookup---
+# Frames call this with their controller; falls back to running inline if no runner is attached.
+def run_in_background(controller, owner, name, fn, *args, on_done=None, on_error=None, **kwargs):
+    runner = getattr(controller, "tasks", None)
+    if runner is not None:
+        return runner.submit(owner, name, fn, *args, on_done=on_done, on_error=on_error, **kwargs)
+    try:
+        result = fn(*args, **kwargs)
+    except Exception as e:
+        if on_error:
+            on_error(e)
+        else:
+            print(f"Task {name} failed: {e}")
+        return None
+    if on_done:
+        on_done(result)
+    return None
+
+
+_write_ids = itertools.count(1)
+
+
+#---Tasks: Runs Write Job---
+# For saves and exports. They run under the controller, which show_frame never cancels, and each
+# gets its own key so a later job does not supersede it; the callback runs even after the user
+# has moved to another screen.
+def run_write_in_background(controller, name, fn, *args, on_done=None, on_error=None, **kwargs):
+    return run_in_background(controller, controller, f"{name}#{next(_write_ids)}", fn, *args,
+                             on_done=on_done, on_error=on_error, **kwargs)
+
+
+#---Tasks: Cancels Job by Name---
+def cancel_background(controller, owner, name):
+    runner = getattr(controller, "tasks", None)
+    if runner is not None:
+        runner.cancel(owner, name)
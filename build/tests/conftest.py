@@ -0,0 +1,52 @@
+import sys
+import types
+from pathlib import Path
+
+# The app modules live flat in build/.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# db_pool only needs the connector's error classes and connect(); tests replace connect() with
+# a fake, so a stand-in module is enough when mysql-connector is not installed.
+try:
+    import mysql.connector  # noqa: F401
+except ImportError:
+    errors = types.ModuleType("mysql.connector.errors")
+
+    class Error(Exception):
+        pass
+
+    class OperationalError(Error):
+        pass
+
+    class PoolError(Error):
+        pass
+
+    errors.Error = Error
+    errors.OperationalError = OperationalError
+    errors.PoolError = PoolError
+
+    connector = types.ModuleType("mysql.connector")
+    connector.Error = Error
+    connector.errors = errors
+
+    def connect(**kwargs):
+        raise Error("mysql-connector is not installed")
+
+    connector.connect = connect
+
+    mysql = types.ModuleType("mysql")
+    mysql.connector = connector
+    sys.modules.update({"mysql": mysql, "mysql.connector": connector, "mysql.connector.errors": errors})
+
+# utils loads .env and imports bcrypt at module level; neither is used by the code under test.
+try:
+    import dotenv  # noqa: F401
+except ImportError:
+    dotenv = types.ModuleType("dotenv")
+    dotenv.load_dotenv = lambda *args, **kwargs: False
+    sys.modules["dotenv"] = dotenv
+try:
+    import bcrypt  # noqa: F401
+except ImportError:
+    bcrypt = types.ModuleType("bcrypt")
+    sys.modules["bcrypt"] = bcrypt
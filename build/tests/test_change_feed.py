@@ -0,0 +1,159 @@
+import pytest
+
+import change_feed
+from change_feed import ChangeFeed, after_baseline, subscribe_changes
+
+
+class FakeController:
+    """No task runner, so background jobs run inline; timers are collected, not run."""
+
+    def __init__(self):
+        self.current_frame = None
+        self.timers = []
+        self.cancelled = []
+
+    def after(self, ms, callback):
+        self.timers.append(callback)
+        return len(self.timers)
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+
+    def fire(self):
+        timers, self.timers = self.timers, []
+        for callback in timers:
+            callback()
+
+
+class Frame:
+    def __init__(self):
+        self.changes = []
+
+    def on_feed_change(self, topics, since):
+        self.changes.append((topics, since))
+
+
+class Database:
+    def __init__(self):
+        self.marks = {"job_id": 5, "job_updated_at": "2026-10-18 09:00:00", "notif_id": 3, "payment_id": 2}
+        self.reads = 0
+
+    def fetch_marks(self):
+        self.reads += 1
+        return dict(self.marks)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = Database()
+    monkeypatch.setattr(change_feed, "fetch_marks", db.fetch_marks)
+    return db
+
+
+@pytest.fixture
+def controller():
+    controller = FakeController()
+    controller.feed = ChangeFeed(controller, interval_ms=1000)
+    return controller
+
+
+def show(controller, frame):
+    controller.current_frame = frame
+    subscribe_changes(controller, frame, frame.on_feed_change)
+
+
+def test_baseline_is_read_before_the_load(controller, db, monkeypatch):
+    order = []
+    monkeypatch.setattr(change_feed, "fetch_marks", lambda: order.append("marks") or db.fetch_marks())
+
+    load = after_baseline(controller, lambda user_id: order.append("load") or [user_id])
+    assert load(7) == [7]
+    assert order == ["marks", "load"]
+
+
+def test_change_between_baseline_and_load_is_reported(controller, db):
+    frame = Frame()
+    show(controller, frame)
+    baseline = dict(db.marks)
+
+    def load():
+        # A job committed after the baseline was read must show up in the next poll
+        db.marks["job_id"] = 6
+        return []
+
+    after_baseline(controller, load)()
+    controller.fire()
+    assert frame.changes == [({"print_jobs"}, baseline)]
+
+
+def test_subscribe_does_not_poll_on_its_own(controller, db):
+    show(controller, Frame())
+    assert db.reads == 0
+    assert len(controller.timers) == 1
+
+
+def test_first_poll_without_baseline_only_records_marks(controller, db):
+    frame = Frame()
+    show(controller, frame)
+    controller.fire()
+    db.marks["notif_id"] = 4
+    controller.fire()
+    assert [topics for topics, since in frame.changes] == [{"notifications"}]
+
+
+@pytest.mark.parametrize("mark, value, topic", [
+    ("job_id", 6, "print_jobs"),
+    ("job_updated_at", "2026-10-18 10:00:00", "print_jobs"),
+    ("payment_id", 3, "payments"),
+    ("notif_id", 4, "notifications"),
+])
+def test_each_mark_maps_to_its_topic(controller, db, mark, value, topic):
+    frame = Frame()
+    show(controller, frame)
+    controller.feed.take_baseline()
+    db.marks[mark] = value
+    controller.fire()
+    assert [topics for topics, since in frame.changes] == [{topic}]
+
+
+def test_no_change_no_callback(controller, db):
+    frame = Frame()
+    show(controller, frame)
+    controller.feed.take_baseline()
+    controller.fire()
+    controller.fire()
+    assert frame.changes == []
+    assert db.reads == 3
+
+
+def test_hidden_subscriber_is_not_polled(controller, db):
+    frame = Frame()
+    show(controller, frame)
+    controller.current_frame = object()
+    controller.fire()
+    assert db.reads == 0
+    assert len(controller.timers) == 1
+
+
+def test_failed_baseline_still_loads(controller, monkeypatch):
+    def fail():
+        raise OSError("database down")
+
+    monkeypatch.setattr(change_feed, "fetch_marks", fail)
+    assert after_baseline(controller, lambda: "rows")() == "rows"
+
+
+def test_after_baseline_without_feed_is_a_no_op():
+    def load():
+        return "rows"
+
+    assert after_baseline(object(), load) is load
+
+
+def test_stop_cancels_the_timer(controller, db):
+    show(controller, Frame())
+    controller.feed.stop()
+    assert controller.cancelled == [1]
+    controller.timers.clear()
+    controller.feed.subscribe(Frame(), lambda topics, since: None)
+    assert controller.timers == []
@@ -0,0 +1,171 @@
+import threading
+
+import mysql.connector
+import pytest
+
+import db_pool
+
+
+class FakeConnection:
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+        self.alive = True
+        self.rollback_fails = False
+        self.rollbacks = 0
+        self.pings = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+        if self.rollback_fails:
+            raise mysql.connector.Error("connection lost")
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+        if not self.alive:
+            raise mysql.connector.Error("gone away")
+
+    def close(self):
+        self.closed = True
+
+    def cursor(self):
+        return "cursor"
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    opened = []
+
+    def connect(**kwargs):
+        conn = FakeConnection(len(opened))
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(db_pool.mysql.connector, "connect", connect)
+    return opened
+
+
+def test_released_connection_is_reused(connections):
+    pool = db_pool.ConnectionPool(size=2)
+    conn = pool.acquire()
+    first = conn._raw
+    conn.close()
+
+    again = pool.acquire()
+    assert again._raw is first
+    assert len(connections) == 1
+    stats = pool.stats()
+    assert stats["borrows"] == 2
+    assert stats["handshakes"] == 1
+
+
+def test_release_rolls_back_open_transaction(connections):
+    pool = db_pool.ConnectionPool(size=1)
+    with pool.connection() as conn:
+        raw = conn._raw
+    assert raw.rollbacks == 1
+    assert pool.stats()["idle"] == 1
+
+
+def test_wrapper_proxies_and_refuses_use_after_close(connections):
+    pool = db_pool.ConnectionPool(size=1)
+    conn = pool.acquire()
+    assert conn.cursor() == "cursor"
+    assert conn.is_connected()
+    conn.close()
+    assert not conn.is_connected()
+    with pytest.raises(mysql.connector.errors.OperationalError):
+        conn.cursor()
+
+
+def test_connection_that_fails_rollback_is_discarded(connections):
+    pool = db_pool.ConnectionPool(size=1)
+    conn = pool.acquire()
+    raw = conn._raw
+    raw.rollback_fails = True
+    conn.close()
+
+    assert raw.closed
+    stats = pool.stats()
+    assert stats["discarded"] == 1
+    assert stats["open"] == 0
+
+    replacement = pool.acquire()
+    assert replacement._raw is not raw
+    assert len(connections) == 2
+
+
+def test_dead_idle_connection_is_replaced_on_borrow(connections):
+    pool = db_pool.ConnectionPool(size=1, ping_after=0)
+    conn = pool.acquire()
+    raw = conn._raw
+    conn.close()
+    raw.alive = False
+
+    again = pool.acquire()
+    assert again._raw is not raw
+    assert raw.pings == 1
+    assert raw.closed
+    assert pool.stats()["reconnects"] == 1
+
+
+def test_recently_used_connection_is_not_pinged(connections):
+    pool = db_pool.ConnectionPool(size=1, ping_after=60)
+    pool.acquire().close()
+    pool.acquire()
+    assert connections[0].pings == 0
+
+
+def test_acquire_times_out_when_pool_is_exhausted(connections):
+    pool = db_pool.ConnectionPool(size=1)
+    held = pool.acquire()
+    with pytest.raises(mysql.connector.errors.PoolError, match=r"within 0\.05s"):
+        pool.acquire(timeout=0.05)
+    assert pool.stats()["waits"] == 1
+    held.close()
+
+
+def test_waiting_borrower_gets_released_connection(connections):
+    pool = db_pool.ConnectionPool(size=1)
+    held = pool.acquire()
+    raw = held._raw
+    borrowed = []
+
+    def borrow():
+        conn = pool.acquire(timeout=2)
+        borrowed.append(conn._raw)
+        conn.close()
+
+    waiter = threading.Thread(target=borrow)
+    waiter.start()
+    held.close()
+    waiter.join(2)
+
+    assert borrowed == [raw]
+    assert len(connections) == 1
+
+
+def test_failed_connect_frees_its_slot(monkeypatch):
+    def connect(**kwargs):
+        raise mysql.connector.Error("refused")
+
+    monkeypatch.setattr(db_pool.mysql.connector, "connect", connect)
+    pool = db_pool.ConnectionPool(size=1)
+    with pytest.raises(mysql.connector.Error):
+        pool.acquire()
+    assert pool.stats()["open"] == 0
+
+
+def test_close_all_closes_idle_connections(connections):
+    pool = db_pool.ConnectionPool(size=2)
+    first, second = pool.acquire(), pool.acquire()
+    first.close()
+    second.close()
+    pool.close_all()
+    assert all(conn.closed for conn in connections)
+    assert pool.stats()["open"] == 0
+
+
+def test_default_size_covers_workers_and_background_threads(monkeypatch):
+    monkeypatch.setenv("UI_WORKERS", "4")
+    assert db_pool.default_pool_size() == 4 + db_pool.BACKGROUND_BORROWERS + db_pool.POOL_HEADROOM
@@ -0,0 +1,93 @@
+import sys
+import types
+
+import pytest
+
+import doc_inspect
+from doc_inspect import suggest_color_option
+
+
+def write_pdf(path, kinds):
+    body = b"%PDF-1.4\n"
+    for number, kind in enumerate(kinds, start=1):
+        body += b"%d 0 obj << /Type " % number + kind + b" >> endobj\n" + b"x" * 40 + b"\n"
+    path.write_bytes(body + b"%%EOF\n")
+    return path
+
+
+@pytest.fixture
+def without_pypdf(monkeypatch):
+    # A None entry makes `from pypdf import ...` raise ImportError
+    monkeypatch.setitem(sys.modules, "pypdf", None)
+
+
+#---_pdf_page_count---
+def test_page_count_uses_pypdf_when_installed(tmp_path, monkeypatch):
+    opened = []
+
+    class PdfReader:
+        def __init__(self, path):
+            opened.append(path)
+            self.pages = [object()] * 7
+
+    monkeypatch.setitem(sys.modules, "pypdf", types.SimpleNamespace(PdfReader=PdfReader))
+    path = tmp_path / "doc.pdf"
+    assert doc_inspect._pdf_page_count(path) == 7
+    assert opened == [path]
+
+
+def test_page_count_scan_skips_page_tree_nodes(tmp_path, without_pypdf):
+    path = write_pdf(tmp_path / "doc.pdf", [b"/Catalog", b"/Pages", b"/Page", b"/Page", b"/Page"])
+    assert doc_inspect._pdf_page_count(path) == 3
+
+
+@pytest.mark.parametrize("chunk_size", [7, 16, 33, 64, 101])
+def test_page_count_scan_across_chunk_boundaries(tmp_path, without_pypdf, monkeypatch, chunk_size):
+    monkeypatch.setattr(doc_inspect, "CHUNK_SIZE", chunk_size)
+    monkeypatch.setattr(doc_inspect, "PAGE_SCAN_OVERLAP", 32)
+    path = write_pdf(tmp_path / "doc.pdf", [b"/Pages"] + [b"/Page"] * 9)
+    assert doc_inspect._pdf_page_count(path) == 9
+
+
+def test_page_count_scan_without_pages_is_none(tmp_path, without_pypdf):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.4\nnot really a pdf\n")
+    assert doc_inspect._pdf_page_count(path) is None
+
+
+#---suggest_color_option---
+@pytest.mark.parametrize("result, option", [
+    ({"pages": 4, "color_pages": 0}, "bw"),
+    ({"pages": 4, "color_pages": 1}, "pc"),
+    ({"pages": 4, "color_pages": 4}, "color"),
+    ({"pages": 4, "color_pages": None}, None),
+    ({"pages": None, "color_pages": 2}, None),
+    ({"pages": 0, "color_pages": 0}, None),
+    ({}, None),
+])
+def test_suggest_color_option(result, option):
+    assert suggest_color_option(result) == option
+
+
+#---inspect_file caching---
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(doc_inspect, "_memory_cache", doc_inspect.OrderedDict())
+    monkeypatch.setattr(doc_inspect, "CACHE_DIR", tmp_path / "inspect")
+    return doc_inspect._memory_cache
+
+
+def test_known_hash_skips_hashing(cache, monkeypatch):
+    monkeypatch.setattr(doc_inspect, "_hash_file", lambda path: pytest.fail("file hashed again"))
+    cache["abc"] = {"pages": 2}
+    assert doc_inspect.inspect_file("doc.pdf", content_hash="abc") == {"pages": 2}
+
+
+def test_memory_cache_drops_least_recently_used(cache, monkeypatch):
+    monkeypatch.setattr(doc_inspect, "MEMORY_CACHE_SIZE", 2)
+    doc_inspect._cache_put("a", {"pages": 1})
+    doc_inspect._cache_put("b", {"pages": 2})
+    assert doc_inspect._cache_get("a") == {"pages": 1}
+    doc_inspect._cache_put("c", {"pages": 3})
+    assert list(cache) == ["a", "c"]
+    assert doc_inspect._cache_get("b") is None
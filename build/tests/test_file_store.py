@@ -0,0 +1,159 @@
+import os
+import time
+from contextlib import contextmanager
+
+import pytest
+
+import file_store
+import utils
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    root = tmp_path / "uploads"
+    monkeypatch.setattr(file_store, "STORE_ROOT", root)
+    monkeypatch.setattr(file_store, "BLOB_DIR", root / "blobs")
+    monkeypatch.setattr(file_store, "TMP_DIR", root / "tmp")
+    return root
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def age(path, seconds):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+#---store_file---
+def test_store_file_dedups_identical_content(store, tmp_path):
+    first = file_store.store_file(write(tmp_path / "a.pdf", b"same bytes"), chunk_size=4)
+    second = file_store.store_file(write(tmp_path / "b.pdf", b"same bytes"))
+
+    assert first == second
+    content_hash, size, path = first
+    assert size == len(b"same bytes")
+    assert path == f"uploads/blobs/{content_hash[:2]}/{content_hash}"
+    assert [p.name for p in (store / "blobs").glob("*/*")] == [content_hash]
+    assert list((store / "tmp").iterdir()) == []
+
+
+def test_store_file_progress_counts_every_byte(store, tmp_path):
+    progress = file_store.CopyProgress(total=10)
+    file_store.store_file(write(tmp_path / "a.pdf", b"0123456789"), progress=progress, chunk_size=3)
+    assert progress.done == 10
+    assert progress.fraction() == 1.0
+
+
+def test_store_file_removes_temp_on_error(store, tmp_path):
+    class Failing:
+        def advance(self, count):
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        file_store.store_file(write(tmp_path / "a.pdf", b"data"), progress=Failing())
+
+    assert list((store / "tmp").iterdir()) == []
+    assert not (store / "blobs").exists()
+
+
+def test_store_file_missing_source_leaves_no_temp(store, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        file_store.store_file(tmp_path / "missing.pdf")
+    assert list((store / "tmp").iterdir()) == []
+
+
+#---stored_path / resolve_stored_path---
+def test_stored_path_is_relative_to_store_root(store):
+    assert file_store.stored_path(store / "blobs" / "ab" / "abc") == "uploads/blobs/ab/abc"
+
+
+@pytest.mark.parametrize("value, parts", [
+    ("uploads/blobs/ab/abc", ("blobs", "ab", "abc")),
+    ("uploads\\report.pdf", ("report.pdf",)),
+    ("D:\\copy_corner\\build\\uploads\\report.pdf", ("report.pdf",)),
+    ("/srv/uploads/old/build/uploads/blobs/ab/abc", ("blobs", "ab", "abc")),
+    ("C:/Users/Admin/Uploads/report.pdf", ("report.pdf",)),
+])
+def test_resolve_stored_path_remaps_onto_store_root(store, value, parts):
+    assert file_store.resolve_stored_path(value) == store.joinpath(*parts)
+
+
+def test_resolve_stored_path_round_trips(store):
+    target = store / "blobs" / "ab" / "abc"
+    assert file_store.resolve_stored_path(file_store.stored_path(target)) == target
+
+
+def test_resolve_stored_path_outside_uploads(store):
+    assert str(file_store.resolve_stored_path("/data/report.pdf")) == "/data/report.pdf"
+    assert file_store.resolve_stored_path("docs/report.pdf") == \
+        file_store.Path(file_store.__file__).parent / "docs" / "report.pdf"
+
+
+#---collect_garbage---
+class FakeCursor:
+    def __init__(self, hashes):
+        self.hashes = hashes
+
+    def execute(self, query, params=None):
+        pass
+
+    def fetchall(self):
+        return [(h,) for h in self.hashes]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, hashes):
+        self.hashes = hashes
+
+    def cursor(self):
+        return FakeCursor(self.hashes)
+
+
+@pytest.fixture
+def referenced(monkeypatch):
+    hashes = set()
+
+    @contextmanager
+    def fake_db_connection():
+        yield FakeConnection(hashes)
+
+    monkeypatch.setattr(utils, "db_connection", fake_db_connection)
+    return hashes
+
+
+def test_collect_garbage_respects_grace_window(store, referenced):
+    kept = write(store / "blobs" / "aa" / "aakept", b"kept")
+    orphan = write(store / "blobs" / "bb" / "bborphan", b"orphan")
+    fresh = write(store / "blobs" / "cc" / "ccfresh", b"fresh")
+    stale_part = write(store / "tmp" / "old.part", b"partial")
+    fresh_part = write(store / "tmp" / "new.part", b"partial")
+    referenced.add("aakept")
+    for path in (kept, orphan, stale_part):
+        age(path, 7200)
+
+    removed, freed = file_store.collect_garbage(grace_seconds=3600)
+
+    assert (removed, freed) == (2, len(b"orphan") + len(b"partial"))
+    assert kept.exists() and fresh.exists() and fresh_part.exists()
+    assert not orphan.exists() and not stale_part.exists()
+
+
+def test_collect_garbage_dry_run_keeps_files(store, referenced):
+    orphan = write(store / "blobs" / "bb" / "bborphan", b"orphan")
+    age(orphan, 7200)
+
+    assert file_store.collect_garbage(dry_run=True, grace_seconds=3600) == (1, len(b"orphan"))
+    assert orphan.exists()
+    assert file_store.collect_garbage(grace_seconds=0) == (1, len(b"orphan"))
+    assert not orphan.exists()
+
+
+def test_collect_garbage_without_store(store, referenced):
+    assert file_store.collect_garbage() == (0, 0)
@@ -0,0 +1,87 @@
+import re
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+import frame_registry
+from frame_registry import FRAME_MODULES, LOAD_METHODS, PRELOAD_AFTER_LOGIN, FrameRegistry
+
+BUILD_DIR = Path(frame_registry.__file__).parent
+
+
+class Controller:
+    """No task runner attached, so preloads run inline."""
+
+
+@pytest.fixture
+def fake_frames(monkeypatch):
+    imported = []
+
+    def module(module_name, class_name):
+        fake = types.ModuleType(module_name)
+        setattr(fake, class_name, type(class_name, (), {}))
+        monkeypatch.setitem(sys.modules, module_name, fake)
+        imported.append(module_name)
+        return fake
+
+    modules = {"HomeFrame": module("fake_home", "HomeFrame"), "OtherFrame": module("fake_other", "OtherFrame")}
+    monkeypatch.setattr(frame_registry, "FRAME_MODULES",
+                        {"HomeFrame": "fake_home", "OtherFrame": "fake_other", "BrokenFrame": "fake_missing"})
+    monkeypatch.setattr(frame_registry, "PRELOAD_AFTER_LOGIN", {"user": ["OtherFrame", "BrokenFrame"]})
+    return modules
+
+
+def test_get_imports_module_and_caches_class(fake_frames, monkeypatch):
+    registry = FrameRegistry(Controller())
+    frame_class = registry.get("HomeFrame")
+    assert frame_class is fake_frames["HomeFrame"].HomeFrame
+
+    monkeypatch.delitem(sys.modules, "fake_home")
+    assert registry.get("HomeFrame") is frame_class
+
+
+def test_get_unknown_frame_raises(fake_frames):
+    with pytest.raises(KeyError):
+        FrameRegistry(Controller()).get("NoSuchFrame")
+
+
+def test_preload_imports_role_frames_and_skips_failures(fake_frames, capsys):
+    registry = FrameRegistry(Controller())
+    registry.preload("user")
+    assert registry._classes == {"OtherFrame": fake_frames["OtherFrame"].OtherFrame}
+    assert "Error preloading BrokenFrame" in capsys.readouterr().out
+
+
+def test_preload_skips_loaded_frames_and_unknown_roles(fake_frames, monkeypatch):
+    registry = FrameRegistry(Controller())
+    registry.get("OtherFrame")
+    submitted = []
+    monkeypatch.setattr(frame_registry, "run_in_background", lambda *args: submitted.append(args[2:]))
+    registry.preload("user")
+    registry.preload("guest")
+    assert len(submitted) == 1
+    assert submitted[0][1:] == (registry._import_frames, ["BrokenFrame"])
+
+
+#---Tables---
+def source(module_name):
+    return (BUILD_DIR / f"{module_name}.py").read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("name, module_name", sorted(FRAME_MODULES.items()))
+def test_every_frame_module_defines_its_class(name, module_name):
+    assert re.search(rf"^class {name}\b", source(module_name), re.MULTILINE)
+
+
+def test_preload_lists_only_known_frames():
+    for names in PRELOAD_AFTER_LOGIN.values():
+        assert set(names) <= set(FRAME_MODULES)
+
+
+def test_every_load_method_is_defined_by_a_frame():
+    sources = [source(module_name) for module_name in set(FRAME_MODULES.values())]
+    assert len(set(LOAD_METHODS)) == len(LOAD_METHODS)
+    for method in LOAD_METHODS:
+        assert any(re.search(rf"^\s+def {method}\(self\)", text, re.MULTILINE) for text in sources), method
@@ -0,0 +1,65 @@
+import pytest
+
+import image_cache
+
+
+class FakePhotoImage:
+    """Stands in for tkinter.PhotoImage, which needs a Tk interpreter."""
+
+    decoded = []
+
+    def __init__(self, file):
+        with open(file, "rb"):
+            pass
+        self.file = file
+        FakePhotoImage.decoded.append(file)
+
+
+@pytest.fixture(autouse=True)
+def fake_tk(monkeypatch):
+    FakePhotoImage.decoded = []
+    monkeypatch.setattr(image_cache, "PhotoImage", FakePhotoImage)
+    image_cache.clear()
+    yield
+    image_cache.clear()
+
+
+def test_same_content_in_different_folders_shares_one_image(tmp_path):
+    first = tmp_path / "a" / "icon.png"
+    second = tmp_path / "b" / "icon.png"
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_bytes(b"same icon")
+
+    assert image_cache.load_image(first) is image_cache.load_image(second)
+    assert len(FakePhotoImage.decoded) == 1
+
+
+def test_same_path_is_hashed_once(tmp_path, monkeypatch):
+    path = tmp_path / "icon.png"
+    path.write_bytes(b"icon")
+    image = image_cache.load_image(path)
+
+    monkeypatch.setattr(image_cache.hashlib, "sha1", lambda data: pytest.fail("hashed again"))
+    assert image_cache.load_image(str(path)) is image
+    assert image_cache.load_image(tmp_path / "." / "icon.png") is image
+
+
+def test_different_content_gets_its_own_image(tmp_path):
+    (tmp_path / "a.png").write_bytes(b"one")
+    (tmp_path / "b.png").write_bytes(b"two")
+    assert image_cache.load_image(tmp_path / "a.png") is not image_cache.load_image(tmp_path / "b.png")
+
+
+def test_missing_file_raises_like_photoimage(tmp_path):
+    with pytest.raises(OSError):
+        image_cache.load_image(tmp_path / "missing.png")
+    assert image_cache._digests == {}
+
+
+def test_clear_drops_every_image(tmp_path):
+    path = tmp_path / "icon.png"
+    path.write_bytes(b"icon")
+    image = image_cache.load_image(path)
+    image_cache.clear()
+    assert image_cache.load_image(path) is not image
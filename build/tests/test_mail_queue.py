@@ -0,0 +1,151 @@
+import smtplib
+import threading
+
+import pytest
+
+import mail_queue
+from mail_queue import RateLimiter, is_permanent_error, retry_delay
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class StopEvent:
+    """Advances the fake clock instead of sleeping; records each wait."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.waits = []
+
+    def wait(self, delay):
+        self.waits.append(delay)
+        self.clock.now += delay
+        return False
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(mail_queue.time, "monotonic", clock)
+    return clock
+
+
+#---RateLimiter---
+def test_burst_goes_out_without_waiting(clock):
+    limiter = RateLimiter(per_minute=60, burst=3)
+    stop = StopEvent(clock)
+    for _ in range(3):
+        assert limiter.wait(stop)
+    assert stop.waits == []
+
+
+def test_waits_for_refill_after_burst(clock):
+    limiter = RateLimiter(per_minute=60, burst=2)
+    stop = StopEvent(clock)
+    limiter.wait(stop)
+    limiter.wait(stop)
+    assert limiter.wait(stop)
+    assert stop.waits == [pytest.approx(1.0)]
+
+
+def test_refill_is_capped_at_burst(clock):
+    limiter = RateLimiter(per_minute=60, burst=2)
+    stop = StopEvent(clock)
+    limiter.wait(stop)
+    limiter.wait(stop)
+    clock.now += 3600
+    for _ in range(2):
+        limiter.wait(stop)
+    assert stop.waits == []
+    limiter.wait(stop)
+    assert stop.waits == [pytest.approx(1.0)]
+
+
+def test_default_burst_is_ten_seconds_of_rate(clock):
+    assert RateLimiter(per_minute=30).capacity == 5
+    assert RateLimiter(per_minute=3).capacity == 1
+
+
+def test_wait_returns_false_when_stopped(clock):
+    limiter = RateLimiter(per_minute=60, burst=1)
+    stop = threading.Event()
+    limiter.wait(stop)
+    stop.set()
+    assert limiter.wait(stop) is False
+
+
+#---Backoff---
+@pytest.mark.parametrize("attempts, delay", [(1, 30), (2, 60), (3, 120), (7, 1920), (8, 3600), (20, 3600)])
+def test_retry_delay_doubles_up_to_an_hour(attempts, delay):
+    assert retry_delay(attempts, jitter=1.0) == delay
+
+
+def test_retry_delay_jitter_stays_within_twenty_percent():
+    delays = [retry_delay(2) for _ in range(200)]
+    assert all(48 <= delay <= 72 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+#---Error classification---
+@pytest.mark.parametrize("error, permanent", [
+    (smtplib.SMTPRecipientsRefused({"a@example.com": (550, b"no such user")}), True),
+    (smtplib.SMTPDataError(554, b"rejected"), True),
+    (smtplib.SMTPDataError(451, b"try later"), False),
+    (smtplib.SMTPSenderRefused(553, b"bad sender", "me@example.com"), True),
+    (smtplib.SMTPSenderRefused(421, b"busy", "me@example.com"), False),
+    (smtplib.SMTPServerDisconnected("gone"), False),
+    (smtplib.SMTPAuthenticationError(535, b"bad login"), False),
+    (ConnectionResetError(), False),
+    (TimeoutError(), False),
+])
+def test_permanent_vs_retryable(error, permanent):
+    assert is_permanent_error(error) is permanent
+
+
+#---Hand-off from the Tk thread---
+@pytest.fixture
+def handoff(monkeypatch):
+    monkeypatch.setattr(mail_queue, "_handoff", mail_queue.queue.SimpleQueue())
+    worker = type("Worker", (), {"wake": threading.Event()})()
+    monkeypatch.setattr(mail_queue, "start_worker", lambda: worker)
+    return worker
+
+
+def test_submit_only_hands_over(handoff, monkeypatch):
+    monkeypatch.setattr(mail_queue, "enqueue_many", lambda *a, **k: pytest.fail("inserted on the Tk thread"))
+    assert mail_queue.submit("a@example.com", "Code", "<p>1</p>", priority=mail_queue.PRIORITY_OTP)
+    assert not mail_queue.submit("", "Code", "<p>1</p>")
+    assert handoff.wake.is_set()
+
+
+def test_store_handoff_inserts_by_priority(handoff, monkeypatch):
+    calls = []
+    monkeypatch.setattr(mail_queue, "enqueue_many",
+                        lambda rows, priority: calls.append((priority, rows)) or len(rows))
+    mail_queue.submit("bulk@example.com", "News", "<p>n</p>")
+    mail_queue.submit("otp@example.com", "Code", "<p>1</p>", priority=mail_queue.PRIORITY_OTP)
+
+    assert mail_queue.store_handoff() == 2
+    assert calls == [
+        (mail_queue.PRIORITY_OTP, [("otp@example.com", "Code", "<p>1</p>")]),
+        (mail_queue.PRIORITY_BULK, [("bulk@example.com", "News", "<p>n</p>")]),
+    ]
+    assert mail_queue.store_handoff() == 0
+
+
+def test_store_handoff_keeps_rows_when_insert_fails(handoff, monkeypatch):
+    def fail(rows, priority):
+        raise OSError("database down")
+
+    monkeypatch.setattr(mail_queue, "enqueue_many", fail)
+    mail_queue.submit("otp@example.com", "Code", "<p>1</p>", priority=mail_queue.PRIORITY_OTP)
+    with pytest.raises(OSError):
+        mail_queue.store_handoff()
+
+    monkeypatch.setattr(mail_queue, "enqueue_many", lambda rows, priority: len(rows))
+    assert mail_queue.store_handoff() == 1
@@ -0,0 +1,107 @@
+from contextlib import contextmanager
+from decimal import Decimal
+
+import pytest
+
+import utils
+from price_cache import DEFAULT_PRICES, PriceCache
+
+
+class FakeDatabase:
+    """price_list rows and the CHECKSUM TABLE value, plus a count of full reloads."""
+
+    def __init__(self, rows, checksum=1):
+        self.rows = rows
+        self.checksum = checksum
+        self.reloads = 0
+
+    @contextmanager
+    def connection(self):
+        yield self
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.result = None
+
+    def execute(self, query, params=None):
+        if query.startswith("CHECKSUM TABLE"):
+            self.result = [("copy_corner.price_list", self.db.checksum)]
+        else:
+            self.db.reloads += 1
+            self.result = list(self.db.rows)
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeDatabase([("Black & White", "A4", "2.50"), ("Full Colored", "A4", "12.00")])
+    # refresh() imports db_connection from utils when it runs
+    monkeypatch.setattr(utils, "db_connection", db.connection)
+    return db
+
+
+def test_defaults_before_first_refresh():
+    cache = PriceCache()
+    assert cache.snapshot() == DEFAULT_PRICES
+    assert cache.quote(2, 3, "A4", "Black & White") == Decimal("18.00")
+
+
+def test_refresh_loads_price_list(db):
+    cache = PriceCache()
+    assert cache.refresh() is True
+    assert db.reloads == 1
+    assert cache.quote(2, 3, "A4", "Black & White") == Decimal("15.00")
+    assert cache.quote(1, 1, "A4", "Color") == Decimal("12.00")
+
+
+def test_unchanged_checksum_serves_cached_prices(db):
+    cache = PriceCache()
+    cache.refresh()
+    db.rows = [("Black & White", "A4", "99.00")]
+
+    assert cache.refresh() is False
+    assert db.reloads == 1
+    assert cache.price_per_page("Black & White", "A4") == Decimal("2.50")
+
+
+def test_changed_checksum_reloads(db):
+    cache = PriceCache()
+    cache.refresh()
+    db.rows = [("Black & White", "A4", "4.00")]
+    db.checksum = 2
+
+    assert cache.refresh() is True
+    assert db.reloads == 2
+    assert cache.price_per_page("Black & White", "A4") == Decimal("4.00")
+
+
+def test_empty_price_list_keeps_previous_prices(db):
+    cache = PriceCache()
+    db.rows = []
+    cache.refresh()
+    assert cache.snapshot() == DEFAULT_PRICES
+
+
+def test_unknown_option_falls_back_to_black_and_white(db):
+    cache = PriceCache()
+    cache.refresh()
+    assert cache.price_per_page("Partially Colored", "A4") == Decimal("2.50")
+    assert cache.price_per_page("Partially Colored", "Legal") == Decimal("0.00")
+
+
+@pytest.mark.parametrize("pages, copies", [(0, 3), (3, 0), (-1, 2)])
+def test_quote_is_zero_without_pages_or_copies(pages, copies):
+    assert PriceCache().quote(pages, copies, "A4", "Black & White") == Decimal("0.00")
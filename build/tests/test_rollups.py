@@ -0,0 +1,116 @@
+import re
+from datetime import date, datetime
+from decimal import Decimal
+
+import rollups
+
+TODAY = date(2026, 10, 18)
+NOW = datetime(2026, 10, 18, 14, 30, 5)
+
+
+class FakeCursor:
+    """Answers fetchone() from a script, in order, and records every statement."""
+
+    def __init__(self, *rows):
+        self.rows = list(rows)
+        self.executed = []
+
+    def execute(self, query, params=None):
+        self.executed.append((" ".join(query.split()), params))
+
+    def fetchone(self):
+        return self.rows.pop(0)
+
+    def upserts(self):
+        """{(table, key...): {column: amount}} for each rollup upsert issued."""
+        found = {}
+        for query, params in self.executed:
+            match = re.match(r"INSERT INTO (\w+) \(([^)]*)\)", query)
+            if not match:
+                continue
+            table, columns = match.group(1), [c.strip() for c in match.group(2).split(",")]
+            keys = 2 if table == "user_daily_usage" else 1
+            found[(table,) + tuple(params[:keys])] = dict(zip(columns[keys:], params[keys:]))
+        return found
+
+
+#---record_payment---
+def test_first_payment_of_the_day_counts_the_job():
+    cursor = FakeCursor((TODAY, 1), (7,))
+    rollups.record_payment(cursor, 42, 12.5)
+    assert cursor.upserts() == {
+        ("reports", "2026-10-18"): {"total_revenue": Decimal("12.5"), "paid_jobs": 1},
+        ("user_daily_usage", "2026-10-18", 7): {"total_revenue": Decimal("12.5"), "paid_jobs": 1},
+    }
+    assert cursor.executed[0][1] == (42,)
+
+
+def test_later_payment_same_day_only_adds_revenue():
+    cursor = FakeCursor((TODAY, 2), (7,))
+    rollups.record_payment(cursor, 42, "3.00")
+    assert cursor.upserts() == {
+        ("reports", "2026-10-18"): {"total_revenue": Decimal("3.00")},
+        ("user_daily_usage", "2026-10-18", 7): {"total_revenue": Decimal("3.00")},
+    }
+
+
+def test_payment_for_missing_job_only_touches_reports():
+    cursor = FakeCursor((TODAY, 1), None)
+    rollups.record_payment(cursor, 42, 5)
+    assert cursor.upserts() == {("reports", "2026-10-18"): {"total_revenue": Decimal("5"), "paid_jobs": 1}}
+
+
+#---record_status_change---
+def job(status, updated_at="2026-10-01 09:00:00", pages=4, user_id=7):
+    return (user_id, pages, status, date(2026, 9, 30), updated_at, NOW)
+
+
+def test_completing_counts_pages_on_creation_day_and_completion_today():
+    cursor = FakeCursor(job("Pending"))
+    assert rollups.record_status_change(cursor, 42, "Completed") == "2026-10-18 14:30:05"
+    assert cursor.upserts() == {
+        ("reports", "2026-09-30"): {"pages_printed": 4},
+        ("reports", "2026-10-18"): {"completed_jobs": 1},
+        ("user_daily_usage", "2026-09-30", 7): {"pages_printed": 4},
+    }
+    assert "FOR UPDATE" in cursor.executed[0][0]
+
+
+# user_daily_usage has no completed/declined columns; those deltas only reach `reports`.
+def test_completed_to_paid_moves_nothing_but_the_completion():
+    cursor = FakeCursor(job("Completed"))
+    rollups.record_status_change(cursor, 42, "Paid")
+    assert cursor.upserts() == {
+        ("reports", "2026-10-01"): {"completed_jobs": -1},
+    }
+
+
+def test_completed_to_declined_reverses_pages():
+    cursor = FakeCursor(job("Completed"))
+    rollups.record_status_change(cursor, 42, "Declined")
+    assert cursor.upserts() == {
+        ("reports", "2026-09-30"): {"pages_printed": -4},
+        ("reports", "2026-10-01"): {"completed_jobs": -1},
+        ("reports", "2026-10-18"): {"declined_jobs": 1},
+        ("user_daily_usage", "2026-09-30", 7): {"pages_printed": -4},
+    }
+
+
+def test_legacy_empty_updated_at_uses_creation_day():
+    cursor = FakeCursor(job("Declined", updated_at=""))
+    rollups.record_status_change(cursor, 42, "Pending")
+    assert cursor.upserts() == {
+        ("reports", "2026-09-30"): {"declined_jobs": -1},
+    }
+
+
+def test_unexpected_status_changes_nothing():
+    cursor = FakeCursor(job("Paid"))
+    assert rollups.record_status_change(cursor, 42, "Completed", expected_status="Pending") is None
+    assert cursor.upserts() == {}
+
+
+def test_missing_job_changes_nothing():
+    cursor = FakeCursor(None)
+    assert rollups.record_status_change(cursor, 42, "Completed") is None
+    assert cursor.upserts() == {}
@@ -0,0 +1,184 @@
+import threading
+
+import pytest
+
+from task_runner import TaskRunner, run_in_background, run_write_in_background
+
+
+class FakeRoot:
+    """Stands in for Tk: after() callbacks run only when the test calls pump()."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+    def after_cancel(self, poll_id):
+        pass
+
+    def pump(self):
+        callbacks, self.scheduled = self.scheduled, []
+        for callback in callbacks:
+            callback()
+
+
+class Owner:
+    def __init__(self, alive=True):
+        self.alive = alive
+
+    def winfo_exists(self):
+        return self.alive
+
+
+@pytest.fixture
+def runner():
+    root = FakeRoot()
+    runner = TaskRunner(root, max_workers=2)
+    yield runner
+    runner.shutdown()
+
+
+def finish(runner, *futures):
+    for future in futures:
+        if future is not None and not future.cancelled():
+            future.result(timeout=2)
+    runner.root.pump()
+
+
+def test_result_is_delivered_on_drain(runner):
+    results = []
+    future = runner.submit(Owner(), "load", lambda x: x * 2, 21, on_done=results.append)
+    future.result(timeout=2)
+    assert results == []
+    finish(runner)
+    assert results == [42]
+
+
+def test_error_goes_to_on_error(runner):
+    errors = []
+
+    def fail():
+        raise ValueError("boom")
+
+    future = runner.submit(Owner(), "load", fail, on_done=lambda r: None, on_error=errors.append)
+    finish(runner, future)
+    assert len(errors) == 1 and str(errors[0]) == "boom"
+
+
+def test_newer_submit_supersedes_older_result(runner):
+    owner = Owner()
+    release = threading.Event()
+    results = []
+    first = runner.submit(owner, "load", lambda: release.wait(2) and "old", on_done=results.append)
+    second = runner.submit(owner, "load", lambda: "new", on_done=results.append)
+    release.set()
+    finish(runner, first, second)
+    assert results == ["new"]
+
+
+def test_same_name_under_different_owners_is_independent(runner):
+    results = []
+    first = runner.submit(Owner(), "load", lambda: 1, on_done=results.append)
+    second = runner.submit(Owner(), "load", lambda: 2, on_done=results.append)
+    finish(runner, first, second)
+    assert sorted(results) == [1, 2]
+
+
+def test_cancel_owner_drops_running_and_queued_results(runner):
+    owner = Owner()
+    release = threading.Event()
+    results = []
+    running = runner.submit(owner, "a", lambda: release.wait(2) and "a", on_done=results.append)
+    other = runner.submit(owner, "b", lambda: "b", on_done=results.append)
+    runner.cancel_owner(owner)
+    release.set()
+    finish(runner, running, other)
+    assert results == []
+
+
+def test_cancel_owner_leaves_other_owners_alone(runner):
+    leaving, staying = Owner(), Owner()
+    results = []
+    dropped = runner.submit(leaving, "load", lambda: "dropped", on_done=results.append)
+    kept = runner.submit(staying, "load", lambda: "kept", on_done=results.append)
+    runner.cancel_owner(leaving)
+    finish(runner, dropped, kept)
+    assert results == ["kept"]
+
+
+def test_cancel_by_name(runner):
+    owner = Owner()
+    results = []
+    future = runner.submit(owner, "load", lambda: "x", on_done=results.append)
+    runner.cancel(owner, "load")
+    finish(runner, future)
+    assert results == []
+
+
+def test_destroyed_owner_gets_no_callback(runner):
+    owner = Owner()
+    results = []
+    future = runner.submit(owner, "load", lambda: "x", on_done=results.append)
+    owner.alive = False
+    finish(runner, future)
+    assert results == []
+
+
+def test_polling_stops_when_nothing_is_pending(runner):
+    future = runner.submit(Owner(), "load", lambda: None, on_done=lambda r: None)
+    finish(runner, future)
+    assert runner.root.scheduled == []
+
+
+def test_finished_and_cancelled_keys_are_forgotten(runner):
+    owner = Owner()
+    done = [runner.submit(owner, f"load{i}", lambda: None, on_done=lambda r: None) for i in range(5)]
+    cancelled = runner.submit(owner, "search", lambda: None, on_done=lambda r: None)
+    runner.cancel(owner, "search")
+    finish(runner, *done, cancelled)
+    assert runner._generations == {}
+    assert runner._futures == {}
+
+
+def test_resubmit_after_cancel_ignores_the_cancelled_result(runner):
+    owner = Owner()
+    release = threading.Event()
+    results = []
+    old = runner.submit(owner, "load", lambda: release.wait(2) and "old", on_done=results.append)
+    runner.cancel(owner, "load")
+    new = runner.submit(owner, "load", lambda: release.wait(2) and "new", on_done=results.append)
+    release.set()
+    finish(runner, old, new)
+    assert results == ["new"]
+    assert runner._generations == {}
+
+
+def test_submit_after_shutdown_is_ignored(runner):
+    runner.shutdown()
+    assert runner.submit(Owner(), "load", lambda: None) is None
+
+
+def test_run_in_background_runs_inline_without_runner():
+    results, errors = [], []
+    assert run_in_background(object(), Owner(), "load", lambda: 5, on_done=results.append) is None
+    run_in_background(object(), Owner(), "load", lambda: 1 / 0, on_error=errors.append)
+    assert results == [5]
+    assert isinstance(errors[0], ZeroDivisionError)
+
+
+def test_write_jobs_survive_navigation_and_do_not_supersede(runner):
+    controller = Owner()
+    controller.tasks = runner
+    frame = Owner()
+    results = []
+    release = threading.Event()
+    first = run_write_in_background(controller, "save", lambda: release.wait(2) and "first",
+                                    on_done=results.append)
+    second = run_write_in_background(controller, "save", lambda: "second", on_done=results.append)
+    # show_frame cancels the screen being left
+    runner.cancel_owner(frame)
+    release.set()
+    finish(runner, first, second)
+    assert sorted(results) == ["first", "second"]
@@ -0,0 +1,167 @@
+from types import SimpleNamespace
+
+import pytest
+
+from virtual_list import VirtualList
+from admin_print import AdminPrintFrame
+from db_migrate import STATUS_PRIORITY
+
+
+class HeadlessList(VirtualList):
+    """VirtualList's record bookkeeping without any Tk widgets."""
+
+    def __init__(self, items, key=lambda record: record["id"]):
+        self.key = key
+        self.items = list(items)
+        self.selected_key = None
+        self._reindex()
+
+    def _update_scrollregion(self):
+        pass
+
+    def _layout(self):
+        pass
+
+
+def ids(vlist):
+    return [record["id"] for record in vlist.items]
+
+
+def make(*names):
+    return HeadlessList([{"id": name} for name in names])
+
+
+@pytest.mark.parametrize("name, index, expected", [
+    ("A", 2, ["B", "C", "A", "D"]),   # down
+    ("A", 3, ["B", "C", "D", "A"]),   # to the end
+    ("D", 0, ["D", "A", "B", "C"]),   # to the top
+    ("C", 1, ["A", "C", "B", "D"]),   # up one
+    ("B", 1, ["A", "B", "C", "D"]),   # unchanged
+])
+def test_upsert_moves_existing_record(name, index, expected):
+    vlist = make("A", "B", "C", "D")
+    vlist.upsert({"id": name, "moved": True}, index)
+    assert ids(vlist) == expected
+    assert vlist.get(name)["moved"]
+
+
+def test_upsert_inserts_new_record_at_index_and_clamps():
+    vlist = make("A", "B")
+    vlist.upsert({"id": "X"}, 1)
+    vlist.upsert({"id": "Y"}, 99)
+    assert ids(vlist) == ["A", "X", "B", "Y"]
+
+
+def test_upsert_without_index_replaces_in_place_or_appends():
+    vlist = make("A", "B")
+    vlist.upsert({"id": "A", "v": 2})
+    vlist.upsert({"id": "C"})
+    assert ids(vlist) == ["A", "B", "C"]
+    assert vlist.get("A")["v"] == 2
+
+
+def test_positions_follow_every_change():
+    vlist = make("A", "B", "C", "D")
+    vlist.upsert({"id": "A"}, 3)
+    vlist.remove("C")
+    vlist.append_items([{"id": "E"}, {"id": "B"}])
+    assert ids(vlist) == ["B", "D", "A", "E"]
+    assert vlist._positions == {"B": 0, "D": 1, "A": 2, "E": 3}
+
+
+def test_remove_clears_selection_and_ignores_unknown_keys():
+    vlist = make("A", "B", "C")
+    vlist.selected_key = "B"
+    vlist.remove("B")
+    vlist.remove("missing")
+    assert ids(vlist) == ["A", "C"]
+    assert vlist.selected_key is None
+    assert vlist.selected_record() is None
+
+
+class FakePrintFrame:
+    """The parts of AdminPrintFrame that apply_job_change and paging use."""
+    job_sort_position = AdminPrintFrame.__dict__["job_sort_position"]
+    job_sorts_before = AdminPrintFrame.job_sorts_before
+    apply_job_change = AdminPrintFrame.apply_job_change
+    load_more_print_jobs = AdminPrintFrame.load_more_print_jobs
+
+    def __init__(self, jobs, has_more=False):
+        self.job_list = HeadlessList(jobs, key=lambda job: job["job_id"])
+        self.job_filters = ("", "All")
+        self.selected_job_ref = [None]
+        self.jobs_has_more = has_more
+        self.jobs_loading_more = False
+        self.submitted = []
+        self.controller = SimpleNamespace(tasks=SimpleNamespace(submit=self._submit))
+
+    def _submit(self, owner, name, fn, *args, **kwargs):
+        self.submitted.append((name, kwargs.get("after")))
+
+    def update_job_details(self, job):
+        pass
+
+    def fetch_print_jobs(self, *args, **kwargs):
+        pass
+
+    def on_more_print_jobs_loaded(self, rows):
+        pass
+
+    def on_print_jobs_error(self, err):
+        pass
+
+
+def job(job_id, status, updated_at):
+    return {"job_id": job_id, "status": status, "updated_at": updated_at, "created_at": updated_at,
+            "status_priority": STATUS_PRIORITY.get(status, 0)}
+
+
+def queue():
+    return [job(4, "Paid", "2025-01-04"), job(3, "Pending", "2025-01-03"),
+            job(2, "Pending", "2025-01-02"), job(1, "Completed", "2025-01-01")]
+
+
+def job_ids(frame):
+    return [item["job_id"] for item in frame.job_list.items]
+
+
+def test_job_moving_down_lands_in_sorted_position():
+    frame = FakePrintFrame(queue())
+    frame.apply_job_change(job(4, "Approved", "2025-01-05"))
+    assert job_ids(frame) == [3, 2, 4, 1]
+
+
+def test_job_moving_to_the_end_is_last():
+    frame = FakePrintFrame(queue())
+    frame.apply_job_change(job(4, "Completed", "2025-01-05"))
+    assert job_ids(frame) == [3, 2, 4, 1]
+    frame.apply_job_change(job(3, "Declined", "2025-01-06"))
+    assert job_ids(frame) == [2, 3, 4, 1]
+    frame.apply_job_change(job(2, "Voided", "2025-01-07"))
+    assert job_ids(frame) == [3, 4, 1, 2]
+
+
+def test_job_moving_up_lands_in_sorted_position():
+    frame = FakePrintFrame(queue())
+    frame.apply_job_change(job(1, "Paid", "2025-01-05"))
+    assert job_ids(frame) == [1, 4, 3, 2]
+
+
+def test_job_sorting_past_loaded_pages_is_dropped_until_fetched():
+    frame = FakePrintFrame(queue(), has_more=True)
+    frame.apply_job_change(job(4, "Voided", "2025-01-05"))
+    assert job_ids(frame) == [3, 2, 1]
+
+
+def test_load_more_uses_last_row_as_cursor():
+    frame = FakePrintFrame(queue(), has_more=True)
+    frame.load_more_print_jobs()
+    assert frame.submitted == [("print_jobs_page", (1, "2025-01-01", "2025-01-01", 1))]
+    frame.load_more_print_jobs()
+    assert len(frame.submitted) == 1   # already loading
+
+
+def test_load_more_stops_when_no_more_pages():
+    frame = FakePrintFrame(queue(), has_more=False)
+    frame.load_more_print_jobs()
+    assert frame.submitted == []
@@ -0,0 +1,52 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Set UI_PROFILE=1 to print how long imports, frame construction and load_* calls take.
+# UI_PROFILE_LOG=<path> also appends each timing as a CSV row (timestamp,label,ms) so runs can be compared.
+ENABLED = bool(os.getenv("UI_PROFILE") or os.getenv("UI_PROFILE_LOG"))
+LOG_PATH = os.getenv("UI_PROFILE_LOG")
+
+_lock = threading.Lock()
+_totals = {}
+
+
+#---Profile: Records Timing---
+def record(label, elapsed):
+    if not ENABLED:
+        return
+    ms = elapsed * 1000
+    with _lock:
+        count, total = _totals.get(label, (0, 0.0))
+        _totals[label] = (count + 1, total + ms)
+        print(f"[profile] {label}: {ms:.1f} ms")
+        if LOG_PATH:
+            try:
+                with open(LOG_PATH, "a", encoding="utf-8") as f:
+                    f.write(f"{datetime.now().isoformat(timespec='seconds')},{label},{ms:.1f}\n")
+            except OSError as e:
+                print(f"Could not write profile log: {e}")
+
+
+#---Profile: Times a Block---
+@contextmanager
+def timed(label):
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(label, time.perf_counter() - start)
+
+
+#---Profile: Summary---
+# Slowest labels first; printed on exit.
+def summary(limit=15):
+    with _lock:
+        rows = sorted(_totals.items(), key=lambda item: item[1][1], reverse=True)
+    lines = [f"{label}: {total:.1f} ms over {count} call(s)" for label, (count, total) in rows[:limit]]
+    return "\n".join(lines)
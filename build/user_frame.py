@@ -1,11 +1,13 @@
 from pathlib import Path
-from tkinter import Canvas, messagebox, PhotoImage, Label, Entry, Button
+from tkinter import Canvas, messagebox, Label, Entry, Button
 import tkinter as tk
 import mysql.connector
 import bcrypt
 import re
 import random
-from utils import get_db_connection, round_rectangle, send_verification_email, update_user_data_in_db
+from utils import get_db_connection, db_connection, round_rectangle, send_verification_email, update_user_data_in_db
+from image_cache import load_image
+from task_runner import run_in_background
 from tkinter import filedialog
 from PIL import Image, ImageTk, ImageDraw
 import io
@@ -81,10 +83,10 @@ class UserFrame(tk.Frame):
         self.user_id = controller.user_id
 
         try:
-            self.icon_edit = PhotoImage(file=relative_to_assets("image_13.png"))
-            self.icon_bell = PhotoImage(file=relative_to_assets("image_14.png"))
-            self.icon_sheet = PhotoImage(file=relative_to_assets("image_15.png"))
-            self.icon_help = PhotoImage(file=relative_to_assets("image_16.png"))
+            self.icon_edit = load_image(relative_to_assets("image_13.png"))
+            self.icon_bell = load_image(relative_to_assets("image_14.png"))
+            self.icon_sheet = load_image(relative_to_assets("image_15.png"))
+            self.icon_help = load_image(relative_to_assets("image_16.png"))
             self.eye_open_icon = controller.eye_image
             self.eye_closed_icon = controller.eye_slash_image
         except tk.TclError as e:
@@ -210,7 +212,30 @@ class UserFrame(tk.Frame):
             messagebox.showerror("Error", "No user logged in.")
             self.controller.show_login_frame()
             return
-        self.user_data = self.get_user_data(self.controller.user_id)
+        run_in_background(self.controller, self, "user_data", self.fetch_user_data, self.controller.user_id,
+                          on_done=self.display_user_data, on_error=self.on_user_data_error)
+
+    #---Database: Fetches User Data (runs on a worker thread)---
+    def fetch_user_data(self, user_id):
+        with db_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute(
+                    "SELECT user_id, fullname, username, email, contact, created_at, status, profile_picture "
+                    "FROM users WHERE user_id = %s", (user_id,)
+                )
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+
+    #---Handles Fetch Error---
+    def on_user_data_error(self, err):
+        messagebox.showerror("Database Error", f"Failed to get user data: {err}")
+        self.display_user_data(None)
+
+    #---Displays User Data---
+    def display_user_data(self, user_data):
+        self.user_data = user_data
         if self.user_data:
             self.controller.fullname = self.user_data.get('fullname', '')
             for key, entry in self.entries.items():
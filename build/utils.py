@@ -1,29 +1,32 @@
 import mysql.connector
 from tkinter import messagebox, Canvas
-import os
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
 import bcrypt
+from contextlib import contextmanager
 
 load_dotenv()
 
+from db_pool import get_pool
+
 
 #---Database: Get Connection---
+# Borrows a warm connection from the shared pool; calling close() on it returns it to the pool.
 def get_db_connection():
     try:
-        return mysql.connector.connect(
-            host=os.getenv("DB_HOST", "localhost"),
-            user=os.getenv("DB_USER", "root"),
-            password=os.getenv("DB_PASS", ""),
-            database=os.getenv("DB_NAME", "copy_corner_db")
-        )
+        return get_pool().acquire()
     except mysql.connector.Error as err:
         messagebox.showerror("Database Error", f"Failed to connect to database: {err}")
         return None
 
 
+#---Database: Pooled Connection Context---
+# Usage: with db_connection() as conn: ...  (rolls back on error, always returns the connection)
+@contextmanager
+def db_connection():
+    with get_pool().connection() as conn:
+        yield conn
+
+
 #---UI: Create Rounded Rectangle---
 def round_rectangle(canvas: Canvas, x1: float, y1: float, x2: float, y2: float, r: int = 15, **kwargs):
     points = [
@@ -36,12 +39,11 @@ def round_rectangle(canvas: Canvas, x1: float, y1: float, x2: float, y2: float,
 
 #---Email: Send OTP---
 def send_verification_email(user_email, otp_code, email_subject="Email Verification", context="verify"):
-    sender_email = os.getenv("EMAIL_USER")
-    app_password = os.getenv("EMAIL_PASS")
+    import mail_queue
 
-    if not sender_email or not app_password:
+    if not mail_queue.sender_address():
         messagebox.showerror("Configuration Error",
-                             "Email credentials not found in .env file (EMAIL_USER, EMAIL_PASS).")
+                             "Email sender not found in .env file (EMAIL_USER or MAIL_FROM).")
         return False
 
     if context == "reset":
@@ -76,21 +78,12 @@ def send_verification_email(user_email, otp_code, email_subject="Email Verificat
         </body>
         </html>
         """
-    message = MIMEMultipart("alternative")
-    message["From"] = sender_email
-    message["To"] = user_email
-    message["Subject"] = email_subject
-    message.attach(MIMEText(html_body, "html"))
-
+    # Handed to the mail worker, which stores and delivers it ahead of any bulk mail; nothing here
+    # touches the database, so the Tk thread does not wait on it.
     try:
-        server = smtplib.SMTP("smtp.gmail.com", 587)
-        server.starttls()
-        server.login(sender_email, app_password)
-        server.sendmail(sender_email, user_email, message.as_string())
-        server.quit()
-        return True
+        return mail_queue.submit(user_email, email_subject, html_body, priority=mail_queue.PRIORITY_OTP)
     except Exception as e:
-        print("Error sending email:", e)
+        print("Error queueing email:", e)
         messagebox.showerror("Email Error", f"Could not send email.\n\nError: {e}")
         return False
 
@@ -0,0 +1,329 @@
+import tkinter as tk
+from tkinter import Canvas, Frame, Label, ttk
+
+
+#---UI: Pooled Row---
+class _PooledRow:
+    def __init__(self, frame, labels, window_id):
+        self.frame = frame
+        self.labels = labels
+        self.window_id = window_id
+        self.index = None
+        self.texts = None
+        self.color = None
+
+
+#---UI: Virtualized List---
+class VirtualList(tk.Frame):
+    """Scrollable list that only builds widgets for the rows on screen.
+
+    A fixed pool of row frames is created once and repositioned as the list scrolls, so
+    widget and binding counts depend on the viewport height, not on the number of records.
+    Re-rendering only touches labels whose text changed, which makes refreshes cheap.
+    """
+
+    #---Initializes List UI---
+    def __init__(self, parent, columns, render, key, row_height=24, on_select=None, on_load_more=None,
+                 empty_text="No items found.", font=("Inter", 10), fg="#333333", bg="#FFFFFF",
+                 alt_bg="#F8F9FA", hover_bg="#E0F0FF", select_bg="#CCE5FF", load_more_margin=10):
+        super().__init__(parent, bg=bg, bd=0)
+        self.columns = columns
+        self.render = render
+        self.key = key
+        self.row_height = row_height
+        self.on_select = on_select
+        self.on_load_more = on_load_more
+        self.font = font
+        self.fg = fg
+        self.bg = bg
+        self.alt_bg = alt_bg
+        self.hover_bg = hover_bg
+        self.select_bg = select_bg
+        self.load_more_margin = load_more_margin
+
+        self.items = []
+        self._positions = {}
+        self.selected_key = None
+        self._hover_key = None
+        self._pool = []
+        self._layout_pending = False
+
+        self.canvas = Canvas(self, bg=bg, bd=0, highlightthickness=0, takefocus=1, yscrollincrement=row_height)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.empty_label = Label(self.canvas, text=empty_text, font=("Inter Italic", 11), bg=bg, fg="#888888")
+        self.empty_window = self.canvas.create_window(0, 20, window=self.empty_label, anchor="nw", state="hidden")
+
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self.canvas.bind("<Enter>", self._bind_mousewheel)
+        self.canvas.bind("<Leave>", self._unbind_mousewheel)
+        self.canvas.bind("<Up>", lambda e: self.move_selection(-1))
+        self.canvas.bind("<Down>", lambda e: self.move_selection(1))
+
+    #---Sets All Records---
+    # Keeps the scroll position and selection when the same records come back, so a refresh is a diff.
+    def set_items(self, items, reset_scroll=False):
+        self.items = list(items)
+        self._reindex()
+        if self.selected_key is not None and self.selected_key not in self._positions:
+            self.selected_key = None
+        if reset_scroll:
+            self.canvas.yview_moveto(0)
+        self._update_scrollregion()
+        self._layout()
+
+    #---Appends Records---
+    def append_items(self, items):
+        start = len(self.items)
+        for record in items:
+            record_key = self.key(record)
+            if record_key in self._positions:
+                continue
+            self._positions[record_key] = start
+            self.items.append(record)
+            start += 1
+        self._update_scrollregion()
+        self._layout()
+
+    #---Inserts or Replaces Record---
+    # Without an index, an existing record is replaced in place and a new one is appended.
+    # index is the record's position among the other items, i.e. in the list without it.
+    def upsert(self, record, index=None):
+        record_key = self.key(record)
+        current = self._positions.get(record_key)
+        if index is None:
+            if current is not None:
+                self.items[current] = record
+            else:
+                self.items.append(record)
+        else:
+            if current is not None:
+                del self.items[current]
+            self.items.insert(max(0, min(index, len(self.items))), record)
+        self._reindex()
+        self._update_scrollregion()
+        self._layout()
+
+    #---Removes Record---
+    def remove(self, record_key):
+        current = self._positions.get(record_key)
+        if current is None:
+            return
+        del self.items[current]
+        if self.selected_key == record_key:
+            self.selected_key = None
+        self._reindex()
+        self._update_scrollregion()
+        self._layout()
+
+    #---Looks Up Record---
+    def get(self, record_key):
+        index = self._positions.get(record_key)
+        return self.items[index] if index is not None else None
+
+    #---Selected Record---
+    def selected_record(self):
+        return self.get(self.selected_key) if self.selected_key is not None else None
+
+    #---Clears Selection---
+    def clear_selection(self):
+        self.selected_key = None
+        self._layout()
+
+    #---Selects Row---
+    def select_index(self, index, notify=True):
+        if not (0 <= index < len(self.items)):
+            return
+        record = self.items[index]
+        self.selected_key = self.key(record)
+        self.see(index)
+        self._layout()
+        if notify and self.on_select:
+            self.on_select(record, index)
+
+    #---Handles Key Navigation---
+    def move_selection(self, step):
+        if not self.items:
+            return
+        current = self._positions.get(self.selected_key)
+        if current is None:
+            new_index = 0
+        else:
+            new_index = max(0, min(current + step, len(self.items) - 1))
+            if new_index == current:
+                return
+        self.select_index(new_index)
+
+    #---Scrolls Row Into View---
+    def see(self, index):
+        if not self.items:
+            return
+        total = max(len(self.items) * self.row_height, self.canvas.winfo_height(), 1)
+        top = self.canvas.canvasy(0)
+        view_h = self.canvas.winfo_height()
+        row_top = index * self.row_height
+        if row_top < top:
+            self.canvas.yview_moveto(row_top / total)
+        elif row_top + self.row_height > top + view_h:
+            self.canvas.yview_moveto(max(0, row_top + self.row_height - view_h) / total)
+
+    #---Re-renders Visible Rows---
+    def refresh(self):
+        self._layout()
+
+    #---Rebuilds Key Index---
+    def _reindex(self):
+        self._positions = {self.key(record): i for i, record in enumerate(self.items)}
+
+    #---Updates Scrollable Area---
+    def _update_scrollregion(self):
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(len(self.items) * self.row_height, self.canvas.winfo_height(), 1)
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+        self.canvas.itemconfigure(self.empty_window, state="hidden" if self.items else "normal")
+
+    #---Handles Scroll Position Change---
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if not self._layout_pending:
+            self._layout_pending = True
+            self.after_idle(self._layout)
+
+    #---Handles Resize---
+    def _on_canvas_configure(self, event):
+        needed = event.height // self.row_height + 2
+        while len(self._pool) < needed:
+            self._pool.append(self._create_row())
+        for row in self._pool:
+            self.canvas.itemconfigure(row.window_id, width=event.width)
+        self.canvas.itemconfigure(self.empty_window, width=event.width)
+        self._update_scrollregion()
+        self._layout()
+
+    #---Creates Pooled Row---
+    def _create_row(self):
+        frame = Frame(self.canvas, bg=self.bg, height=self.row_height)
+        frame.grid_propagate(False)
+        frame.rowconfigure(0, weight=1)
+        labels = []
+        for col, column in enumerate(self.columns):
+            frame.columnconfigure(col, minsize=column.get("minsize", 0), weight=column.get("weight", 0))
+            lbl = Label(frame, text="", font=column.get("font", self.font), bg=self.bg, fg=self.fg,
+                        anchor=column.get("anchor", "w"), justify=column.get("justify", "left"))
+            lbl.grid(row=0, column=col, sticky="nsew", padx=column.get("padx", (0, 0)))
+            labels.append(lbl)
+
+        window_id = self.canvas.create_window(0, 0, window=frame, anchor="nw", state="hidden",
+                                              width=max(self.canvas.winfo_width(), 1), height=self.row_height)
+        row = _PooledRow(frame, labels, window_id)
+        for widget in [frame] + labels:
+            widget.bind("<Enter>", lambda e, r=row: self._on_row_enter(e, r))
+            widget.bind("<Leave>", lambda e, r=row: self._on_row_leave(e, r))
+            widget.bind("<Button-1>", lambda e, r=row: self._on_row_click(r))
+        return row
+
+    #---Positions Pooled Rows---
+    def _layout(self):
+        self._layout_pending = False
+        if not self._pool:
+            return
+        first = max(0, int(self.canvas.canvasy(0) // self.row_height))
+        for offset, row in enumerate(self._pool):
+            index = first + offset
+            if index >= len(self.items):
+                if row.index is not None:
+                    self.canvas.itemconfigure(row.window_id, state="hidden")
+                    row.index = None
+                continue
+            if row.index != index:
+                self.canvas.coords(row.window_id, 0, index * self.row_height)
+                if row.index is None:
+                    self.canvas.itemconfigure(row.window_id, state="normal")
+                row.index = index
+            self._fill_row(row, self.items[index], index)
+
+        last_visible = first + len(self._pool)
+        if self.on_load_more and self.items and last_visible >= len(self.items) - self.load_more_margin:
+            self.on_load_more()
+
+    #---Fills Row Content---
+    def _fill_row(self, row, record, index):
+        texts = self.render(record)
+        if texts != row.texts:
+            for lbl, cell in zip(row.labels, texts):
+                if isinstance(cell, tuple):
+                    lbl.config(text=cell[0], fg=cell[1])
+                else:
+                    lbl.config(text=cell, fg=self.fg)
+            row.texts = texts
+        self._paint_row(row, self._row_color(record, index))
+
+    #---Row Background Color---
+    def _row_color(self, record, index):
+        record_key = self.key(record)
+        if record_key == self.selected_key:
+            return self.select_bg
+        if record_key == self._hover_key:
+            return self.hover_bg
+        return self.bg if index % 2 == 0 else self.alt_bg
+
+    #---Sets Row Color---
+    def _paint_row(self, row, color):
+        if row.color == color:
+            return
+        row.frame.config(bg=color)
+        for lbl in row.labels:
+            lbl.config(bg=color)
+        row.color = color
+
+    #---Handles Row Hover---
+    def _on_row_enter(self, event, row):
+        self._bind_mousewheel(event)
+        if row.index is None or row.index >= len(self.items):
+            return
+        record = self.items[row.index]
+        self._hover_key = self.key(record)
+        self._paint_row(row, self._row_color(record, row.index))
+        self.config(cursor="hand2")
+
+    #---Handles Row Leave---
+    def _on_row_leave(self, event, row):
+        self._unbind_mousewheel(event)
+        self._hover_key = None
+        if row.index is not None and row.index < len(self.items):
+            self._paint_row(row, self._row_color(self.items[row.index], row.index))
+        self.config(cursor="")
+
+    #---Handles Row Click---
+    def _on_row_click(self, row):
+        self.canvas.focus_set()
+        if row.index is not None:
+            self.select_index(row.index)
+
+    #---Handles Mouse Scroll---
+    def _on_mousewheel(self, event):
+        scroll_info = self.canvas.yview()
+        if scroll_info[0] == 0.0 and scroll_info[1] == 1.0:
+            return
+
+        if event.delta > 0 or event.num == 4:
+            if scroll_info[0] > 0.0:
+                self.canvas.yview_scroll(-1, "units")
+        elif event.delta < 0 or event.num == 5:
+            if scroll_info[1] < 1.0:
+                self.canvas.yview_scroll(1, "units")
+
+    #---Binds Mouse Scroll---
+    def _bind_mousewheel(self, event):
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
+
+    #---Unbinds Mouse Scroll---
+    def _unbind_mousewheel(self, event):
+        self.canvas.unbind_all("<MouseWheel>")
+        self.canvas.unbind_all("<Button-4>")
+        self.canvas.unbind_all("<Button-5>")